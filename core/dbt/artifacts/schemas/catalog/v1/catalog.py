@@ -1,14 +1,18 @@
-from dataclasses import dataclass, field
+import json
+import os
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, TextIO, Union
 
 from dbt.artifacts.schemas.base import (
     ArtifactMixin,
     BaseArtifactMetadata,
     schema_version,
 )
+from dbt_common.clients.system import convert_path, make_directory
 from dbt_common.contracts.metadata import CatalogTable
 from dbt_common.dataclass_schema import dbtClassMixin
+from dbt_common.utils.encoding import JSONEncoder
 
 Primitive = Union[bool, str, float, None]
 PrimitiveDict = Dict[str, Primitive]
@@ -57,3 +61,38 @@ class CatalogArtifact(CatalogResults, ArtifactMixin):
             errors=errors,
             _compile_results=compile_results,
         )
+
+    def write(self, path: str):
+        # Serialize one table at a time instead of the whole catalog to a dict
+        # first: the catalog of a large warehouse can have millions of columns.
+        # The output is the same as json.dump of to_dict.
+        dct = replace(self, nodes={}, sources={}).to_dict(
+            omit_none=False, context={"artifact": True}
+        )
+        path = convert_path(path)
+        make_directory(os.path.dirname(path))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{")
+            for i, (key, value) in enumerate(dct.items()):
+                if i:
+                    f.write(", ")
+                f.write(json.dumps(key) + ": ")
+                if key in ("nodes", "sources"):
+                    self._write_tables(f, getattr(self, key))
+                else:
+                    f.write(json.dumps(value, cls=JSONEncoder))
+            f.write("}")
+
+    @staticmethod
+    def _write_tables(f: TextIO, tables: Dict[str, CatalogTable]) -> None:
+        f.write("{")
+        for i, (unique_id, table) in enumerate(tables.items()):
+            if i:
+                f.write(", ")
+            f.write(json.dumps(unique_id) + ": ")
+            f.write(
+                json.dumps(
+                    table.to_dict(omit_none=False, context={"artifact": True}), cls=JSONEncoder
+                )
+            )
+        f.write("}")
@@ -1,7 +1,7 @@
 import functools
 from copy import copy
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import click
 from click.exceptions import BadOptionUsage
@@ -50,13 +50,16 @@ class dbtRunner:
             callbacks = []
         self.callbacks = callbacks
 
+    def _context_obj(self) -> Dict[str, Any]:
+        return {
+            "manifest": self.manifest,
+            "callbacks": self.callbacks,
+        }
+
     def invoke(self, args: List[str], **kwargs) -> dbtRunnerResult:
         try:
             dbt_ctx = cli.make_context(cli.name, args.copy())
-            dbt_ctx.obj = {
-                "manifest": self.manifest,
-                "callbacks": self.callbacks,
-            }
+            dbt_ctx.obj = self._context_obj()
 
             for key, value in kwargs.items():
                 dbt_ctx.params[key] = value
@@ -118,14 +121,17 @@ def global_flags(func):
     @p.log_level_file
     @p.log_path
     @p.macro_debugging
+    @p.parse_workers
     @p.partial_parse
     @p.partial_parse_file_path
     @p.partial_parse_file_diff
+    @p.partial_parse_verify_checksums
     @p.populate_cache
     @p.print
     @p.printer_width
     @p.profile
     @p.quiet
+    @p.read_files_threads
     @p.record_timing_info
     @p.send_anonymous_usage_stats
     @p.single_threaded
@@ -133,6 +139,7 @@ def global_flags(func):
     @p.state
     @p.static_parser
     @p.target
+    @p.trace_file
     @p.use_colors
     @p.use_colors_file
     @p.use_experimental_parser
@@ -141,7 +148,9 @@ def global_flags(func):
     @p.warn_error
     @p.warn_error_options
     @p.write_json
+    @p.write_graph_file
     @p.use_fast_test_edges
+    @p.use_compact_graph_queue
     @p.upload_artifacts
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -170,6 +179,7 @@ def cli(ctx, **kwargs):
 @cli.command("build")
 @click.pass_context
 @global_flags
+@p.data_test_batching
 @p.empty
 @p.event_time_start
 @p.event_time_end
@@ -182,12 +192,14 @@ def cli(ctx, **kwargs):
 @p.resource_type
 @p.exclude_resource_type
 @p.sample
+@p.scheduling_priority
 @p.select
 @p.selector
 @p.show
 @p.store_failures
 @p.target_path
 @p.threads
+@p.unit_test_batching
 @p.vars
 @requires.postflight
 @requires.preflight
@@ -253,6 +265,7 @@ def docs(ctx, **kwargs):
 @p.select
 @p.selector
 @p.empty_catalog
+@p.incremental_catalog
 @p.static
 @p.target_path
 @p.threads
@@ -432,6 +445,8 @@ def debug(ctx, **kwargs):
 @p.lock
 @p.upgrade
 @p.add_package
+@p.deps_threads
+@p.packages_cache_dir
 @requires.postflight
 @requires.preflight
 @requires.unset_profile
@@ -560,6 +575,7 @@ def parse(ctx, **kwargs):
 @p.event_time_start
 @p.event_time_end
 @p.sample
+@p.scheduling_priority
 @p.select
 @p.selector
 @p.target_path
@@ -693,6 +709,7 @@ def run_operation(ctx, **kwargs):
 @p.full_refresh
 @p.profiles_dir
 @p.project_dir
+@p.scheduling_priority
 @p.select
 @p.selector
 @p.show
@@ -727,6 +744,7 @@ def seed(ctx, **kwargs):
 @p.exclude
 @p.profiles_dir
 @p.project_dir
+@p.scheduling_priority
 @p.select
 @p.selector
 @p.target_path
@@ -805,16 +823,19 @@ cli.commands["source"].add_command(snapshot_freshness, "snapshot-freshness")  #
 @cli.command("test")
 @click.pass_context
 @global_flags
+@p.data_test_batching
 @p.exclude
 @p.resource_type
 @p.exclude_resource_type
 @p.profiles_dir
 @p.project_dir
+@p.scheduling_priority
 @p.select
 @p.selector
 @p.store_failures
 @p.target_path
 @p.threads
+@p.unit_test_batching
 @p.vars
 @requires.postflight
 @requires.preflight
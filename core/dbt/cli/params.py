@@ -80,6 +80,13 @@ config_dir = click.option(
     is_flag=True,
 )
 
+data_test_batching = click.option(
+    "--data-test-batching/--no-data-test-batching",
+    envvar="DBT_DATA_TEST_BATCHING",
+    help="Experimental: run the generic tests of each model in a single query, where they don't store failures and only depend on that model.",
+    default=False,
+)
+
 debug = click.option(
     "--debug/--no-debug",
     "-d/ ",
@@ -167,6 +174,15 @@ empty = click.option(
     is_flag=True,
 )
 
+deps_threads = click.option(
+    "--threads",
+    "deps_threads",
+    envvar="DBT_DEPS_THREADS",
+    help="The number of packages to resolve and install concurrently. Packages are installed one at a time unless this is greater than 1.",
+    default=None,
+    type=click.INT,
+)
+
 empty_catalog = click.option(
     "--empty-catalog",
     help="If specified, generate empty catalog.json file during the `dbt docs generate` command.",
@@ -263,6 +279,13 @@ host = click.option(
     default="127.0.0.1",
 )
 
+incremental_catalog = click.option(
+    "--incremental-catalog/--no-incremental-catalog",
+    envvar="DBT_INCREMENTAL_CATALOG",
+    help="Experimental: during `dbt docs generate`, reuse the previous catalog.json and only query the relations that are new, were built by the latest run, or are state:modified.",
+    default=False,
+)
+
 indirect_selection = click.option(
     "--indirect-selection",
     envvar="DBT_INDIRECT_SELECTION",
@@ -392,6 +415,22 @@ output_path = click.option(
     default=None,
 )
 
+parse_workers = click.option(
+    "--parse-workers",
+    envvar="DBT_PARSE_WORKERS",
+    help="Experimental: the number of processes to use for rendering model, snapshot, seed, analysis, test and doc files during a full parse. Parsing is serial unless this is greater than 1.",
+    default=None,
+    type=click.INT,
+)
+
+packages_cache_dir = click.option(
+    "--packages-cache-dir",
+    envvar="DBT_PACKAGES_CACHE_DIR",
+    help="A directory to cache installed packages in, keyed by their exact version or git commit. Cached packages are installed from it without going to the network.",
+    default=None,
+    type=click.Path(file_okay=False),
+)
+
 partial_parse = click.option(
     "--partial-parse/--no-partial-parse",
     envvar="DBT_PARTIAL_PARSE",
@@ -416,6 +455,13 @@ partial_parse_file_path = click.option(
     type=click.Path(exists=True, dir_okay=False, resolve_path=True),
 )
 
+partial_parse_verify_checksums = click.option(
+    "--partial-parse-verify-checksums/--no-partial-parse-verify-checksums",
+    envvar="DBT_PARTIAL_PARSE_VERIFY_CHECKSUMS",
+    help="Read and hash every project file when partially parsing, instead of trusting that files with an unchanged size, modification time and inode are unchanged.",
+    default=False,
+)
+
 print = click.option(
     "--print/--no-print",
     envvar="DBT_PRINT",
@@ -486,6 +532,14 @@ quiet = click.option(
     help="Suppress all non-error logging to stdout. Does not affect {{ print() }} macro calls.",
 )
 
+read_files_threads = click.option(
+    "--read-files-threads",
+    envvar="DBT_READ_FILES_THREADS",
+    help="Experimental: the number of threads to use for finding and reading project files before parsing. Files are read serially unless this is greater than 1.",
+    default=None,
+    type=click.INT,
+)
+
 raw_select = click.option(*select_decls, **select_attrs)  # type: ignore[arg-type]
 
 record_timing_info = click.option(
@@ -533,6 +587,14 @@ sample = click.option(
     hidden=True,  # TODO: Unhide
 )
 
+scheduling_priority = click.option(
+    "--scheduling-priority",
+    envvar="DBT_SCHEDULING_PRIORITY",
+    help="Choose the order in which ready nodes are run. 'depth' runs nodes closest to the root of the DAG first. 'critical_path' runs the nodes with the longest chain of downstream work first, using execution times from the run_results.json in the --state directory, and falls back to depth without it.",
+    type=click.Choice(["depth", "critical_path"], case_sensitive=False),
+    default="depth",
+)
+
 # `--select` and `--models` are analogous for most commands except `dbt list` for legacy reasons.
 # Most CLI arguments should use the combined `select` option that aliases `--models` to `--select`.
 # However, if you need to split out these separators (like `dbt ls`), use the `models` and `raw_select` options instead.
@@ -675,6 +737,21 @@ threads = click.option(
     type=click.INT,
 )
 
+trace_file = click.option(
+    "--trace-file",
+    envvar="DBT_TRACE_FILE",
+    help="Write the wall time, CPU time and memory use of each phase of the invocation to this file, as Chrome trace-event JSON. Open it in chrome://tracing or https://ui.perfetto.dev.",
+    type=click.Path(exists=False),
+)
+
+unit_test_batching = click.option(
+    "--unit-test-batching",
+    envvar="DBT_UNIT_TEST_BATCHING",
+    help="Experimental: share one compiled unit test manifest between the unit tests of each model ('model'), and also compare them in a single UNION ALL query per model where possible ('query').",
+    type=click.Choice(["none", "model", "query"], case_sensitive=False),
+    default="none",
+)
+
 upgrade = click.option(
     "--upgrade",
     envvar=None,
@@ -696,6 +773,13 @@ use_colors_file = click.option(
     default=True,
 )
 
+use_compact_graph_queue = click.option(
+    "--use-compact-graph-queue/--no-use-compact-graph-queue",
+    envvar="DBT_USE_COMPACT_GRAPH_QUEUE",
+    default=False,
+    hidden=True,
+)
+
 use_experimental_parser = click.option(
     "--use-experimental-parser/--no-use-experimental-parser",
     envvar="DBT_USE_EXPERIMENTAL_PARSER",
@@ -770,6 +854,13 @@ write_json = click.option(
     default=True,
 )
 
+write_graph_file = click.option(
+    "--write-graph-file/--no-write-graph-file",
+    envvar="DBT_WRITE_GRAPH_FILE",
+    help="Whether or not to also write graph.gpickle, the graph with every node serialized, to the target directory",
+    default=False,
+)
+
 upload_artifacts = click.option(
     "--upload-to-artifacts-ingest-api/--no-upload-to-artifacts-ingest-api",
     envvar="DBT_UPLOAD_TO_ARTIFACTS_INGEST_API",
@@ -34,6 +34,7 @@ from dbt.mp_context import get_mp_context
 from dbt.parser.manifest import parse_manifest
 from dbt.plugins import set_up_plugin_manager
 from dbt.profiler import profiler
+from dbt.tracing import phase, tracing
 from dbt.tracking import active_user, initialize_from_flags, track_run
 from dbt.utils import try_get_max_rss_kb
 from dbt.utils.artifact_upload import upload_artifacts
@@ -105,6 +106,10 @@ def preflight(func):
         if flags.RECORD_TIMING_INFO:
             ctx.with_resource(profiler(enable=True, outfile=flags.RECORD_TIMING_INFO))
 
+        # Phase tracing
+        if flags.TRACE_FILE:
+            ctx.with_resource(tracing(flags.TRACE_FILE))
+
         # Adapter management
         ctx.with_resource(adapter_management())
 
@@ -248,7 +253,10 @@ def profile(func):
         # TODO: Generalize safe access to flags.THREADS:
         # https://github.com/dbt-labs/dbt-core/issues/6259
         threads = getattr(flags, "THREADS", None)
-        profile = load_profile(flags.PROJECT_DIR, flags.VARS, flags.PROFILE, flags.TARGET, threads)
+        with phase("load profile"):
+            profile = load_profile(
+                flags.PROJECT_DIR, flags.VARS, flags.PROFILE, flags.TARGET, threads
+            )
         ctx.obj["profile"] = profile
 
         return func(*args, **kwargs)
@@ -269,9 +277,14 @@ def project(func):
         flags = ctx.obj["flags"]
         # TODO deprecations warnings fired from loading the project will lack
         # the project_id in the snowplow event.
-        project = load_project(
-            flags.PROJECT_DIR, flags.VERSION_CHECK, ctx.obj["profile"], flags.VARS, validate=True
-        )
+        with phase("load project"):
+            project = load_project(
+                flags.PROJECT_DIR,
+                flags.VERSION_CHECK,
+                ctx.obj["profile"],
+                flags.VARS,
+                validate=True,
+            )
         ctx.obj["project"] = project
 
         # Plugins
@@ -302,11 +315,12 @@ def runtime_config(func):
         if None in reqs:
             raise DbtProjectError("profile and project required for runtime_config")
 
-        config = RuntimeConfig.from_parts(
-            ctx.obj["project"],
-            ctx.obj["profile"],
-            ctx.obj["flags"],
-        )
+        with phase("load runtime config"):
+            config = RuntimeConfig.from_parts(
+                ctx.obj["project"],
+                ctx.obj["profile"],
+                ctx.obj["flags"],
+            )
 
         ctx.obj["runtime_config"] = config
 
@@ -396,11 +410,16 @@ def setup_manifest(ctx: Context, write: bool = True, write_perf_info: bool = Fal
     # if a manifest has already been set on the context, don't overwrite it
     if ctx.obj.get("manifest") is None:
         ctx.obj["manifest"] = parse_manifest(
-            runtime_config, write_perf_info, write, ctx.obj["flags"].write_json
+            runtime_config,
+            write_perf_info,
+            write,
+            ctx.obj["flags"].write_json,
+            file_diff=ctx.obj.get("file_diff"),
         )
         adapter = get_adapter(runtime_config)
     else:
-        register_adapter(runtime_config, get_mp_context())
+        with phase("register adapter"):
+            register_adapter(runtime_config, get_mp_context())
         adapter = get_adapter(runtime_config)
         adapter.set_macro_context_generator(generate_runtime_macro_context)  # type: ignore[arg-type]
         adapter.set_macro_resolver(ctx.obj["manifest"])
@@ -0,0 +1,399 @@
+"""A long-lived process that keeps a parsed manifest warm and serves dbt
+commands over a local socket.
+
+Every `dbtRunner.invoke` that isn't given a manifest parses the project, which
+dominates the run time of short invocations such as `dbt ls` or compiling a
+single model. The manifest server parses once at startup, then watches the
+project for changed files and re-parses only those, by feeding a FileDiff to
+ReadFilesFromDiff. Requests are run by a dbtRunner that is handed the warm
+manifest.
+
+The protocol is one JSON object per line. A request is
+`{"args": ["run", "--select", "my_model"]}` and the response is
+`{"success": true, "result": ..., "exception": null}`.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import click
+
+from dbt.artifacts.schemas.run import RunExecutionResult
+from dbt.cli.main import dbtRunner, dbtRunnerResult
+from dbt.config.project import load_raw_project
+from dbt.constants import (
+    DBT_PROJECT_FILE_NAME,
+    DEPENDENCIES_FILE_NAME,
+    PACKAGE_LOCK_FILE_NAME,
+    PACKAGES_FILE_NAME,
+)
+from dbt.contracts.graph.manifest import Manifest
+from dbt.exceptions import DbtRuntimeError
+from dbt.parser.read_files import FileDiff, InputFile
+from dbt_common.events.base_types import EventMsg
+
+# The commands the server will run.
+SERVED_COMMANDS = frozenset({"compile", "list", "ls", "run"})
+
+# Commands that don't change the manifest, so can be given the warm manifest
+# itself rather than a copy of it.
+READ_ONLY_COMMANDS = frozenset({"list", "ls"})
+
+# Options that the manifest depends on. They are set when the server starts
+# and can't be changed per request.
+SERVER_OPTIONS = frozenset(
+    {"--project-dir", "--profiles-dir", "--profile", "--target", "-t", "--vars"}
+)
+
+# Changes to these files can change the project config or its dependencies, so
+# they require a full re-parse rather than a partial parse of the changed files.
+PROJECT_CONFIG_FILES = frozenset(
+    {
+        DBT_PROJECT_FILE_NAME,
+        PACKAGES_FILE_NAME,
+        DEPENDENCIES_FILE_NAME,
+        PACKAGE_LOCK_FILE_NAME,
+        "profiles.yml",
+        "selectors.yml",
+    }
+)
+
+# Extensions of files that dbt parses
+WATCHED_EXTENSIONS = frozenset({".sql", ".py", ".yml", ".yaml", ".csv", ".md"})
+
+DEFAULT_IGNORED_DIRS = frozenset({"target", "dbt_packages", "dbt_modules", "logs"})
+
+
+@dataclass
+class ProjectChanges:
+    file_diff: FileDiff
+    # Set when a file which affects more than its own nodes changed
+    requires_full_parse: bool = False
+
+    def __bool__(self) -> bool:
+        return self.requires_full_parse or bool(
+            self.file_diff.added or self.file_diff.changed or self.file_diff.deleted
+        )
+
+
+@dataclass
+class ProjectWatcher:
+    """Detects files that were added, changed or deleted in a project between
+    calls to `poll`, by comparing modification times.
+    """
+
+    project_root: str
+    ignored_dirs: Set[str] = field(default_factory=lambda: set(DEFAULT_IGNORED_DIRS))
+    _mtimes: Dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._mtimes = self._scan()
+
+    @classmethod
+    def for_project(cls, project_root: str) -> "ProjectWatcher":
+        ignored_dirs = set(DEFAULT_IGNORED_DIRS)
+        project_dict = load_raw_project(project_root)
+        for key in ("target-path", "packages-install-path", "log-path"):
+            if isinstance(project_dict.get(key), str):
+                ignored_dirs.add(os.path.normpath(project_dict[key]))
+        return cls(project_root=project_root, ignored_dirs=ignored_dirs)
+
+    def _scan(self) -> Dict[str, float]:
+        mtimes: Dict[str, float] = {}
+        for root, dirs, files in os.walk(self.project_root):
+            rel_root = os.path.relpath(root, self.project_root)
+            dirs[:] = [
+                d
+                for d in dirs
+                if not d.startswith(".")
+                and os.path.normpath(os.path.join(rel_root, d)) not in self.ignored_dirs
+            ]
+            for file_name in files:
+                if os.path.splitext(file_name)[1] not in WATCHED_EXTENSIONS:
+                    continue
+                path = os.path.join(root, file_name)
+                try:
+                    mtime = os.stat(path).st_mtime
+                except FileNotFoundError:
+                    continue
+                rel_path = os.path.normpath(os.path.join(rel_root, file_name))
+                mtimes[rel_path.replace(os.sep, "/")] = mtime
+        return mtimes
+
+    def _input_file(self, rel_path: str, mtime: float) -> InputFile:
+        with open(os.path.join(self.project_root, rel_path), encoding="utf-8") as fp:
+            content = fp.read()
+        return InputFile(path=rel_path, content=content, modification_time=mtime)
+
+    def poll(self) -> ProjectChanges:
+        mtimes = self._scan()
+        previous = self._mtimes
+
+        deleted = sorted(set(previous) - set(mtimes))
+        added = sorted(set(mtimes) - set(previous))
+        changed = sorted(
+            path for path, mtime in mtimes.items() if path in previous and previous[path] != mtime
+        )
+        requires_full_parse = any(
+            path in PROJECT_CONFIG_FILES for path in deleted + added + changed
+        )
+        try:
+            file_diff = FileDiff(
+                deleted=deleted,
+                changed=[self._input_file(path, mtimes[path]) for path in changed],
+                added=[self._input_file(path, mtimes[path]) for path in added],
+            )
+        except (OSError, UnicodeDecodeError):
+            # A file was removed since the scan, or can't be decoded. A full
+            # parse reads whatever is on disk, so it is left to report the error.
+            file_diff = FileDiff(deleted=[], changed=[], added=[])
+            requires_full_parse = True
+            mtimes = {
+                path: mtime
+                for path, mtime in mtimes.items()
+                if os.path.exists(os.path.join(self.project_root, path))
+            }
+
+        self._mtimes = mtimes
+        return ProjectChanges(file_diff=file_diff, requires_full_parse=requires_full_parse)
+
+
+class _ParseRunner(dbtRunner):
+    """A dbtRunner that passes a file diff through to the manifest loader, so
+    that only the files in the diff are read from disk.
+    """
+
+    def __init__(
+        self,
+        file_diff: Optional[FileDiff],
+        callbacks: Optional[List[Callable[[EventMsg], None]]] = None,
+    ) -> None:
+        super().__init__(callbacks=callbacks)
+        self.file_diff = file_diff
+
+    def _context_obj(self) -> Dict[str, Any]:
+        context_obj = super()._context_obj()
+        context_obj["file_diff"] = self.file_diff
+        return context_obj
+
+
+def serialize_result(result: dbtRunnerResult) -> Dict[str, Any]:
+    """Convert the result of an invocation into something that can be sent as JSON."""
+    serialized: Any = None
+    if isinstance(result.result, RunExecutionResult):
+        serialized = {
+            "elapsed_time": result.result.elapsed_time,
+            "results": [
+                {
+                    "unique_id": run_result.node.unique_id,
+                    "compiled_code": getattr(run_result.node, "compiled_code", None),
+                    **run_result.to_msg_dict(),
+                }
+                for run_result in result.result.results
+            ],
+        }
+    elif isinstance(result.result, (bool, list)):
+        serialized = result.result
+
+    return {
+        "success": result.success,
+        "result": serialized,
+        "exception": str(result.exception) if result.exception is not None else None,
+    }
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise DbtRuntimeError(
+            f"Cannot serve on {socket_path}: the path exists and is not a socket"
+        )
+    os.remove(socket_path)
+
+
+def _error_response(message: str) -> Dict[str, Any]:
+    return {"success": False, "result": None, "exception": message}
+
+
+class ManifestServer:
+    """Keeps a parsed manifest for a project and runs dbt commands against it.
+
+    `server_args` are passed to every invocation, e.g. `--project-dir` and
+    `--target`. Invocations are run one at a time.
+    """
+
+    def __init__(
+        self,
+        project_dir: str,
+        server_args: Optional[List[str]] = None,
+        watch_interval: float = 1.0,
+        callbacks: Optional[List[Callable[[EventMsg], None]]] = None,
+    ) -> None:
+        self.project_dir = os.path.abspath(project_dir)
+        self.server_args = ["--project-dir", self.project_dir, *(server_args or [])]
+        self.watch_interval = watch_interval
+        self.callbacks = callbacks or []
+        self.manifest: Optional[Manifest] = None
+        self.watcher: Optional[ProjectWatcher] = None
+        self.lock = threading.Lock()
+        # Parsing a file diff builds on the partial parse file written by the
+        # previous parse, so it is only possible when that parse succeeded
+        # and partial parsing is enabled.
+        self._diff_parse_enabled = "--no-partial-parse" not in self.server_args
+        self._needs_full_parse = True
+        self._stopped = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Parse the project and start watching it for changes."""
+        with self.lock:
+            self.watcher = ProjectWatcher.for_project(self.project_dir)
+            self._parse(file_diff=None)
+        self._watch_thread = threading.Thread(
+            target=self._watch, name="manifest-server-watcher", daemon=True
+        )
+        self._watch_thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join()
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.watch_interval):
+            with self.lock:
+                self.refresh()
+
+    def _parse(self, file_diff: Optional[FileDiff]) -> None:
+        result = _ParseRunner(file_diff, callbacks=self.callbacks).invoke(
+            ["parse", *self.server_args]
+        )
+        if not result.success:
+            # Keep serving the last good manifest; the next change will retry.
+            if self.manifest is None:
+                raise DbtRuntimeError(f"Could not parse the project: {result.exception}")
+            self._needs_full_parse = True
+            return
+        self.manifest = result.result
+        self._needs_full_parse = not self._diff_parse_enabled
+
+    def refresh(self) -> None:
+        """Re-parse the project if any files changed since the last refresh.
+
+        Callers must hold the lock.
+        """
+        assert self.watcher is not None, "ManifestServer.start must be called first"
+        changes = self.watcher.poll()
+        if not changes:
+            return
+        if changes.requires_full_parse or self._needs_full_parse:
+            self._parse(file_diff=None)
+        else:
+            self._parse(file_diff=changes.file_diff)
+
+    def _validate_args(self, args: Any) -> Optional[str]:
+        if not isinstance(args, list) or not args or not all(isinstance(a, str) for a in args):
+            return "'args' must be a non-empty list of strings"
+        if args[0] not in SERVED_COMMANDS:
+            return f"Command '{args[0]}' is not served; expected one of {sorted(SERVED_COMMANDS)}"
+        for arg in args[1:]:
+            if arg.split("=", 1)[0] in SERVER_OPTIONS:
+                return f"'{arg}' is set when the server starts and can't be changed per request"
+        return None
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        args = request.get("args")
+        error = self._validate_args(args)
+        if error is not None:
+            return _error_response(error)
+
+        with self.lock:
+            self.refresh()
+            # Running nodes compiles them in place in the manifest, so commands
+            # that run nodes get a copy to keep the warm manifest pristine.
+            manifest = self.manifest if args[0] in READ_ONLY_COMMANDS else deepcopy(self.manifest)
+            result = dbtRunner(manifest=manifest, callbacks=self.callbacks).invoke(
+                [*args, *self.server_args]
+            )
+        return serialize_result(result)
+
+    def serve_forever(self, socket_path: str) -> None:
+        """Listen for requests on a unix socket until interrupted."""
+        server = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    try:
+                        request = json.loads(line)
+                    except ValueError as exc:
+                        response = _error_response(f"Invalid request: {exc}")
+                    else:
+                        if isinstance(request, dict):
+                            response = server.handle_request(request)
+                        else:
+                            response = _error_response("Invalid request: expected an object")
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+                    self.wfile.flush()
+
+        _remove_stale_socket(socket_path)
+        with socketserver.UnixStreamServer(socket_path, RequestHandler) as unix_server:
+            try:
+                unix_server.serve_forever()
+            finally:
+                self.stop()
+                os.remove(socket_path)
+
+
+class ManifestServerClient:
+    """Sends requests to a ManifestServer listening on a unix socket."""
+
+    def __init__(self, socket_path: str) -> None:
+        self.socket_path = socket_path
+
+    def invoke(self, args: List[str]) -> Dict[str, Any]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            with sock.makefile("rwb") as stream:
+                stream.write(json.dumps({"args": args}).encode() + b"\n")
+                stream.flush()
+                return json.loads(stream.readline())
+
+
+@click.command(context_settings={"ignore_unknown_options": True})
+@click.option(
+    "--socket", "socket_path", required=True, help="Path of the unix socket to serve on."
+)
+@click.option("--project-dir", default=".", help="The dbt project to serve.")
+@click.option(
+    "--watch-interval",
+    default=1.0,
+    type=float,
+    help="Seconds between checks of the project for changed files.",
+)
+@click.argument("server_args", nargs=-1, type=click.UNPROCESSED)
+def main(
+    socket_path: str, project_dir: str, watch_interval: float, server_args: Tuple[str, ...]
+) -> None:
+    """Serve dbt compile, list and run requests for a project from a warm manifest.
+
+    Any extra arguments (e.g. --profiles-dir, --target) are passed to every
+    invocation.
+    """
+    server = ManifestServer(project_dir, list(server_args), watch_interval=watch_interval)
+    server.start()
+    server.serve_forever(socket_path)
+
+
+if __name__ == "__main__":
+    main()
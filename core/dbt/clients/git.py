@@ -115,6 +115,29 @@ def get_current_sha(cwd):
     return out.decode("utf-8").strip()
 
 
+def get_remote_sha(cwd, repo, revision):
+    """Return the commit a branch or tag points to in the remote repository,
+    or None if it has no branch or tag by that name."""
+    out, err = run_cmd(
+        cwd, ["git", "ls-remote", repo, revision, f"{revision}^{{}}"], env={"LC_ALL": "C"}
+    )
+    shas = {}
+    for line in out.decode("utf-8").splitlines():
+        sha, _, ref = line.partition("\t")
+        shas[ref] = sha
+    # Prefer tags to branches, like _checkout, and the commit an annotated tag
+    # points to over the tag itself
+    for ref in (
+        f"refs/tags/{revision}^{{}}",
+        f"refs/tags/{revision}",
+        f"refs/heads/{revision}",
+        revision,
+    ):
+        if ref in shas:
+            return shas[ref]
+    return None
+
+
 def remove_remote(cwd):
     return run_cmd(cwd, ["git", "remote", "rm", "origin"], env={"LC_ALL": "C"})
 
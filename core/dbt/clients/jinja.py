@@ -1,7 +1,10 @@
 import re
 import threading
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Any, Dict, List, NoReturn, Optional, Tuple, Union
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any, Dict, Hashable, List, NoReturn, Optional, Tuple, Type, Union
 
 import jinja2
 import jinja2.ext
@@ -20,9 +23,11 @@ from dbt.node_types import ModelLanguage
 from dbt_common.clients.jinja import (
     CallableMacroGenerator,
     MacroProtocol,
-    get_template,
+    catch_jinja,
+    get_environment,
     render_template,
 )
+from dbt_common.dataclass_schema import dbtClassMixin
 from dbt_common.utils import deep_map_render
 
 SUPPORTED_LANG_ARG = jinja2.nodes.Name("supported_languages", "param")
@@ -109,7 +114,94 @@ class UnitTestMacroGenerator(MacroGenerator):
 # is small enough that I've just chosen the more readable option.
 _HAS_RENDER_CHARS_PAT = re.compile(r"({[{%#]|[#}%]})")
 
-_render_cache: Dict[str, Any] = dict()
+RENDER_CACHE_SIZE = 4096
+_NOT_CACHED = object()
+
+
+@dataclass
+class RenderCacheInfo(dbtClassMixin):
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    max_size: int = 0
+
+
+class RenderCache:
+    """A thread-safe LRU cache for get_rendered. It holds the compiled code of
+    templates, keyed on the environment type and the template source, and the
+    rendered values of native strings with no jinja in them.
+    """
+
+    def __init__(self, max_size: int = RENDER_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or _NOT_CACHED"""
+        with self._lock:
+            value = self._entries.get(key, _NOT_CACHED)
+            if value is _NOT_CACHED:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> RenderCacheInfo:
+        with self._lock:
+            return RenderCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+
+_render_cache = RenderCache()
+
+
+def get_render_cache_info() -> RenderCacheInfo:
+    return _render_cache.info()
+
+
+def get_template(
+    string: str,
+    ctx: Dict[str, Any],
+    node=None,
+    capture_macros: bool = False,
+    native: bool = False,
+) -> jinja2.Template:
+    """Like dbt_common's get_template, but the compiled template code is
+    reused for sources that have been seen before. The compiled code doesn't
+    depend on the node or on capture_macros, which only change the undefined
+    type the template is rendered with, so each call still gets its own
+    environment and globals.
+    """
+    with catch_jinja(node):
+        env = get_environment(node, capture_macros, native=native)
+        template_source = str(string)
+        env_type: Type[jinja2.Environment] = type(env)
+        code: CodeType = _render_cache.get((env_type, template_source))
+        if code is _NOT_CACHED:
+            code = env.compile(template_source)
+            _render_cache.put((env_type, template_source), code)
+        return env.template_class.from_code(env, code, env.make_globals(ctx), None)
 
 
 def get_rendered(
@@ -130,8 +222,9 @@ def get_rendered(
     if not has_render_chars:
         if not native:
             return string
-        elif string in _render_cache:
-            return _render_cache[string]
+        rendered = _render_cache.get(string)
+        if rendered is not _NOT_CACHED:
+            return rendered
 
     template = get_template(
         string,
@@ -144,7 +237,7 @@ def get_rendered(
     rendered = render_template(template, ctx, node)
 
     if not has_render_chars and native:
-        _render_cache[string] = rendered
+        _render_cache.put(string, rendered)
 
     return rendered
 
@@ -3,14 +3,16 @@ import json
 import os
 import pickle
 from collections import defaultdict, deque
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+import msgpack
 import networkx as nx  # type: ignore
 import sqlparse
 
 import dbt.tracking
 from dbt.adapters.factory import get_adapter
 from dbt.clients import jinja
+from dbt.constants import GRAPH_CACHE_FILE_NAME, PARTIAL_PARSE_FILE_NAME
 from dbt.context.providers import (
     generate_runtime_model_context,
     generate_runtime_unit_test_context,
@@ -38,6 +40,7 @@ from dbt.exceptions import (
 from dbt.flags import get_flags
 from dbt.graph import Graph
 from dbt.node_types import ModelLanguage, NodeType
+from dbt.version import __version__
 from dbt_common.clients.system import make_directory
 from dbt_common.contracts.constraints import ConstraintType
 from dbt_common.events.contextvars import get_node_info
@@ -91,6 +94,53 @@ def _generate_stats(manifest: Manifest) -> Dict[NodeType, int]:
     return stats
 
 
+def _graph_member_nodes(manifest: Manifest) -> Iterator[GraphMemberNode]:
+    """The nodes that are linked into the graph with their dependencies. Sources
+    are in the graph as well, but have no dependencies."""
+    yield from manifest.nodes.values()
+    yield from manifest.semantic_models.values()
+    yield from manifest.exposures.values()
+    yield from manifest.metrics.values()
+    yield from manifest.unit_tests.values()
+    yield from manifest.saved_queries.values()
+
+
+def _in_graph_collections(manifest: Manifest, unique_id: str) -> bool:
+    return (
+        unique_id in manifest.nodes
+        or unique_id in manifest.sources
+        or unique_id in manifest.semantic_models
+        or unique_id in manifest.exposures
+        or unique_id in manifest.metrics
+        or unique_id in manifest.unit_tests
+        or unique_id in manifest.saved_queries
+    )
+
+
+def read_graph_cache(path: str) -> Optional[Dict[str, Any]]:
+    """Read the edge list written by write_graph_cache, returning None if there
+    is none, or it can't be used by this version of dbt."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as fp:
+            edge_list = msgpack.unpackb(fp.read(), raw=False)
+    except Exception:
+        return None
+    if not isinstance(edge_list, dict) or edge_list.get("dbt_version") != __version__:
+        return None
+    return edge_list
+
+
+def write_graph_cache(path: str, edge_list: Dict[str, Any]) -> None:
+    try:
+        make_directory(os.path.dirname(path))
+        with open(path, "wb") as fp:
+            fp.write(msgpack.packb({**edge_list, "dbt_version": __version__}))
+    except Exception as e:  # The cache only saves time, so merely note failures.
+        fire_event(Note(msg=f"An error was encountered writing the graph cache: {e}"))
+
+
 def _add_prepended_cte(prepended_ctes, new_cte):
     for cte in prepended_ctes:
         if cte.id == new_cte.id and new_cte.sql:
@@ -141,6 +191,10 @@ class Linker:
         return self.graph.nodes()
 
     def find_cycles(self):
+        # Checking that the graph is acyclic, by sorting it topologically, is far
+        # quicker than searching it for a cycle, which is only needed to report one.
+        if nx.is_directed_acyclic_graph(self.graph):
+            return None
         try:
             cycle = nx.find_cycle(self.graph)
         except nx.NetworkXNoCycle:
@@ -187,24 +241,80 @@ class Linker:
     def link_graph(self, manifest: Manifest):
         for source in manifest.sources.values():
             self.add_node(source.unique_id)
-        for node in manifest.nodes.values():
+        for node in _graph_member_nodes(manifest):
             self.link_node(node, manifest)
-        for semantic_model in manifest.semantic_models.values():
-            self.link_node(semantic_model, manifest)
-        for exposure in manifest.exposures.values():
-            self.link_node(exposure, manifest)
-        for metric in manifest.metrics.values():
-            self.link_node(metric, manifest)
-        for unit_test in manifest.unit_tests.values():
-            self.link_node(unit_test, manifest)
-        for saved_query in manifest.saved_queries.values():
-            self.link_node(saved_query, manifest)
 
         cycle = self.find_cycles()
 
         if cycle:
             raise RuntimeError("Found a cycle: {}".format(cycle))
 
+    def link_graph_from_edge_list(self, manifest: Manifest, edge_list: Dict[str, Any]) -> bool:
+        """Link the graph starting from the edge list of an earlier link (see
+        to_edge_list), relinking only the nodes whose dependencies are not the
+        ones recorded there. Returns whether the graph differs from the one the
+        edge list was made from, in which case it is checked for cycles again."""
+        nodes: List[str] = edge_list["nodes"]
+        edges = iter(edge_list["edges"])
+        self.graph.add_nodes_from(nodes)
+        self.graph.add_edges_from(
+            (nodes[parent], nodes[child]) for parent, child in zip(edges, edges)
+        )
+
+        # Remove deleted nodes first, so that any node still depending on one
+        # is relinked below, and fails to link.
+        removed = [node_id for node_id in nodes if not _in_graph_collections(manifest, node_id)]
+        self.graph.remove_nodes_from(removed)
+        changed = bool(removed)
+
+        for source_id in manifest.sources:
+            if source_id not in self.graph:
+                self.add_node(source_id)
+                changed = True
+        for node in _graph_member_nodes(manifest):
+            unique_id = node.unique_id
+            if unique_id in self.graph:
+                if set(self.graph.pred[unique_id]) == set(node.depends_on_nodes):
+                    continue
+                self.graph.remove_edges_from(list(self.graph.in_edges(unique_id)))
+            self.link_node(node, manifest)
+            changed = True
+
+        if changed:
+            cycle = self.find_cycles()
+            if cycle:
+                raise RuntimeError("Found a cycle: {}".format(cycle))
+        return changed
+
+    def to_edge_list(self, with_test_edges: bool) -> Dict[str, Any]:
+        """Return the graph as a compact edge list, which refers to each node by
+        its index in "nodes" and holds each edge as two consecutive indexes. The
+        "parent_test" edges are kept apart in "test_edges", or left out (None)
+        unless with_test_edges."""
+        nodes = list(self.graph)
+        index = {node_id: i for i, node_id in enumerate(nodes)}
+        edges: List[int] = []
+        test_edges: List[int] = []
+        for parent, child, edge_type in self.graph.edges(data="edge_type"):
+            if edge_type == "parent_test":
+                test_edges += (index[parent], index[child])
+            else:
+                edges += (index[parent], index[child])
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "test_edges": test_edges if with_test_edges else None,
+        }
+
+    def add_test_edges_from_edge_list(self, edge_list: Dict[str, Any]) -> None:
+        """Add the "parent_test" edges of an edge list whose graph is unchanged."""
+        nodes: List[str] = edge_list["nodes"]
+        test_edges = iter(edge_list["test_edges"])
+        self.graph.add_edges_from(
+            ((nodes[test], nodes[child]) for test, child in zip(test_edges, test_edges)),
+            edge_type="parent_test",
+        )
+
     def add_test_edges(self, manifest: Manifest) -> None:
         if not get_flags().USE_FAST_TEST_EDGES:
             self.add_test_edges_1(manifest)
@@ -443,19 +553,43 @@ class Linker:
         and performance tuning. The summary includes only the edge structure,
         node types, and node names. Each of the n nodes is assigned an integer
         index 0, 1, 2,..., n-1 for compactness"""
-        graph_nodes = dict()
-        index_dict = dict()
-        for node_index, node_name in enumerate(self.graph):
-            index_dict[node_name] = node_index
-            data = manifest.expect(node_name).to_dict(omit_none=True)
-            graph_nodes[node_index] = {"name": node_name, "type": data["resource_type"]}
-
-        for node_index, node in graph_nodes.items():
-            successors = [index_dict[n] for n in self.graph.successors(node["name"])]
+        return dict(self._iter_graph_summary(manifest, with_test_edges=True))
+
+    def _iter_graph_summary(
+        self, manifest: Manifest, with_test_edges: bool
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        index_dict = {node_name: node_index for node_index, node_name in enumerate(self.graph)}
+        for node_name, node_index in index_dict.items():
+            node: Dict[str, Any] = {
+                "name": node_name,
+                "type": str(manifest.expect(node_name).resource_type),
+            }
+            successors = [
+                index_dict[succ]
+                for succ, edge in self.graph.succ[node_name].items()
+                if with_test_edges or edge.get("edge_type") != "parent_test"
+            ]
             if successors:
-                node["succ"] = [index_dict[n] for n in self.graph.successors(node["name"])]
-
-        return graph_nodes
+                node["succ"] = successors
+            yield node_index, node
+
+    def write_graph_summary(
+        self, out_stream: IO[str], manifest: Manifest, with_test_edges: bool
+    ) -> None:
+        """Write graph_summary.json one node at a time, with the summary of the
+        graph as linked, and if with_test_edges, also including the test edges."""
+        out_stream.write("{")
+        out_stream.write(f'"_invocation_id": {json.dumps(get_invocation_id())}')
+        sections = [("linked", False)]
+        if with_test_edges:
+            sections.append(("with_test_edges", True))
+        for section, include_test_edges in sections:
+            out_stream.write(f', "{section}": {{')
+            for node_index, node in self._iter_graph_summary(manifest, include_test_edges):
+                separator = ", " if node_index else ""
+                out_stream.write(f'{separator}"{node_index}": {json.dumps(node)}')
+            out_stream.write("}")
+        out_stream.write("}")
 
 
 class Compiler:
@@ -655,32 +789,46 @@ class Compiler:
 
     # This method doesn't actually "compile" any of the nodes. That is done by the
     # "compile_node" method. This creates a Linker and builds the networkx graph,
-    # writes out the graph.gpickle file, and prints the stats, returning a Graph object.
+    # writes out the graph summary (and graph.gpickle file, with --write-graph-file),
+    # and prints the stats, returning a Graph object.
+    #
+    # With partial parsing, the linked graph is cached in a compact edge list
+    # alongside the partial parse file. Only the nodes whose dependencies have
+    # changed since are relinked, and the test edges are reused when nothing has.
     def compile(self, manifest: Manifest, write=True, add_test_edges=False) -> Graph:
         self.initialize()
         linker = Linker()
-        linker.link_graph(manifest)
-
-        # Create a file containing basic information about graph structure,
-        # supporting diagnostics and performance analysis.
-        summaries: Dict = dict()
-        summaries["_invocation_id"] = get_invocation_id()
-        summaries["linked"] = linker.get_graph_summary(manifest)
+        graph_cache_path = self._graph_cache_path()
+        edge_list = read_graph_cache(graph_cache_path) if graph_cache_path else None
+        fast_test_edges = bool(getattr(get_flags(), "USE_FAST_TEST_EDGES", False))
+        if edge_list is None:
+            linker.link_graph(manifest)
+            changed = True
+        else:
+            changed = linker.link_graph_from_edge_list(manifest, edge_list)
 
         # This is only called for the "build" command
         if add_test_edges:
-            manifest.build_parent_and_child_maps()
-            linker.add_test_edges(manifest)
-
-            # Create another diagnostic summary, just as above, but this time
-            # including the test edges.
-            summaries["with_test_edges"] = linker.get_graph_summary(manifest)
+            if (
+                edge_list is not None
+                and not changed
+                and edge_list["test_edges"] is not None
+                and edge_list.get("fast_test_edges") == fast_test_edges
+            ):
+                linker.add_test_edges_from_edge_list(edge_list)
+            else:
+                manifest.build_parent_and_child_maps()
+                linker.add_test_edges(manifest)
+                changed = True
 
+        # Create a file containing basic information about graph structure,
+        # supporting diagnostics and performance analysis: the graph as linked,
+        # and for "build", another summary including the test edges.
         with open(
             os.path.join(self.config.project_target_path, "graph_summary.json"), "w"
         ) as out_stream:
             try:
-                out_stream.write(json.dumps(summaries))
+                linker.write_graph_summary(out_stream, manifest, with_test_edges=add_test_edges)
             except Exception as e:  # This is non-essential information, so merely note failures.
                 fire_event(
                     Note(
@@ -688,7 +836,10 @@ class Compiler:
                     )
                 )
 
-        stats = _generate_stats(manifest)
+        if graph_cache_path and changed:
+            cached = linker.to_edge_list(with_test_edges=add_test_edges)
+            cached["fast_test_edges"] = fast_test_edges
+            write_graph_cache(graph_cache_path, cached)
 
         if write:
             self.write_graph_file(linker, manifest)
@@ -700,11 +851,22 @@ class Compiler:
 
         return Graph(linker.graph)
 
+    def _graph_cache_path(self) -> Optional[str]:
+        flags = get_flags()
+        if not getattr(flags, "PARTIAL_PARSE", False):
+            return None
+        partial_parse_path = getattr(flags, "PARTIAL_PARSE_FILE_PATH", None) or os.path.join(
+            self.config.project_target_path, PARTIAL_PARSE_FILE_NAME
+        )
+        return os.path.join(os.path.dirname(partial_parse_path), GRAPH_CACHE_FILE_NAME)
+
     def write_graph_file(self, linker: Linker, manifest: Manifest):
         filename = graph_file_name
         graph_path = os.path.join(self.config.project_target_path, filename)
         flags = get_flags()
-        if flags.WRITE_JSON:
+        # Serializing every node into the graph is costly, so graph.gpickle is
+        # only written on request.
+        if flags.WRITE_JSON and getattr(flags, "WRITE_GRAPH_FILE", False):
             linker.write_graph(graph_path, manifest)
 
     # writes the "compiled_code" into the target/compiled directory
@@ -15,12 +15,14 @@ DBT_PROJECT_FILE_NAME = "dbt_project.yml"
 PACKAGES_FILE_NAME = "packages.yml"
 DEPENDENCIES_FILE_NAME = "dependencies.yml"
 PACKAGE_LOCK_FILE_NAME = "package-lock.yml"
+PACKAGES_INSTALLED_FILE_NAME = ".package-lock-installed.json"
 MANIFEST_FILE_NAME = "manifest.json"
 SEMANTIC_MANIFEST_FILE_NAME = "semantic_manifest.json"
 LEGACY_TIME_SPINE_MODEL_NAME = "metricflow_time_spine"
 LEGACY_TIME_SPINE_GRANULARITY = TimeGranularity.DAY
 MINIMUM_REQUIRED_TIME_SPINE_GRANULARITY = TimeGranularity.DAY
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
+GRAPH_CACHE_FILE_NAME = "graph_cache.msgpack"
 PACKAGE_LOCK_HASH_KEY = "sha1_hash"
 CATALOGS_FILE_NAME = "catalogs.yml"
 RUN_RESULTS_FILE_NAME = "run_results.json"
@@ -1,15 +1,66 @@
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Union,
+)
 
 from dbt.clients.jinja import MacroGenerator, MacroStack
 from dbt.contracts.graph.nodes import Macro
 from dbt.exceptions import DuplicateMacroNameError, PackageNotFoundForMacroError
 from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 
-FlatNamespace = Dict[str, MacroGenerator]
+FlatNamespace = MutableMapping[str, MacroGenerator]
 NamespaceMember = Union[FlatNamespace, MacroGenerator]
 FullNamespace = Dict[str, NamespaceMember]
 
 
+# A package's macros, bound to a node's context on first access. The macro
+# dictionaries are shared with the manifest, so building the namespace for a
+# node doesn't create a MacroGenerator for every macro in every package, only
+# for the ones that node's rendering actually looks up. Assigning a key (as
+# unit test macro overrides do) only affects this node's namespace.
+class MacroPackageNamespace(MutableMapping[str, MacroGenerator]):
+    def __init__(
+        self,
+        macros: Mapping[str, Macro],
+        bind: Callable[[Macro], MacroGenerator],
+    ) -> None:
+        self._macros = macros
+        self._bind = bind
+        self._generators: Dict[str, MacroGenerator] = {}
+
+    def __getitem__(self, key: str) -> MacroGenerator:
+        if key not in self._generators:
+            self._generators[key] = self._bind(self._macros[key])
+        return self._generators[key]
+
+    def __setitem__(self, key: str, value: MacroGenerator) -> None:
+        self._generators[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError(f"Macros can't be removed from a namespace (tried to remove {key})")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._macros or key in self._generators
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._macros
+        for key in self._generators:
+            if key not in self._macros:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._macros) + sum(1 for key in self._generators if key not in self._macros)
+
+
 # The point of this class is to collect the various macros
 # and provide the ability to flatten them into the ManifestContexts
 # that are created for jinja, so that macro calls can be resolved.
@@ -152,16 +203,29 @@ class MacroNamespaceBuilder:
     def build_namespace(
         self, macros_by_package: Dict[str, Dict[str, Macro]], ctx: Dict[str, Any]
     ) -> MacroNamespace:
-        for package in macros_by_package.values():
-            self.add_macros(package.values(), ctx)
+        def bind(macro: Macro) -> MacroGenerator:
+            # MacroGenerator is in clients/jinja.py
+            return MacroGenerator(macro, ctx, self.node, self.thread_ctx)
 
         # Iterate in reverse-order and overwrite: the packages that are first
         # in the list are the ones we want to "win".
-        global_project_namespace: FlatNamespace = {}
+        internal_macros: Dict[str, Macro] = {}
         for pkg in reversed(self.internal_package_names_order):
-            if pkg in self.internal_packages:
-                # add the macros pointed to by this package name
-                global_project_namespace.update(self.internal_packages[pkg])
+            if pkg in macros_by_package:
+                internal_macros.update(macros_by_package[pkg])
+        global_project_namespace = MacroPackageNamespace(internal_macros, bind)
+
+        # Other packages share the manifest's macro dictionaries and are only
+        # bound when a macro is looked up in them. The local and root package
+        # macros are also flattened into the top level of the context, so they
+        # are bound up front.
+        for package_name, macros in macros_by_package.items():
+            if package_name not in self.internal_package_names:
+                self.packages[package_name] = MacroPackageNamespace(macros, bind)
+        if self.search_package in self.packages:
+            self.locals.update(self.packages[self.search_package])
+        if self.root_package in self.packages and self.root_package != self.search_package:
+            self.globals.update(self.packages[self.root_package])
 
         return MacroNamespace(
             global_namespace=self.globals,  # root package macros
@@ -70,6 +70,26 @@ class FilePath(dbtClassMixin):
         return os.stat(self.full_path).st_size > MAXIMUM_SEED_SIZE
 
 
+@dataclass
+class FileStat(dbtClassMixin):
+    """The stat fields compared to tell that a file hasn't changed since it
+    was last read, without reading it.
+    """
+
+    mtime_ns: int
+    size: int
+    inode: int
+
+    @classmethod
+    def from_path(cls, path: str) -> "FileStat":
+        stat_result = os.stat(path)
+        return cls(
+            mtime_ns=stat_result.st_mtime_ns,
+            size=stat_result.st_size,
+            inode=stat_result.st_ino,
+        )
+
+
 @dataclass
 class RemoteFile(dbtClassMixin):
     def __init__(self, language) -> None:
@@ -114,6 +134,8 @@ class BaseSourceFile(dbtClassMixin, SerializableType):
     parse_file_type: Optional[ParseFileType] = None
     # we don't want to serialize this
     contents: Optional[str] = None
+    # When the checksum was computed, so later reads can skip unchanged files
+    stat: Optional[FileStat] = None
 
     @property
     def file_id(self):
@@ -509,6 +509,40 @@ class SingularTestLookup(dbtClassMixin):
         return node
 
 
+class FixtureRowsCache:
+    """Rows of the seed and csv fixture files used by unit tests, stored by
+    column and keyed by file checksum, so that each unit test gets its own list
+    of row dicts without the file being read and converted again.
+    """
+
+    def __init__(self) -> None:
+        self.storage: Dict[str, Tuple[str, Tuple[str, ...], List[Tuple[Any, ...]], int]] = {}
+
+    def get_rows(
+        self, file_id: str, checksum: str, load: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        cached = self.storage.get(file_id)
+        if cached is not None and cached[0] == checksum:
+            _, column_names, columns, num_rows = cached
+            if not column_names:
+                return [{} for _ in range(num_rows)]
+            return [dict(zip(column_names, values)) for values in zip(*columns)]
+
+        rows = load()
+        column_names = tuple(rows[0]) if rows else ()
+        # only rows with the same keys (as from a csv.DictReader) can be stored by column
+        if all(
+            len(row) == len(column_names) and all(name in row for name in column_names)
+            for row in rows
+        ):
+            columns = [tuple(row[name] for row in rows) for name in column_names]
+            self.storage[file_id] = (checksum, column_names, columns, len(rows))
+        return rows
+
+    def evict(self, file_id: str) -> None:
+        self.storage.pop(file_id, None)
+
+
 def _packages_to_search(
     current_project: str,
     node_package: str,
@@ -935,6 +969,10 @@ class Manifest(MacroMethods, dbtClassMixin):
         default=None,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    _fixture_rows_cache: Optional[FixtureRowsCache] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
 
     def __pre_serialize__(self, context: Optional[Dict] = None):
         # serialization won't work with anything except an empty source_patches because
@@ -1322,6 +1360,12 @@ class Manifest(MacroMethods, dbtClassMixin):
             self._singular_test_lookup = SingularTestLookup(self)
         return self._singular_test_lookup
 
+    @property
+    def fixture_rows_cache(self) -> FixtureRowsCache:
+        if self._fixture_rows_cache is None:
+            self._fixture_rows_cache = FixtureRowsCache()
+        return self._fixture_rows_cache
+
     @property
     def external_node_unique_ids(self):
         return [node.unique_id for node in self.nodes.values() if node.is_external_node]
@@ -2,9 +2,10 @@ import abc
 import functools
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Generic, List, Optional, TypeVar
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
 
 from dbt.contracts.project import ProjectPackageMetadata
 from dbt.events.types import DepsSetDownloadDirectory
@@ -44,6 +45,21 @@ def downloads_directory():
         DOWNLOADS_PATH = None
 
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_packages(func: Callable[[T], R], packages: Iterable[T], threads: int = 1) -> Iterator[R]:
+    """Lazily yield func(package) for each package, in order. With more than one
+    thread, every call is submitted up front and run concurrently, so the
+    results (and the first error) still come back in the order of packages."""
+    if threads <= 1:
+        yield from map(func, packages)
+    else:
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="deps") as executor:
+            yield from executor.map(func, packages)
+
+
 class BasePackage(metaclass=abc.ABCMeta):
     @abc.abstractproperty
     def name(self) -> str:
@@ -104,6 +120,11 @@ class PinnedPackage(BasePackage):
     def get_subdirectory(self):
         return None
 
+    def get_cache_key(self) -> Optional[str]:
+        """A key for the installed contents of this package that never changes,
+        like a registry version or a git commit, or None if there isn't one."""
+        return None
+
     def _install(self, project, renderer):
         metadata = self.fetch_metadata(project, renderer)
 
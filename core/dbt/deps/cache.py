@@ -0,0 +1,164 @@
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Optional
+
+from dbt.deps.base import PinnedPackage, UnpinnedPackage
+from dbt.deps.git import GitPinnedPackage, GitUnpinnedPackage
+from dbt.deps.registry import RegistryPinnedPackage, RegistryUnpinnedPackage
+from dbt.exceptions import CommandResultError
+from dbt_common.clients import system
+from dbt_common.exceptions import ExecutableError
+
+# The commit each branch or tag of a git package pointed to when it was last installed
+GIT_REVISIONS_FILE_NAME = "revisions.json"
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    # hardlinks make installing from the cache nearly free, but aren't
+    # available across filesystems
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class PackageCache:
+    """A directory of installed packages, keyed by PinnedPackage.get_cache_key.
+    Each entry holds a single directory named after the package's project, so
+    a package can be installed from the cache without fetching its metadata.
+
+    Packages are installed from the cache as hardlinks where possible, so the
+    files in the packages install path must not be edited in place.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.abspath(path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, *key.split("/"))
+
+    def get_project_name(self, key: str) -> Optional[str]:
+        entry_path = self._entry_path(key)
+        if not os.path.isdir(entry_path):
+            return None
+        contents = os.listdir(entry_path)
+        return contents[0] if len(contents) == 1 else None
+
+    def _git_revisions_path(self, package: GitPinnedPackage) -> str:
+        return os.path.join(self._entry_path(package.cache_repo_key), GIT_REVISIONS_FILE_NAME)
+
+    def _read_git_revisions(self, package: GitPinnedPackage) -> Dict[str, str]:
+        try:
+            with open(self._git_revisions_path(package)) as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return {}
+
+    def _add_git_revision(self, package: GitPinnedPackage) -> None:
+        revision = package.requested_revision
+        if package.resolved_sha is None or revision == package.resolved_sha:
+            return
+        revisions = self._read_git_revisions(package)
+        if revisions.get(revision) == package.resolved_sha:
+            return
+        revisions[revision] = package.resolved_sha
+        revisions_path = self._git_revisions_path(package)
+        system.make_directory(os.path.dirname(revisions_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(revisions_path))
+        with os.fdopen(fd, "w") as fp:
+            json.dump(revisions, fp)
+        os.replace(tmp_path, revisions_path)
+
+    def _resolve_git(self, package: GitUnpinnedPackage) -> Optional[PinnedPackage]:
+        if len(set(package.revisions)) != 1:
+            return None
+        pinned = package.resolved()
+        if pinned.get_cache_key() is None:
+            try:
+                pinned.resolved_sha = pinned.get_remote_sha()
+            except (CommandResultError, ExecutableError):
+                # the remote can't be reached, so use the commit the branch or
+                # tag pointed to when it was last installed
+                revisions = self._read_git_revisions(pinned)
+                pinned.resolved_sha = revisions.get(pinned.requested_revision)
+            else:
+                self._add_git_revision(pinned)
+        key = pinned.get_cache_key()
+        if key is None or self.get_project_name(key) is None:
+            return None
+        return pinned
+
+    def resolve(self, package: UnpinnedPackage) -> Optional[PinnedPackage]:
+        """Pin a package from the lock file to a cached version without fetching
+        it. Registry packages are pinned without going to the hub, so the latest
+        version is unknown and no update will be reported for them. Git branches
+        and tags are pinned to the commit they point to, which is looked up in
+        the cache when the remote can't be reached."""
+        if isinstance(package, GitUnpinnedPackage):
+            return self._resolve_git(package)
+        if not isinstance(package, RegistryUnpinnedPackage) or len(package.versions) != 1:
+            return None
+        version = package.versions[0]
+        if not version.is_exact:
+            return None
+        pinned = RegistryPinnedPackage(
+            package=package.package,
+            version=version.to_version_string(skip_matcher=True),
+            version_latest=version.to_version_string(skip_matcher=True),
+        )
+        if self.get_project_name(pinned.get_cache_key()) is None:  # type: ignore[arg-type]
+            return None
+        return pinned
+
+    def install(self, package: PinnedPackage, packages_install_path: str) -> Optional[str]:
+        """Install the package from the cache, returning its project name, or
+        None if it isn't cached."""
+        key = package.get_cache_key()
+        if key is None:
+            return None
+        project_name = self.get_project_name(key)
+        if project_name is None:
+            return None
+        dest_path = os.path.join(packages_install_path, project_name)
+        if os.path.lexists(dest_path):
+            system.rmtree(dest_path)
+        shutil.copytree(
+            os.path.join(self._entry_path(key), project_name),
+            dest_path,
+            symlinks=True,
+            copy_function=_link_or_copy,
+        )
+        return project_name
+
+    def add(self, package: PinnedPackage, installed_path: str) -> None:
+        """Add a freshly installed package to the cache, unless it's there already."""
+        key = package.get_cache_key()
+        if key is None:
+            return
+        if self.get_project_name(key) is None:
+            self._add_entry(key, installed_path)
+        if isinstance(package, GitPinnedPackage):
+            self._add_git_revision(package)
+
+    def _add_entry(self, key: str, installed_path: str) -> None:
+        entry_path = self._entry_path(key)
+        system.make_directory(os.path.dirname(entry_path))
+        # copy into a temporary entry first, so that concurrent or interrupted
+        # runs never see a partial entry
+        tmp_path = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(entry_path))
+        try:
+            shutil.copytree(
+                installed_path,
+                os.path.join(tmp_path, os.path.basename(installed_path)),
+                symlinks=True,
+            )
+            os.rename(tmp_path, entry_path)
+        except OSError:
+            # another run added the entry first
+            if self.get_project_name(key) is None:
+                raise
+        finally:
+            if os.path.exists(tmp_path):
+                system.rmtree(tmp_path)
@@ -57,6 +57,11 @@ class GitPinnedPackage(GitPackageMixin, PinnedPackage):
         self.warn_unpinned = warn_unpinned
         self.subdirectory = subdirectory
         self._checkout_name = md5sum(self.name)
+        # The revision is replaced by its commit when the metadata is fetched,
+        # so the branch or tag it was pinned to is kept for the package cache
+        self.requested_revision = revision
+        # The commit the revision pointed to when it was checked out
+        self.resolved_sha: Optional[str] = None
 
     def to_dict(self) -> Dict[str, str]:
         git_scrubbed = scrub_secrets(self.git_unrendered, env_secrets())
@@ -76,6 +81,21 @@ class GitPinnedPackage(GitPackageMixin, PinnedPackage):
     def get_subdirectory(self):
         return self.subdirectory
 
+    @property
+    def cache_repo_key(self) -> str:
+        return f"git/{self._checkout_name}"
+
+    def get_cache_key(self) -> Optional[str]:
+        # branches and tags can move, only commits identify the contents
+        sha = self.revision if git._is_commit(self.revision) else self.resolved_sha
+        if sha is None:
+            return None
+        return f"{self.cache_repo_key}/{sha}"
+
+    def get_remote_sha(self) -> Optional[str]:
+        """The commit the revision points to in the remote repository now."""
+        return git.get_remote_sha(get_downloads_path(), self.git, self.requested_revision)
+
     def nice_version_name(self):
         if self.revision == "HEAD":
             return "HEAD (default revision)"
@@ -99,7 +119,9 @@ class GitPinnedPackage(GitPackageMixin, PinnedPackage):
             if exc.cmd and exc.cmd[0] == "git":
                 fire_event(EnsureGitInstalled())
             raise
-        return os.path.join(get_downloads_path(), dir_)
+        path = os.path.join(get_downloads_path(), dir_)
+        self.resolved_sha = git.get_current_sha(path)
+        return path
 
     def _fetch_metadata(
         self, project: Project, renderer: PackageRenderer
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from dbt.clients import registry
 from dbt.contracts.project import RegistryPackage, RegistryPackageMetadata
@@ -55,6 +55,10 @@ class RegistryPinnedPackage(RegistryPackageMixin, PinnedPackage):
     def nice_version_name(self):
         return "version {}".format(self.version)
 
+    def get_cache_key(self) -> Optional[str]:
+        # versions on the hub are immutable
+        return f"hub/{self.package}/{self.version}"
+
     def _fetch_metadata(self, project, renderer) -> RegistryPackageMetadata:
         dct = registry.package_version(self.package, self.version)
         return RegistryPackageMetadata.from_dict(dct)
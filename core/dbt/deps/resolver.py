@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, NoReturn, Set, Type
+from typing import Any, Dict, Iterator, List, NoReturn, Optional, Set, Type
 
+from dbt.clients import registry
 from dbt.config import Project
 from dbt.config.renderer import PackageRenderer
 from dbt.contracts.project import (
@@ -11,7 +12,8 @@ from dbt.contracts.project import (
     RegistryPackage,
     TarballPackage,
 )
-from dbt.deps.base import BasePackage, PinnedPackage, UnpinnedPackage
+from dbt.deps.base import BasePackage, PinnedPackage, UnpinnedPackage, map_packages
+from dbt.deps.cache import PackageCache
 from dbt.deps.git import GitUnpinnedPackage
 from dbt.deps.local import LocalUnpinnedPackage
 from dbt.deps.registry import RegistryUnpinnedPackage
@@ -117,33 +119,48 @@ def resolve_packages(
     packages: List[PackageSpec],
     project: Project,
     cli_vars: Dict[str, Any],
+    threads: int = 1,
 ) -> List[PinnedPackage]:
     pending = PackageListing.from_contracts(packages)
     final = PackageListing()
 
     renderer = PackageRenderer(cli_vars)
 
+    def fetch_metadata(package: BasePackage):
+        return final[package].resolved().fetch_metadata(project, renderer)
+
     while pending:
         next_pending = PackageListing()
-        # resolve the dependency in question
+        # The packages pending at one level have distinct names, so they can all
+        # be incorporated before their metadata is fetched
         for package in pending:
             final.incorporate(package)
-            target = final[package].resolved().fetch_metadata(project, renderer)
+        if threads > 1 and any(isinstance(p, RegistryUnpinnedPackage) for p in pending):
+            # every registry package checks the hub index, fetch it once up front
+            registry.index_cached()
+        # resolve the dependencies in question, in order
+        for target in map_packages(fetch_metadata, list(pending), threads):
             next_pending.update_from(target.packages)
         pending = next_pending
 
     resolved = final.resolved()
+    # fetch (and cache) the metadata behind the project names concurrently
+    for _ in map_packages(lambda p: p.fetch_metadata(project, renderer), resolved, threads):
+        pass
     _check_for_duplicate_project_names(resolved, project, renderer)
     return resolved
 
 
-def resolve_lock_packages(packages: List[PackageSpec]) -> List[PinnedPackage]:
+def resolve_lock_packages(
+    packages: List[PackageSpec], cache: Optional[PackageCache] = None
+) -> List[PinnedPackage]:
     lock_packages = PackageListing.from_contracts(packages)
     final = PackageListing()
 
     for package in lock_packages:
         final.incorporate(package)
 
-    resolved = final.resolved()
-
-    return resolved
+    if cache is None:
+        return final.resolved()
+    # cached registry packages are pinned without going to the hub
+    return [cache.resolve(package) or package.resolved() for package in final]
@@ -1,13 +1,14 @@
 import functools
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from dbt.config.project import PartialProject
 from dbt.contracts.project import TarballPackage
 from dbt.deps.base import PinnedPackage, UnpinnedPackage, get_downloads_path
 from dbt.events.types import DepsScrubbedPackageName
 from dbt.exceptions import DependencyError, env_secrets, scrub_secrets
+from dbt.utils import md5
 from dbt_common.clients import system
 from dbt_common.events.functions import warn_or_error
 from dbt_common.utils.connection import connection_exception_retry
@@ -54,6 +55,11 @@ class TarballPinnedPackage(TarballPackageMixin, PinnedPackage):
     def nice_version_name(self):
         return f"tarball (url: {self.tarball})"
 
+    def get_cache_key(self) -> Optional[str]:
+        # assumes the tarball behind a url doesn't change, as with versioned
+        # release urls
+        return f"tarball/{md5(self.tarball)}"
+
     def _fetch_metadata(self, project, renderer):
         """Download and untar the project and parse metadata from the project folder."""
         download_untar_fn = functools.partial(
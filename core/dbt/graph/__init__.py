@@ -1,6 +1,6 @@
 from .cli import parse_difference, parse_from_selectors_definition  # noqa: F401
 from .graph import Graph, UniqueId  # noqa: F401
-from .queue import GraphQueue  # noqa: F401
+from .queue import CompactGraphQueue, GraphQueue, build_graph_queue  # noqa: F401
 from .selector import NodeSelector, ResourceTypeSelector  # noqa: F401
 from .selector_spec import (  # noqa: F401
     SelectionCriteria,
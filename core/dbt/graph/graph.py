@@ -1,6 +1,5 @@
 from functools import partial
-from itertools import product
-from typing import Iterable, Iterator, NewType, Optional, Set
+from typing import Dict, Iterable, Iterator, NewType, Optional, Set
 
 import networkx as nx  # type: ignore
 
@@ -116,53 +115,79 @@ class Graph:
         """Create and return a new graph that is a shallow copy of the graph,
         but with only the nodes in include_nodes. Transitive edges across
         removed nodes are preserved as explicit new edges.
-        """
 
-        new_graph: nx.DiGraph = self.graph.copy()
+        There is an edge from one included node to another if the original
+        graph has a path between them that only passes through removed nodes.
+        Rather than contracting removed nodes one at a time, this walks the
+        successors of each included node, memoizing the set of included nodes
+        reachable through each removed node as a bitset, so every node and
+        edge in the original graph is visited at most once.
+        """
         include_nodes: Set[UniqueId] = set(selected)
-
-        still_removing: bool = True
-        while still_removing:
-            nodes_to_remove = list(
-                node
-                for node in new_graph
-                if node not in include_nodes
-                and (new_graph.in_degree(node) * new_graph.out_degree(node)) == 0
-            )
-            if len(nodes_to_remove) == 0:
-                still_removing = False
-            else:
-                new_graph.remove_nodes_from(nodes_to_remove)
-
-        # sort remaining nodes by degree
-        remaining_nodes = list(new_graph.nodes())
-        remaining_nodes.sort(
-            key=lambda node: new_graph.in_degree(node) * new_graph.out_degree(node)
-        )
-
-        for node in remaining_nodes:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target)
-                    for source, target in new_edges
-                    if source != target and not new_graph.has_edge(source, target)
-                ]  # removes cyclic refs and edges already existing in new graph
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is it disabled?".format(node)
                 )
 
+        # keep the original node order
+        ordered_nodes = [node for node in self.graph if node in include_nodes]
+        include_bits: Dict[UniqueId, int] = {
+            node: 1 << index for index, node in enumerate(ordered_nodes)
+        }
+        removed_reach: Dict[UniqueId, int] = {}
+
+        new_graph = nx.DiGraph()
+        new_graph.add_nodes_from((node, self.graph.nodes[node]) for node in ordered_nodes)
+        for source in ordered_nodes:
+            reachable = 0
+            for successor in self.graph.successors(source):
+                if successor in include_bits:
+                    reachable |= include_bits[successor]
+                else:
+                    reachable |= self._removed_reach(successor, include_bits, removed_reach)
+            reachable &= ~include_bits[source]
+
+            while reachable:
+                lowest_bit = reachable & -reachable
+                reachable ^= lowest_bit
+                target = ordered_nodes[lowest_bit.bit_length() - 1]
+                if self.graph.has_edge(source, target):
+                    # keep the data (e.g. edge_type) of edges that already existed
+                    new_graph.add_edge(source, target, **self.graph.edges[source, target])
+                else:
+                    new_graph.add_edge(source, target)
+
         return Graph(new_graph)
 
+    def _removed_reach(
+        self, node: UniqueId, include_bits: Dict[UniqueId, int], memo: Dict[UniqueId, int]
+    ) -> int:
+        """Return the bitset of included nodes reachable from the removed node
+        `node` along paths that only pass through removed nodes.
+        """
+        stack = [(node, iter(self.graph.successors(node)))]
+        partial_reach: Dict[UniqueId, int] = {node: 0}
+        while stack:
+            current, successors = stack[-1]
+            for successor in successors:
+                if successor in include_bits:
+                    partial_reach[current] |= include_bits[successor]
+                elif successor in memo:
+                    partial_reach[current] |= memo[successor]
+                elif successor not in partial_reach:
+                    # descend; nodes already in partial_reach are on the stack,
+                    # which can only happen if the graph has a cycle
+                    partial_reach[successor] = 0
+                    stack.append((successor, iter(self.graph.successors(successor))))
+                    break
+            else:
+                stack.pop()
+                memo[current] = partial_reach.pop(current)
+                if stack:
+                    partial_reach[stack[-1][0]] |= memo[current]
+        return memo[node]
+
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
         # Take the original networkx graph and return a subgraph containing only
         # the selected unique_id nodes.
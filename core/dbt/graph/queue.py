@@ -1,4 +1,5 @@
 import threading
+from array import array
 from queue import PriorityQueue
 from typing import Dict, Generator, List, Optional, Set
 
@@ -11,6 +12,7 @@ from dbt.contracts.graph.nodes import (
     Metric,
     SourceDefinition,
 )
+from dbt.flags import get_flags
 from dbt.node_types import NodeType
 
 from .graph import UniqueId
@@ -31,11 +33,14 @@ class GraphQueue:
         manifest: Manifest,
         selected: Set[UniqueId],
         preserve_edges: bool = True,
+        node_durations: Optional[Dict[UniqueId, float]] = None,
     ) -> None:
         # 'create_empty_copy' returns a copy of the graph G with all of the edges removed, and leaves nodes intact.
         self.graph = graph if preserve_edges else nx.classes.function.create_empty_copy(graph)
         self.manifest = manifest
         self._selected = selected
+        # execution times from a previous run, used for critical path scheduling
+        self._node_durations = node_durations
         # store the queue as a priority queue.
         self.inner: PriorityQueue = PriorityQueue()
         # things that have been popped off the queue but not finished
@@ -94,10 +99,11 @@ class GraphQueue:
                         new_zero_indegree.append(child)
             zero_indegree = new_zero_indegree
 
-    def _get_scores(self, graph: nx.DiGraph) -> Dict[str, int]:
+    def _get_scores(self, graph: nx.DiGraph) -> Dict[str, float]:
         """Scoring nodes for processing order.
 
         Scores are calculated by the graph depth level. Lowest score (0) should be processed first.
+        When node durations are available, nodes are scored by their critical path instead.
 
         Args:
             graph: The graph to be scored.
@@ -105,6 +111,10 @@ class GraphQueue:
         Returns:
             A dictionary consisting of `node name`:`score` pairs.
         """
+        durations = estimate_node_durations(list(graph.nodes()), self._node_durations)
+        if durations is not None:
+            return self._get_critical_path_scores(graph, durations)
+
         # split graph by connected subgraphs
         subgraphs = (graph.subgraph(x) for x in nx.connected_components(nx.Graph(graph)))
 
@@ -118,6 +128,28 @@ class GraphQueue:
 
         return scores
 
+    @staticmethod
+    def _get_critical_path_scores(
+        graph: nx.DiGraph, durations: Dict[UniqueId, float]
+    ) -> Dict[str, float]:
+        """Score nodes by the estimated time of the longest chain of work that
+        starts at them, so that the longest chains are started first.
+
+        Args:
+            graph: The graph to be scored.
+            durations: The estimated execution time of every node in the graph.
+
+        Returns:
+            A dictionary consisting of `node name`:`score` pairs. Scores are the
+            negated critical path times, so the lowest score is still processed first.
+        """
+        remaining: Dict[str, float] = {}
+        for node in reversed(list(nx.topological_sort(graph))):
+            remaining[node] = durations[node] + max(
+                (remaining[successor] for successor in graph.successors(node)), default=0.0
+            )
+        return {node: -cost for node, cost in remaining.items()}
+
     def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
         """Get a node off the inner priority queue. By default, this blocks.
 
@@ -212,3 +244,156 @@ class GraphQueue:
         with self.lock:
             self.some_task_done.wait()
             return self.inner.unfinished_tasks
+
+
+class CompactGraphQueue(GraphQueue):
+    """A drop-in replacement for GraphQueue backed by arrays instead of the
+    networkx graph.
+
+    Nodes are given integer ids, successors are stored in CSR form (an
+    offsets array into a flat array of successor ids), and readiness is
+    tracked with per-node counters of unfinished parents. Scores are the same
+    depth levels that GraphQueue computes, found in a single pass over the
+    arrays. The input graph is not mutated.
+
+    `mark_done` only holds the lock to update counters, and new ready nodes are
+    put on the inner queue (which has its own lock) after it is released.
+    """
+
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        manifest: Manifest,
+        selected: Set[UniqueId],
+        preserve_edges: bool = True,
+        node_durations: Optional[Dict[UniqueId, float]] = None,
+    ) -> None:
+        self.graph = graph
+        self.manifest = manifest
+        self._selected = selected
+        self._node_durations = node_durations
+        self._node_ids: List[UniqueId] = list(graph.nodes())
+        self._index: Dict[UniqueId, int] = {
+            node_id: idx for idx, node_id in enumerate(self._node_ids)
+        }
+        node_count = len(self._node_ids)
+
+        # successors of node i are _targets[_offsets[i]:_offsets[i + 1]]
+        self._offsets = array("l", [0] * (node_count + 1))
+        self._targets = array("l")
+        self._remaining_parents = array("l", [0] * node_count)
+        if preserve_edges:
+            for idx, node_id in enumerate(self._node_ids):
+                for successor in graph.successors(node_id):
+                    successor_idx = self._index[successor]
+                    self._targets.append(successor_idx)
+                    self._remaining_parents[successor_idx] += 1
+                self._offsets[idx + 1] = len(self._targets)
+
+        self._scores = self._get_compact_scores()
+        self.inner: PriorityQueue = PriorityQueue()
+        self._in_progress_count = 0
+        self._done_count = 0
+        self.lock = threading.Lock()
+        self.some_task_done = threading.Condition(self.lock)
+        for idx, parent_count in enumerate(self._remaining_parents):
+            if parent_count == 0:
+                self.inner.put((self._scores[idx], self._node_ids[idx]))
+
+    def _get_compact_scores(self) -> array:
+        """Score each node by its depth level in one pass of Kahn's algorithm.
+        Lowest score (0) should be processed first.
+
+        When node durations are available, the same pass gives a topological
+        order, which is walked backwards to score nodes by their critical path
+        as GraphQueue does.
+        """
+        scores = array("l", [0] * len(self._node_ids))
+        parent_counts = array("l", self._remaining_parents)
+        order = array("l")
+        level = [idx for idx, count in enumerate(parent_counts) if count == 0]
+        depth = 0
+        while level:
+            next_level = []
+            for idx in level:
+                scores[idx] = depth
+                order.append(idx)
+                for successor_idx in self._successors(idx):
+                    parent_counts[successor_idx] -= 1
+                    if parent_counts[successor_idx] == 0:
+                        next_level.append(successor_idx)
+            level = next_level
+            depth += 1
+
+        durations = estimate_node_durations(self._node_ids, self._node_durations)
+        if durations is None:
+            return scores
+        remaining = array("d", [0.0] * len(self._node_ids))
+        for idx in reversed(order):
+            remaining[idx] = durations[self._node_ids[idx]] + max(
+                (remaining[successor_idx] for successor_idx in self._successors(idx)),
+                default=0.0,
+            )
+        return array("d", (-cost for cost in remaining))
+
+    def _successors(self, idx: int) -> array:
+        return self._targets[self._offsets[idx] : self._offsets[idx + 1]]
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
+        _, node_id = self.inner.get(block=block, timeout=timeout)
+        with self.lock:
+            self._in_progress_count += 1
+        return self.manifest.expect(node_id)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._node_ids) - self._done_count - self._in_progress_count
+
+    def mark_done(self, node_id: UniqueId) -> None:
+        idx = self._index[node_id]
+        ready = []
+        with self.lock:
+            for successor_idx in self._successors(idx):
+                self._remaining_parents[successor_idx] -= 1
+                if self._remaining_parents[successor_idx] == 0:
+                    ready.append(successor_idx)
+        # New work must be queued before task_done, so that join() can't
+        # return while there are still nodes to run.
+        for successor_idx in ready:
+            self.inner.put((self._scores[successor_idx], self._node_ids[successor_idx]))
+        with self.lock:
+            self._in_progress_count -= 1
+            self._done_count += 1
+            self.inner.task_done()
+            self.some_task_done.notify_all()
+
+
+def estimate_node_durations(
+    node_ids: List[UniqueId], node_durations: Optional[Dict[UniqueId, float]]
+) -> Optional[Dict[UniqueId, float]]:
+    """Estimate an execution time for every node from a previous run's timings.
+
+    Nodes without a timing (e.g. new nodes) are assumed to take the mean time of
+    the nodes that have one. Returns None if no node has a timing, in which case
+    callers should fall back to scoring by depth.
+    """
+    if not node_durations:
+        return None
+    known = [node_durations[node_id] for node_id in node_ids if node_id in node_durations]
+    if not known:
+        return None
+    default = sum(known) / len(known)
+    return {node_id: node_durations.get(node_id, default) for node_id in node_ids}
+
+
+def build_graph_queue(
+    graph: nx.DiGraph,
+    manifest: Manifest,
+    selected: Set[UniqueId],
+    preserve_edges: bool = True,
+    node_durations: Optional[Dict[UniqueId, float]] = None,
+) -> GraphQueue:
+    """Construct the graph queue implementation selected by the flags."""
+    if getattr(get_flags(), "USE_COMPACT_GRAPH_QUEUE", False):
+        return CompactGraphQueue(graph, manifest, selected, preserve_edges, node_durations)
+    return GraphQueue(graph, manifest, selected, preserve_edges, node_durations)
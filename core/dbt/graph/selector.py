@@ -1,16 +1,18 @@
-from typing import List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 from dbt import selected_resources
 from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.graph.nodes import GraphMemberNode
+from dbt.contracts.graph.nodes import GraphMemberNode, ManifestNode, UnitTestDefinition
 from dbt.contracts.state import PreviousState
 from dbt.events.types import NoNodesForSelectionCriteria, SelectorReportInvalidSelector
 from dbt.exceptions import DbtInternalError, InvalidSelectorError
+from dbt.flags import get_flags
 from dbt.node_types import NodeType
+from dbt.tracing import phase, start_phase
 from dbt_common.events.functions import fire_event, warn_or_error
 
 from .graph import Graph, UniqueId
-from .queue import GraphQueue
+from .queue import GraphQueue, build_graph_queue
 from .selector_methods import MethodManager
 from .selector_spec import IndirectSelection, SelectionCriteria, SelectionSpec
 
@@ -46,6 +48,8 @@ class NodeSelector(MethodManager):
         super().__init__(manifest, previous_state)
         self.full_graph: Graph = graph
         self.include_empty_nodes: bool = include_empty_nodes
+        # the parents of each node that can be selected indirectly, by id
+        self._indirect_parents: Dict[UniqueId, FrozenSet[UniqueId]] = {}
 
         # build a subgraph containing only non-empty, enabled nodes and enabled
         # sources.
@@ -257,37 +261,48 @@ class NodeSelector(MethodManager):
 
         direct_nodes = set(selected)
         indirect_nodes = set()
-        selected_and_parents = set()
+        selected_parents: Set[UniqueId] = set()
         if indirect_selection == IndirectSelection.Buildable:
-            selected_and_parents = selected.union(self.graph.select_parents(selected)).union(
-                self.manifest.sources
-            )
+            selected_parents = self.graph.select_parents(selected)
 
         for unique_id in self.graph.select_successors(selected):
-            if unique_id in self.manifest.nodes or unique_id in self.manifest.unit_tests:
-                if unique_id in self.manifest.nodes:
-                    node = self.manifest.nodes[unique_id]
-                elif unique_id in self.manifest.unit_tests:
-                    node = self.manifest.unit_tests[unique_id]  # type: ignore
-                # Test nodes that are not selected themselves, but whose parents are selected.
-                # (Does not include unit tests because they can only have one parent.)
-                if can_select_indirectly(node):
-                    # should we add it in directly?
-                    if indirect_selection == IndirectSelection.Eager or set(
-                        node.depends_on_nodes
-                    ) <= set(selected):
-                        direct_nodes.add(unique_id)
-                    elif indirect_selection == IndirectSelection.Buildable and set(
-                        node.depends_on_nodes
-                    ) <= set(selected_and_parents):
-                        direct_nodes.add(unique_id)
-                    elif indirect_selection == IndirectSelection.Empty:
-                        pass
-                    else:
-                        indirect_nodes.add(unique_id)
+            # Test nodes that are not selected themselves, but whose parents are selected.
+            # (Does not include unit tests because they can only have one parent.)
+            parents = self._get_indirect_parents(unique_id)
+            if parents is None:
+                continue
+            # should we add it in directly?
+            if indirect_selection == IndirectSelection.Eager or parents <= selected:
+                direct_nodes.add(unique_id)
+            elif indirect_selection == IndirectSelection.Buildable and all(
+                parent in selected or parent in selected_parents or parent in self.manifest.sources
+                for parent in parents
+            ):
+                direct_nodes.add(unique_id)
+            elif indirect_selection == IndirectSelection.Empty:
+                pass
+            else:
+                indirect_nodes.add(unique_id)
 
         return direct_nodes, indirect_nodes
 
+    def _get_indirect_parents(self, unique_id: UniqueId) -> Optional[FrozenSet[UniqueId]]:
+        """Return the parents of a node that can be selected indirectly, or
+        None if it can't be. They're looked up once per selector, since the
+        same tests are checked by every selection criteria."""
+        if unique_id in self._indirect_parents:
+            return self._indirect_parents[unique_id]
+        node: Optional[Union[ManifestNode, UnitTestDefinition]] = None
+        if unique_id in self.manifest.nodes:
+            node = self.manifest.nodes[unique_id]
+        elif unique_id in self.manifest.unit_tests:
+            node = self.manifest.unit_tests[unique_id]
+        if node is None or not can_select_indirectly(node):
+            return None
+        parents: FrozenSet[UniqueId] = frozenset(node.depends_on_nodes)  # type: ignore[arg-type]
+        self._indirect_parents[unique_id] = parents
+        return parents
+
     def incorporate_indirect_nodes(
         self,
         direct_nodes: Set[UniqueId],
@@ -306,15 +321,17 @@ class NodeSelector(MethodManager):
         if indirect_selection == IndirectSelection.Cautious:
             for unique_id in indirect_nodes:
                 if unique_id in self.manifest.nodes:
-                    node = self.manifest.nodes[unique_id]
-                    if set(node.depends_on_nodes) <= set(selected):
+                    parents = self._get_indirect_parents(unique_id)
+                    if parents is not None and parents <= selected:
                         selected.add(unique_id)
         elif indirect_selection == IndirectSelection.Buildable:
-            selected_and_parents = selected.union(self.graph.select_parents(selected))
+            selected_parents = self.graph.select_parents(selected)
             for unique_id in indirect_nodes:
                 if unique_id in self.manifest.nodes:
-                    node = self.manifest.nodes[unique_id]
-                    if set(node.depends_on_nodes) <= set(selected_and_parents):
+                    parents = self._get_indirect_parents(unique_id)
+                    if parents is not None and all(
+                        parent in direct_nodes or parent in selected_parents for parent in parents
+                    ):
                         selected.add(unique_id)
 
         return selected
@@ -329,8 +346,10 @@ class NodeSelector(MethodManager):
             - selectors can filter the nodes after all of them have been
               selected
         """
+        traced_select = start_phase("select nodes")
         selected_nodes, indirect_only = self.select_nodes(spec)
         filtered_nodes = self.filter_selection(selected_nodes)
+        traced_select.end(selected_count=len(filtered_nodes))
 
         return filtered_nodes
 
@@ -342,10 +361,31 @@ class NodeSelector(MethodManager):
         selected_nodes = self.get_selected(spec)
         # Save to global variable
         selected_resources.set_selected_resources(selected_nodes)
-        # Construct a new graph using the selected_nodes
-        new_graph = self.full_graph.get_subset_graph(selected_nodes)
-        # should we give a way here for consumers to mutate the graph?
-        return GraphQueue(new_graph.graph, self.manifest, selected_nodes, preserve_edges)
+        with phase("build graph queue"):
+            # Construct a new graph using the selected_nodes
+            new_graph = self.full_graph.get_subset_graph(selected_nodes)
+            # should we give a way here for consumers to mutate the graph?
+            return build_graph_queue(
+                new_graph.graph,
+                self.manifest,
+                selected_nodes,
+                preserve_edges,
+                self.get_previous_execution_times(),
+            )
+
+    def get_previous_execution_times(self) -> Optional[Dict[UniqueId, float]]:
+        """When scheduling by critical path, return the execution time of each
+        node in the previous run_results.json. Returns None otherwise, or if
+        there are no previous results, in which case nodes are scheduled by depth.
+        """
+        if getattr(get_flags(), "SCHEDULING_PRIORITY", "depth") != "critical_path":
+            return None
+        if self.previous_state is None or self.previous_state.results is None:
+            return None
+        return {
+            result.unique_id: result.execution_time
+            for result in self.previous_state.results.results
+        }
 
 
 class ResourceTypeSelector(NodeSelector):
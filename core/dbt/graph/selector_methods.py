@@ -1,4 +1,5 @@
 import abc
+import os
 from fnmatch import fnmatch
 from itertools import chain
 from pathlib import Path
@@ -113,13 +114,204 @@ SelectorTarget = Union[
 ]
 
 
+def _has_wildcard(pattern: str) -> bool:
+    return any(wildcard in pattern for wildcard in ("*", "?", "["))
+
+
+def _add_to_index(index: Dict[Any, Set[UniqueId]], key: Any, unique_id: UniqueId) -> None:
+    try:
+        index.setdefault(key, set()).add(unique_id)
+    except TypeError:
+        # unhashable values can't be looked up, and never equal a selector string
+        pass
+
+
+def _search_names(index: Dict[str, Set[UniqueId]], pattern: str) -> Set[UniqueId]:
+    """Return the ids of the names in the index that match the pattern, the
+    way fnmatch(name, pattern) would. Names are keyed by their normcase form."""
+    if not _has_wildcard(pattern):
+        return index.get(os.path.normcase(pattern), set())
+    matched: Set[UniqueId] = set()
+    for name, unique_ids in index.items():
+        if fnmatch(name, pattern):
+            matched.update(unique_ids)
+    return matched
+
+
+class SelectionIndex:
+    """Inverted indexes over the manifest for the selector methods, so that
+    each selection criterion is a lookup rather than a scan of every node.
+    Each index is built the first time a method needs it, and is shared by
+    all the criteria of a selection.
+
+    Lookups may return more ids than match, so methods check the nodes they
+    find the same way they would while scanning.
+    """
+
+    def __init__(self, manifest: Manifest) -> None:
+        self.manifest = manifest
+        self._tags: Optional[Dict[str, Set[UniqueId]]] = None
+        self._groups: Optional[Dict[str, Set[UniqueId]]] = None
+        self._access: Optional[Dict[str, Set[UniqueId]]] = None
+        self._packages: Optional[Dict[str, Set[UniqueId]]] = None
+        self._resource_types: Optional[Dict[NodeType, Set[UniqueId]]] = None
+        self._paths: Optional[Dict[Path, Set[UniqueId]]] = None
+        self._fqn_nodes: Dict[UniqueId, SelectorTarget] = {}
+        self._fqn_names: Optional[Dict[str, Set[UniqueId]]] = None
+        self._fqn_prefixes: Optional[Dict[Tuple[str, ...], Set[UniqueId]]] = None
+        self._configs: Dict[Tuple[str, ...], Dict[Any, Set[UniqueId]]] = {}
+
+    def _all_nodes(self) -> Iterator[Tuple[str, SelectorTarget]]:
+        yield from chain(
+            self.manifest.nodes.items(),
+            self.manifest.sources.items(),
+            self.manifest.exposures.items(),
+            self.manifest.metrics.items(),
+            self.manifest.unit_tests.items(),
+            self.manifest.semantic_models.items(),
+            self.manifest.saved_queries.items(),
+        )
+
+    @property
+    def tags(self) -> Dict[str, Set[UniqueId]]:
+        if self._tags is None:
+            self._tags = {}
+            for unique_id, node in self._all_nodes():
+                for tag in getattr(node, "tags", []):
+                    _add_to_index(self._tags, os.path.normcase(tag), UniqueId(unique_id))
+        return self._tags
+
+    @property
+    def groups(self) -> Dict[str, Set[UniqueId]]:
+        if self._groups is None:
+            self._groups = {}
+            groupable_nodes = chain(self.manifest.nodes.items(), self.manifest.metrics.items())
+            for unique_id, node in groupable_nodes:
+                node_group = node.config.get("group")
+                if node_group:
+                    _add_to_index(self._groups, os.path.normcase(node_group), UniqueId(unique_id))
+        return self._groups
+
+    @property
+    def access(self) -> Dict[str, Set[UniqueId]]:
+        if self._access is None:
+            self._access = {}
+            for unique_id, node in self.manifest.nodes.items():
+                if isinstance(node, ModelNode):
+                    _add_to_index(self._access, node.access, UniqueId(unique_id))
+        return self._access
+
+    @property
+    def packages(self) -> Dict[str, Set[UniqueId]]:
+        if self._packages is None:
+            self._packages = {}
+            for unique_id, node in self._all_nodes():
+                _add_to_index(
+                    self._packages, os.path.normcase(node.package_name), UniqueId(unique_id)
+                )
+        return self._packages
+
+    @property
+    def resource_types(self) -> Dict[NodeType, Set[UniqueId]]:
+        if self._resource_types is None:
+            self._resource_types = {}
+            for unique_id, node in self._all_nodes():
+                _add_to_index(self._resource_types, node.resource_type, UniqueId(unique_id))
+        return self._resource_types
+
+    @property
+    def paths(self) -> Dict[Path, Set[UniqueId]]:
+        """The ids of the nodes defined in each file, patched by each yaml file,
+        and defined anywhere under each directory."""
+        if self._paths is None:
+            self._paths = {}
+            for unique_id, node in self._all_nodes():
+                ofp = Path(node.original_file_path)
+                for path in chain([ofp], ofp.parents):
+                    _add_to_index(self._paths, path, UniqueId(unique_id))
+                if getattr(node, "patch_path", None):
+                    pfp = node.patch_path.split("://")[1]  # type: ignore
+                    _add_to_index(self._paths, Path(pfp), UniqueId(unique_id))
+        return self._paths
+
+    def _build_fqn_indexes(self) -> None:
+        self._fqn_names = {}
+        self._fqn_prefixes = {}
+        non_source_nodes = chain(
+            self.manifest.nodes.items(),
+            self.manifest.exposures.items(),
+            self.manifest.metrics.items(),
+            self.manifest.unit_tests.items(),
+            self.manifest.semantic_models.items(),
+            self.manifest.saved_queries.items(),
+        )
+        for unique_id, node in non_source_nodes:
+            self._fqn_nodes[UniqueId(unique_id)] = node
+            fqn = node.fqn
+            # the names is_selected_node compares the whole selector to
+            names = {fqn[-1]}
+            if node.is_versioned and len(fqn) > 1:
+                names.update((fqn[-2], "_".join(fqn[-2:])))
+            for name in names:
+                _add_to_index(self._fqn_names, name, UniqueId(unique_id))
+            # and the dot-separated parts it compares the selector's parts to,
+            # with and without the package name
+            for scoped_fqn in (fqn, fqn[1:]):
+                flat_fqn = tuple(item for segment in scoped_fqn for item in segment.split("."))
+                for end in range(1, len(flat_fqn) + 1):
+                    _add_to_index(self._fqn_prefixes, flat_fqn[:end], UniqueId(unique_id))
+
+    def fqn_candidates(self, selector: str) -> Optional[Dict[UniqueId, SelectorTarget]]:
+        """Return the nodes that may match an fqn selector by id, or None if
+        the selector starts with a wildcard and every node may match."""
+        parts = selector.split(".")
+        prefix: List[str] = []
+        for part in parts:
+            if any(wildcard in part for wildcard in ("*", "?", "[", "]")):
+                break
+            prefix.append(part)
+        if not prefix:
+            return None
+        if self._fqn_names is None or self._fqn_prefixes is None:
+            self._build_fqn_indexes()
+        assert self._fqn_names is not None and self._fqn_prefixes is not None
+        candidates = (
+            self._fqn_prefixes.get(tuple(prefix), set())
+            | self._fqn_names.get(selector, set())
+            | self._fqn_names.get("_".join(parts[-2:]), set())
+        )
+        return {unique_id: self._fqn_nodes[unique_id] for unique_id in candidates}
+
+    def config(self, parts: List[str]) -> Dict[Any, Set[UniqueId]]:
+        """The ids of the nodes and sources by the value of a config, or by
+        each of its values if it's a list."""
+        key = tuple(parts)
+        if key not in self._configs:
+            index: Dict[Any, Set[UniqueId]] = {}
+            configurable_nodes = chain(self.manifest.nodes.items(), self.manifest.sources.items())
+            for unique_id, node in configurable_nodes:
+                try:
+                    value = _getattr_descend(node.config, parts)
+                except AttributeError:
+                    continue
+                for item in value if isinstance(value, list) else [value]:
+                    _add_to_index(index, item, UniqueId(unique_id))
+            self._configs[key] = index
+        return self._configs[key]
+
+
 class SelectorMethod(metaclass=abc.ABCMeta):
     def __init__(
-        self, manifest: Manifest, previous_state: Optional[PreviousState], arguments: List[str]
+        self,
+        manifest: Manifest,
+        previous_state: Optional[PreviousState],
+        arguments: List[str],
+        index: Optional[SelectionIndex] = None,
     ) -> None:
         self.manifest: Manifest = manifest
         self.previous_state = previous_state
         self.arguments: List[str] = arguments
+        self.index: SelectionIndex = index if index is not None else SelectionIndex(manifest)
 
     def parsed_nodes(
         self, included_nodes: Set[UniqueId]
@@ -264,37 +456,37 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         :param str selector: The selector or node name
         """
-        non_source_nodes = list(self.non_source_nodes(included_nodes))
-        for unique_id, node in non_source_nodes:
-            if self.node_is_match(selector, node.fqn, node.is_versioned):
+        candidates = self.index.fqn_candidates(selector)
+        if candidates is None:
+            non_source_nodes = list(self.non_source_nodes(included_nodes))
+            for unique_id, node in non_source_nodes:
+                if self.node_is_match(selector, node.fqn, node.is_versioned):
+                    yield unique_id
+            return
+
+        for unique_id, node in candidates.items():
+            if unique_id in included_nodes and self.node_is_match(
+                selector, node.fqn, node.is_versioned
+            ):
                 yield unique_id
 
 
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
-        for unique_id, node in self.all_nodes(included_nodes):
-            if hasattr(node, "tags") and any(fnmatch(tag, selector) for tag in node.tags):
-                yield unique_id
+        yield from _search_names(self.index.tags, selector) & included_nodes
 
 
 class GroupSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included in the specified group"""
-        for unique_id, node in self.groupable_nodes(included_nodes):
-            node_group = node.config.get("group")
-            if node_group and fnmatch(node_group, selector):
-                yield unique_id
+        yield from _search_names(self.index.groups, selector) & included_nodes
 
 
 class AccessSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields model nodes matching the specified access level"""
-        for unique_id, node in self.parsed_nodes(included_nodes):
-            if not isinstance(node, ModelNode):
-                continue
-            if selector == node.access:
-                yield unique_id
+        yield from self.index.access.get(selector, set()) & included_nodes
 
 
 class SourceSelectorMethod(SelectorMethod):
@@ -462,17 +654,8 @@ class PathSelectorMethod(SelectorMethod):
         else:
             root = Path.cwd()
         paths = set(p.relative_to(root) for p in root.glob(selector))
-        for unique_id, node in self.all_nodes(included_nodes):
-            ofp = Path(node.original_file_path)
-            if ofp in paths:
-                yield unique_id
-            if hasattr(node, "patch_path") and node.patch_path:  # type: ignore
-                pfp = node.patch_path.split("://")[1]  # type: ignore
-                ymlfp = Path(pfp)
-                if ymlfp in paths:
-                    yield unique_id
-            if any(parent in paths for parent in ofp.parents):
-                yield unique_id
+        for path in paths:
+            yield from self.index.paths.get(path, set()) & included_nodes
 
 
 class FileSelectorMethod(SelectorMethod):
@@ -492,9 +675,7 @@ class PackageSelectorMethod(SelectorMethod):
         if selector == "this" and self.manifest.metadata.project_name is not None:
             selector = self.manifest.metadata.project_name
 
-        for unique_id, node in self.all_nodes(included_nodes):
-            if fnmatch(node.package_name, selector):
-                yield unique_id
+        yield from _search_names(self.index.packages, selector) & included_nodes
 
 
 def _getattr_descend(obj: Any, attrs: List[str]) -> Any:
@@ -521,6 +702,22 @@ class CaseInsensitive(str):
             return self.upper() == other
 
 
+def _config_value_matches(value: Any, selector: Any) -> bool:
+    if isinstance(value, list):
+        return (
+            (selector in value)
+            or (CaseInsensitive(selector) == "true" and True in value)
+            or (CaseInsensitive(selector) == "false" and False in value)
+        )
+    else:
+        return (
+            (selector == value)
+            or (CaseInsensitive(selector) == "true" and value is True)
+            or (CaseInsensitive(selector) == "false")
+            and value is False
+        )
+
+
 class ConfigSelectorMethod(SelectorMethod):
     def search(
         self,
@@ -536,27 +733,29 @@ class ConfigSelectorMethod(SelectorMethod):
         # search sources is kind of useless now source configs only have
         # 'enabled', which you can't really filter on anyway, but maybe we'll
         # add more someday, so search them anyway.
-        for unique_id, node in self.configurable_nodes(included_nodes):
+        if type(selector) is str:
+            # look up the values that can equal the selector
+            index = self.index.config(parts)
+            candidates = set(index.get(selector, set()))
+            if CaseInsensitive(selector) == "true":
+                candidates.update(index.get(True, set()))
+            elif CaseInsensitive(selector) == "false":
+                candidates.update(index.get(False, set()))
+            nodes: Iterator[Tuple[UniqueId, ResultNode]] = (
+                (unique_id, self.manifest.nodes.get(unique_id) or self.manifest.sources[unique_id])
+                for unique_id in candidates & included_nodes
+            )
+        else:
+            nodes = self.configurable_nodes(included_nodes)
+
+        for unique_id, node in nodes:
             try:
                 value = _getattr_descend(node.config, parts)
             except AttributeError:
                 continue
             else:
-                if isinstance(value, list):
-                    if (
-                        (selector in value)
-                        or (CaseInsensitive(selector) == "true" and True in value)
-                        or (CaseInsensitive(selector) == "false" and False in value)
-                    ):
-                        yield unique_id
-                else:
-                    if (
-                        (selector == value)
-                        or (CaseInsensitive(selector) == "true" and value is True)
-                        or (CaseInsensitive(selector) == "false")
-                        and value is False
-                    ):
-                        yield unique_id
+                if _config_value_matches(value, selector):
+                    yield unique_id
 
 
 class ResourceTypeSelectorMethod(SelectorMethod):
@@ -565,9 +764,7 @@ class ResourceTypeSelectorMethod(SelectorMethod):
             resource_type = NodeType(selector)
         except ValueError as exc:
             raise DbtRuntimeError(f'Invalid resource_type selector "{selector}"') from exc
-        for unique_id, node in self.all_nodes(included_nodes):
-            if node.resource_type == resource_type:
-                yield unique_id
+        yield from self.index.resource_types.get(resource_type, set()) & included_nodes
 
 
 class TestNameSelectorMethod(SelectorMethod):
@@ -610,71 +807,55 @@ class TestTypeSelectorMethod(SelectorMethod):
 class StateSelectorMethod(SelectorMethod):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.modified_macros: Optional[List[str]] = None
+        self.modified_macros: Optional[Set[str]] = None
 
-    def _macros_modified(self) -> List[str]:
+    def _macros_modified(self) -> Set[str]:
         # we checked in the caller!
         if self.previous_state is None or self.previous_state.manifest is None:
             raise DbtInternalError("No comparison manifest in _macros_modified")
         old_macros = self.previous_state.manifest.macros
         new_macros = self.manifest.macros
 
-        modified = []
+        modified = set()
         for uid, macro in new_macros.items():
             if uid in old_macros:
                 old_macro = old_macros[uid]
                 if macro.macro_sql != old_macro.macro_sql:
-                    modified.append(uid)
+                    modified.add(uid)
             else:
-                modified.append(uid)
+                modified.add(uid)
 
         for uid, _ in old_macros.items():
             if uid not in new_macros:
-                modified.append(uid)
+                modified.add(uid)
 
         return modified
 
-    def recursively_check_macros_modified(self, node, visited_macros):
-        if not hasattr(node, "depends_on"):
-            return False
-
-        for macro_uid in node.depends_on.macros:
-            if macro_uid in visited_macros:
-                continue
-            visited_macros.append(macro_uid)
-
-            if macro_uid in self.modified_macros:
-                return True
-
-            # this macro hasn't been modified, but depends on other
-            # macros which each need to be tested for modification
-            macro_node = self.manifest.macros[macro_uid]
-            if len(macro_node.depends_on.macros) > 0:
-                upstream_macros_changed = self.recursively_check_macros_modified(
-                    macro_node, visited_macros
-                )
-                if upstream_macros_changed:
-                    return True
-                continue
-
-            # this macro hasn't been modified, but we haven't checked
-            # the other macros the node depends on, so keep looking
-            if len(node.depends_on.macros) > len(visited_macros):
-                continue
-
-        return False
+    def _macros_transitively_modified(self, modified: Set[str]) -> Set[str]:
+        # A macro counts as modified if it, or any macro it calls (directly or
+        # not), was modified. Walk the macro dependency graph in reverse from
+        # the modified macros once, instead of walking forward from every node.
+        dependents: Dict[str, List[str]] = {}
+        for uid, macro in self.manifest.macros.items():
+            for macro_uid in macro.depends_on.macros:
+                dependents.setdefault(macro_uid, []).append(uid)
+
+        transitively_modified = set(modified)
+        to_visit = list(modified)
+        while to_visit:
+            for dependent in dependents.get(to_visit.pop(), []):
+                if dependent not in transitively_modified:
+                    transitively_modified.add(dependent)
+                    to_visit.append(dependent)
+        return transitively_modified
 
     def check_macros_modified(self, node):
-        # check if there are any changes in macros the first time
+        # find the macros that are modified or call a modified macro the first time
         if self.modified_macros is None:
-            self.modified_macros = self._macros_modified()
-        # no macros have been modified, skip looping entirely
-        if not self.modified_macros:
+            self.modified_macros = self._macros_transitively_modified(self._macros_modified())
+        if not hasattr(node, "depends_on"):
             return False
-        # recursively loop through upstream macros to see if any is modified
-        else:
-            visited_macros = []
-            return self.recursively_check_macros_modified(node, visited_macros)
+        return not self.modified_macros.isdisjoint(node.depends_on.macros)
 
     # TODO check modifed_content and check_modified macro seems a bit redundent
     def check_modified_content(
@@ -949,6 +1130,7 @@ class MethodManager:
     ) -> None:
         self.manifest = manifest
         self.previous_state = previous_state
+        self.index = SelectionIndex(manifest)
 
     def get_method(self, method: MethodName, method_arguments: List[str]) -> SelectorMethod:
 
@@ -958,4 +1140,4 @@ class MethodManager:
                 f"method name, but it is not handled"
             )
         cls: Type[SelectorMethod] = self.SELECTOR_METHODS[method]
-        return cls(self.manifest, self.previous_state, method_arguments)
+        return cls(self.manifest, self.previous_state, method_arguments, self.index)
@@ -5,11 +5,10 @@ import time
 import traceback
 from copy import deepcopy
 from dataclasses import dataclass, field
-from datetime import date, datetime, timezone
+from datetime import datetime, timezone
 from itertools import chain
 from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Type, Union
 
-import msgpack
 from jinja2.nodes import Call
 
 import dbt.deprecations
@@ -28,7 +27,12 @@ from dbt.adapters.factory import (
 from dbt.artifacts.resources import FileHash, NodeRelation, NodeVersion
 from dbt.artifacts.resources.types import BatchSize
 from dbt.artifacts.schemas.base import Writable
-from dbt.clients.jinja import MacroStack, get_rendered
+from dbt.clients.jinja import (
+    MacroStack,
+    RenderCacheInfo,
+    get_render_cache_info,
+    get_rendered,
+)
 from dbt.clients.jinja_static import statically_extract_macro_calls
 from dbt.config import Project, RuntimeConfig
 from dbt.constants import (
@@ -100,12 +104,29 @@ from dbt.parser.generic_test import GenericTestParser
 from dbt.parser.hooks import HookParser
 from dbt.parser.macros import MacroParser
 from dbt.parser.models import ModelParser
+from dbt.parser.parallel import (
+    PARALLEL_PARSER_NAMES,
+    ParseWorkerContext,
+    build_parse_shards,
+    merge_shard_result,
+    parse_shards_in_pool,
+)
 from dbt.parser.partial import PartialParsing, special_override_macros
+from dbt.parser.partial_parse_file import (  # noqa: F401
+    PartialParseFile,
+    extended_mashumaro_encoder,
+    extended_mashumuro_decoder,
+    extended_msgpack_decoder,
+    extended_msgpack_encoder,
+    is_sectioned_partial_parse_file,
+    write_partial_parse_file,
+)
 from dbt.parser.read_files import (
     FileDiff,
     ReadFiles,
     ReadFilesFromDiff,
     ReadFilesFromFileSystem,
+    load_deferred_contents,
     load_source_file,
 )
 from dbt.parser.schemas import SchemaParser
@@ -115,6 +136,7 @@ from dbt.parser.singular_test import SingularTestParser
 from dbt.parser.snapshots import SnapshotParser
 from dbt.parser.sources import SourcePatcher
 from dbt.parser.unit_tests import process_models_for_unit_test
+from dbt.tracing import phase, start_phase
 from dbt.utils.artifact_upload import add_artifact_produced
 from dbt.version import __version__
 from dbt_common.clients.jinja import parse
@@ -132,36 +154,6 @@ from dbt_semantic_interfaces.type_enums import MetricType
 PERF_INFO_FILE_NAME = "perf_info.json"
 
 
-def extended_mashumaro_encoder(data):
-    return msgpack.packb(data, default=extended_msgpack_encoder, use_bin_type=True)
-
-
-def extended_msgpack_encoder(obj):
-    if type(obj) is date:
-        date_bytes = msgpack.ExtType(1, obj.isoformat().encode())
-        return date_bytes
-    elif type(obj) is datetime:
-        datetime_bytes = msgpack.ExtType(2, obj.isoformat().encode())
-        return datetime_bytes
-
-    return obj
-
-
-def extended_mashumuro_decoder(data):
-    return msgpack.unpackb(data, ext_hook=extended_msgpack_decoder, raw=False)
-
-
-def extended_msgpack_decoder(code, data):
-    if code == 1:
-        d = date.fromisoformat(data.decode())
-        return d
-    elif code == 2:
-        dt = datetime.fromisoformat(data.decode())
-        return dt
-    else:
-        return msgpack.ExtType(code, data)
-
-
 def version_to_str(version: Optional[Union[str, int]]) -> str:
     if isinstance(version, int):
         return str(version)
@@ -201,6 +193,17 @@ class ProjectLoaderInfo(dbtClassMixin):
     parsed_path_count: int = 0
 
 
+# Part of saved performance info
+@dataclass
+class ParseWorkerInfo(dbtClassMixin):
+    worker_id: int
+    elapsed: float
+    shard_count: int = 0
+    parsed_path_count: int = 0
+    render_cache_hits: int = 0
+    render_cache_misses: int = 0
+
+
 # Part of saved performance info
 @dataclass
 class ManifestLoaderInfo(dbtClassMixin, Writable):
@@ -217,6 +220,8 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     process_manifest_elapsed: Optional[float] = None
     load_all_elapsed: Optional[float] = None
     projects: List[ProjectLoaderInfo] = field(default_factory=list)
+    parse_workers: List[ParseWorkerInfo] = field(default_factory=list)
+    render_cache: Optional[RenderCacheInfo] = None
     _project_index: Dict[str, ProjectLoaderInfo] = field(default_factory=dict)
 
     def __post_serialize__(self, dct: Dict, context: Optional[Dict] = None):
@@ -303,6 +308,8 @@ class ManifestLoader:
 
         # Start performance counting
         start_load_all = time.perf_counter()
+        traced_load_all = start_phase("load manifest")
+        start_render_cache = get_render_cache_info()
 
         projects = config.load_dependencies()
         loader = cls(
@@ -323,16 +330,31 @@ class ManifestLoader:
 
         # Save performance info
         loader._perf_info.load_all_elapsed = time.perf_counter() - start_load_all
+        # Parse workers have their own caches, so their counts are added to
+        # this process's counts, but size is this process's cache only.
+        render_cache = get_render_cache_info()
+        render_cache.hits -= start_render_cache.hits
+        render_cache.misses -= start_render_cache.misses
+        for worker_info in loader._perf_info.parse_workers:
+            render_cache.hits += worker_info.render_cache_hits
+            render_cache.misses += worker_info.render_cache_misses
+        loader._perf_info.render_cache = render_cache
         loader.track_project_load()
+        traced_load_all.end(
+            path_count=loader._perf_info.path_count,
+            is_partial_parse_enabled=loader._perf_info.is_partial_parse_enabled,
+        )
 
         if write_perf_info:
-            loader.write_perf_info(config.project_target_path)
+            with phase("write perf info"):
+                loader.write_perf_info(config.project_target_path)
 
         return manifest
 
     # This is where the main action happens
     def load(self) -> Manifest:
         start_read_files = time.perf_counter()
+        traced_read_files = start_phase("read files")
 
         # This updates the "files" dictionary in self.manifest, and creates
         # the partial_parser_files dictionary (see read_files.py),
@@ -356,6 +378,7 @@ class ManifestLoader:
                 all_projects=self.all_projects,
                 files=self.manifest.files,
                 saved_files=saved_files,
+                threads=getattr(get_flags(), "READ_FILES_THREADS", None) or 0,
             )
 
         # Set the files in the manifest and save the project_parser_files
@@ -364,6 +387,7 @@ class ManifestLoader:
         project_parser_files = orig_project_parser_files = file_reader.project_parser_files
         self._perf_info.path_count = len(self.manifest.files)
         self._perf_info.read_files_elapsed = time.perf_counter() - start_read_files
+        traced_read_files.end(path_count=self._perf_info.path_count)
 
         self.skip_parsing = False
         project_parser_files = self.safe_update_project_parser_files_partially(
@@ -376,11 +400,14 @@ class ManifestLoader:
         if self.skip_parsing:
             fire_event(PartialParsingSkipParsing())
         else:
+            load_deferred_contents(self.manifest.files, project_parser_files)
+
             # Load Macros and tests
             # We need to parse the macros first, so they're resolvable when
             # the other files are loaded.  Also need to parse tests, specifically
             # generic tests
             start_load_macros = time.perf_counter()
+            traced_load_macros = start_phase("load macros")
             self.load_and_parse_macros(project_parser_files)
 
             # If we're partially parsing check that certain macros have not been changed
@@ -395,13 +422,16 @@ class ManifestLoader:
                 self.manifest = self.new_manifest  # contains newly read files
                 project_parser_files = orig_project_parser_files
                 self.partially_parsing = False
+                load_deferred_contents(self.manifest.files, project_parser_files)
                 self.load_and_parse_macros(project_parser_files)
 
             self._perf_info.load_macros_elapsed = time.perf_counter() - start_load_macros
+            traced_load_macros.end()
 
             # Now that the macros are parsed, parse the rest of the files.
             # This is currently done on a per project basis.
             start_parse_projects = time.perf_counter()
+            traced_parse_projects = start_phase("parse projects")
 
             # Load the rest of the files except for schema yaml files
             parser_types: List[Type[Parser]] = [
@@ -414,12 +444,20 @@ class ManifestLoader:
                 HookParser,
                 FixtureParser,
             ]
-            for project in self.all_projects.values():
-                if project.project_name not in project_parser_files:
-                    continue
-                self.parse_project(
-                    project, project_parser_files[project.project_name], parser_types
-                )
+            # There's no point in more workers than cores, and a partial parse
+            # has too few files to be worth starting a process pool for.
+            parse_workers = min(
+                getattr(get_flags(), "PARSE_WORKERS", None) or 0, os.cpu_count() or 1
+            )
+            if parse_workers > 1 and not self.partially_parsing:
+                self.parse_projects_in_parallel(project_parser_files, parser_types, parse_workers)
+            else:
+                for project in self.all_projects.values():
+                    if project.project_name not in project_parser_files:
+                        continue
+                    self.parse_project(
+                        project, project_parser_files[project.project_name], parser_types
+                    )
 
             # Now that we've loaded most of the nodes (except for schema tests, sources, metrics)
             # load up the Lookup objects to resolve them by name, so the SourceFiles store
@@ -441,15 +479,18 @@ class ManifestLoader:
             self.cleanup_disabled()
 
             self._perf_info.parse_project_elapsed = time.perf_counter() - start_parse_projects
+            traced_parse_projects.end(partially_parsing=self.partially_parsing)
 
             # patch_sources converts the UnparsedSourceDefinitions in the
             # Manifest.sources to SourceDefinition via 'patch_source'
             # in SourcePatcher
             start_patch = time.perf_counter()
+            traced_patch = start_phase("patch sources")
             patcher = SourcePatcher(self.root_project, self.manifest)
             patcher.construct_sources()
             self.manifest.sources = patcher.sources
             self._perf_info.patch_sources_elapsed = time.perf_counter() - start_patch
+            traced_patch.end()
 
             # We need to rebuild disabled in order to include disabled sources
             self.manifest.rebuild_disabled_lookup()
@@ -467,10 +508,13 @@ class ManifestLoader:
             # These check the created_at time on the nodes to
             # determine whether they need processing.
             start_process = time.perf_counter()
+            traced_process = start_phase("process manifest")
             self.process_sources(self.root_project.project_name)
-            self.process_refs(self.root_project.project_name, self.root_project.dependencies)
+            with phase("process refs"):
+                self.process_refs(self.root_project.project_name, self.root_project.dependencies)
             self.process_unit_tests(self.root_project.project_name)
-            self.process_docs(self.root_project)
+            with phase("process docs"):
+                self.process_docs(self.root_project)
             self.process_metrics(self.root_project)
             self.process_saved_queries(self.root_project)
             self.process_model_inferred_primary_keys()
@@ -485,6 +529,7 @@ class ManifestLoader:
 
             # update tracking data
             self._perf_info.process_manifest_elapsed = time.perf_counter() - start_process
+            traced_process.end()
             self._perf_info.static_analysis_parsed_path_count = (
                 self.manifest._parsing_info.static_analysis_parsed_path_count
             )
@@ -508,9 +553,15 @@ class ManifestLoader:
                 )
                 # parent and child maps will be rebuilt by write_manifest
 
-        if not self.skip_parsing or external_nodes_modified:
+        # Also write it out when nothing changed but some files' stats did,
+        # so that those files aren't read again on the next invocation
+        file_stats_changed = (
+            self.partial_parser is not None and self.partial_parser.file_stats_changed
+        )
+        if not self.skip_parsing or external_nodes_modified or file_stats_changed:
             # write out the fully parsed manifest
-            self.write_manifest_for_partial_parse()
+            with phase("write partial parse file"):
+                self.write_manifest_for_partial_parse()
 
         self.check_for_model_deprecations()
         self.check_for_spaces_in_resource_names()
@@ -776,6 +827,102 @@ class ManifestLoader:
             self._perf_info.parsed_path_count + total_parsed_path_count
         )
 
+    # Parse the files for the non-schema parsers across a process pool. Each
+    # worker parses a shard of files against the already loaded macros, and the
+    # results are merged back in shard order so that the manifest is the same
+    # as one produced by parse_project.
+    def parse_projects_in_parallel(
+        self,
+        project_parser_files,
+        parser_types: List[Type[Parser]],
+        worker_count: int,
+    ) -> None:
+        parallel_types = {
+            parser_cls.__name__: parser_cls
+            for parser_cls in parser_types
+            if parser_cls.__name__ in PARALLEL_PARSER_NAMES
+        }
+        shards = build_parse_shards(
+            self.all_projects,
+            project_parser_files,
+            self.manifest.files,
+            list(parallel_types),
+            worker_count,
+        )
+        context = ParseWorkerContext(
+            root_project=self.root_project,
+            all_projects=self.all_projects,
+            macros=self.manifest.macros,
+            parser_types=parallel_types,
+        )
+
+        # Anything that can't be parsed by a worker is parsed here, along with
+        # the project hooks, once all of a project's shards are merged. That
+        # keeps the project -> parser order of a serial parse.
+        serial_types = [
+            parser_cls for parser_cls in parser_types if parser_cls.__name__ not in parallel_types
+        ]
+        project_names = [
+            project_name
+            for project_name in self.all_projects
+            if project_name in project_parser_files
+        ]
+        serial_parsed = 0
+
+        def parse_serial_types(project_name: str) -> None:
+            self.parse_project(
+                self.all_projects[project_name],
+                project_parser_files[project_name],
+                serial_types,
+            )
+
+        parser_infos: Dict[Tuple[str, str], ParserInfo] = {}
+        worker_infos: Dict[int, ParseWorkerInfo] = {}
+        for result in parse_shards_in_pool(context, shards, worker_count):
+            shard = shards[result.index]
+            while project_names[serial_parsed] != shard.project_name:
+                parse_serial_types(project_names[serial_parsed])
+                serial_parsed += 1
+            if result.error is not None:
+                # Re-parse in this process to raise the original exception
+                self.parse_project(
+                    self.all_projects[shard.project_name],
+                    {shard.parser_name: [source_file.file_id for source_file in shard.files]},
+                    [parallel_types[shard.parser_name]],
+                )
+                continue
+            merge_shard_result(self.manifest, result)
+
+            parsed_path_count = len(shard.files)
+            key = (shard.project_name, shard.parser_name)
+            if key not in parser_infos:
+                parser_infos[key] = ParserInfo(parser=result.resource_type, elapsed=0)
+                self._perf_info._project_index[shard.project_name].parsers.append(
+                    parser_infos[key]
+                )
+            parser_infos[key].elapsed += result.elapsed
+            parser_infos[key].parsed_path_count += parsed_path_count
+
+            if result.worker_id not in worker_infos:
+                worker_infos[result.worker_id] = ParseWorkerInfo(
+                    worker_id=result.worker_id, elapsed=0
+                )
+            worker_infos[result.worker_id].elapsed += result.elapsed
+            worker_infos[result.worker_id].shard_count += 1
+            worker_infos[result.worker_id].parsed_path_count += parsed_path_count
+            worker_infos[result.worker_id].render_cache_hits += result.render_cache_hits
+            worker_infos[result.worker_id].render_cache_misses += result.render_cache_misses
+
+            project_loader_info = self._perf_info._project_index[shard.project_name]
+            project_loader_info.elapsed += result.elapsed
+            project_loader_info.parsed_path_count += parsed_path_count
+            self._perf_info.parsed_path_count += parsed_path_count
+        self._perf_info.parse_workers = sorted(
+            worker_infos.values(), key=lambda info: info.worker_id
+        )
+        for project_name in project_names[serial_parsed:]:
+            parse_serial_types(project_name)
+
     # This should only be called after the macros have been loaded
     def build_macro_resolver(self):
         internal_package_names = get_adapter_package_names(self.root_project.credentials.type)
@@ -818,10 +965,9 @@ class ManifestLoader:
                     UnableToPartialParse(reason="saved manifest contained the wrong version")
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack(extended_mashumaro_encoder)
             make_directory(os.path.dirname(path))
             with open(path, "wb") as fp:
-                fp.write(manifest_msgpack)
+                write_partial_parse_file(fp, self.manifest)
         except Exception:
             raise
 
@@ -856,15 +1002,24 @@ class ManifestLoader:
         """Compare the global hashes of the read-in parse results' values to
         the known ones, and return if it is ok to re-use the results.
         """
+        return self.is_state_partial_parsable(manifest.metadata.dbt_version, manifest.state_check)
+
+    def is_state_partial_parsable(
+        self, dbt_version: str, state_check: ManifestStateCheck
+    ) -> Tuple[bool, Optional[str]]:
+        """Like is_partial_parsable, but only needs the dbt version and state
+        check of the saved manifest, which are available in the partial parse
+        file header without decoding the manifest.
+        """
         valid = True
         reparse_reason = None
 
-        if manifest.metadata.dbt_version != __version__:
+        if dbt_version != __version__:
             # #3757 log both versions because of reports of invalid cases of mismatch.
             fire_event(UnableToPartialParse(reason="of a version mismatch"))
             # If the version is wrong, the other checks might not work
             return False, ReparseReason.version_mismatch
-        if self.manifest.state_check.vars_hash != manifest.state_check.vars_hash:
+        if self.manifest.state_check.vars_hash != state_check.vars_hash:
             fire_event(
                 UnableToPartialParse(
                     reason="config vars, config profile, or config target have changed"
@@ -872,22 +1027,19 @@ class ManifestLoader:
             )
             fire_event(
                 Note(
-                    msg=f"previous checksum: {self.manifest.state_check.vars_hash.checksum}, current checksum: {manifest.state_check.vars_hash.checksum}"
+                    msg=f"previous checksum: {self.manifest.state_check.vars_hash.checksum}, current checksum: {state_check.vars_hash.checksum}"
                 ),
                 level=EventLevel.DEBUG,
             )
             valid = False
             reparse_reason = ReparseReason.vars_changed
-        if self.manifest.state_check.profile_hash != manifest.state_check.profile_hash:
+        if self.manifest.state_check.profile_hash != state_check.profile_hash:
             # Note: This should be made more granular. We shouldn't need to invalidate
             # partial parsing if a non-used profile section has changed.
             fire_event(UnableToPartialParse(reason="profile has changed"))
             valid = False
             reparse_reason = ReparseReason.profile_changed
-        if (
-            self.manifest.state_check.project_env_vars_hash
-            != manifest.state_check.project_env_vars_hash
-        ):
+        if self.manifest.state_check.project_env_vars_hash != state_check.project_env_vars_hash:
             fire_event(
                 UnableToPartialParse(reason="env vars used in dbt_project.yml have changed")
             )
@@ -897,7 +1049,7 @@ class ManifestLoader:
         missing_keys = {
             k
             for k in self.manifest.state_check.project_hashes
-            if k not in manifest.state_check.project_hashes
+            if k not in state_check.project_hashes
         }
         if missing_keys:
             fire_event(UnableToPartialParse(reason="a project dependency has been added"))
@@ -905,8 +1057,8 @@ class ManifestLoader:
             reparse_reason = ReparseReason.deps_changed
 
         for key, new_value in self.manifest.state_check.project_hashes.items():
-            if key in manifest.state_check.project_hashes:
-                old_value = manifest.state_check.project_hashes[key]
+            if key in state_check.project_hashes:
+                old_value = state_check.project_hashes[key]
                 if new_value != old_value:
                     fire_event(UnableToPartialParse(reason="a project config has changed"))
                     valid = False
@@ -943,14 +1095,25 @@ class ManifestLoader:
 
         if os.path.exists(path):
             try:
+                manifest: Optional[Manifest] = None
                 with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
-                # keep this check inside the try/except in case something about
-                # the file has changed in weird ways, perhaps due to being a
-                # different version of dbt
-                is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
-                if is_partial_parsable:
+                    if is_sectioned_partial_parse_file(fp):
+                        # Check the header before decoding any of the body
+                        with PartialParseFile(fp) as partial_parse_file:
+                            header = partial_parse_file.header
+                            is_partial_parsable, reparse_reason = self.is_state_partial_parsable(
+                                header.dbt_version, header.state_check
+                            )
+                            if is_partial_parsable:
+                                manifest = partial_parse_file.manifest()
+                    else:
+                        manifest_mp = fp.read()
+                        manifest = Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
+                        # keep this check inside the try/except in case something about
+                        # the file has changed in weird ways, perhaps due to being a
+                        # different version of dbt
+                        is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
+                if manifest is not None and is_partial_parsable:
                     # We don't want to have stale generated_at dates
                     manifest.metadata.generated_at = datetime.now(timezone.utc).replace(
                         tzinfo=None
@@ -2097,10 +2260,12 @@ def write_semantic_manifest(manifest: Manifest, target_path: str) -> None:
 def write_manifest(manifest: Manifest, target_path: str, which: Optional[str] = None):
     file_name = MANIFEST_FILE_NAME
     path = os.path.join(target_path, file_name)
-    manifest.write(path)
+    with phase("write manifest"):
+        manifest.write(path)
     add_artifact_produced(path)
 
-    write_semantic_manifest(manifest=manifest, target_path=target_path)
+    with phase("write semantic manifest"):
+        write_semantic_manifest(manifest=manifest, target_path=target_path)
 
 
 def parse_manifest(
@@ -2108,12 +2273,15 @@ def parse_manifest(
     write_perf_info: bool,
     write: bool,
     write_json: bool,
+    file_diff: Optional[FileDiff] = None,
 ) -> Manifest:
-    register_adapter(runtime_config, get_mp_context())
+    with phase("register adapter"):
+        register_adapter(runtime_config, get_mp_context())
     adapter = get_adapter(runtime_config)
     adapter.set_macro_context_generator(generate_runtime_macro_context)
     manifest = ManifestLoader.get_full_manifest(
         runtime_config,
+        file_diff=file_diff,
         write_perf_info=write_perf_info,
     )
 
@@ -0,0 +1,304 @@
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Mapping, MutableMapping, Optional, Type
+
+from dbt import deprecations
+from dbt.adapters.factory import get_adapter, load_plugin, register_adapter
+from dbt.clients.jinja import get_render_cache_info
+from dbt.config import RuntimeConfig
+from dbt.context.providers import generate_runtime_macro_context
+from dbt.contracts.files import AnySourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import (
+    Documentation,
+    GraphMemberNode,
+    Macro,
+    ManifestNode,
+    UnitTestFileFixture,
+)
+from dbt.events.logging import setup_event_logger
+from dbt.exceptions import DuplicateResourceNameError
+from dbt.flags import get_flags, set_flags
+from dbt.mp_context import get_mp_context
+from dbt.parser.base import Parser
+from dbt.parser.search import FileBlock
+from dbt_common.context import get_invocation_context, set_invocation_context
+from dbt_common.events.base_types import EventLevel, EventMsg
+from dbt_common.events.event_manager_client import get_event_manager
+
+# The parsers which only need the macros and their own files to do their work.
+# Schema files must still be parsed serially because they patch nodes from
+# every other file.
+PARALLEL_PARSER_NAMES = (
+    "ModelParser",
+    "SnapshotParser",
+    "AnalysisParser",
+    "SingularTestParser",
+    "SeedParser",
+    "DocumentationParser",
+    "FixtureParser",
+)
+
+# Each worker gets several shards so that one slow shard doesn't leave
+# the rest of the pool idle.
+SHARDS_PER_WORKER = 4
+
+# The deprecation each deprecation warning event is fired for
+_DEPRECATION_NAMES_BY_EVENT = {
+    deprecation._event: deprecation.name
+    for deprecation in deprecations.deprecations_list
+    if deprecation._event is not None
+}
+
+
+@dataclass
+class ParseShard:
+    index: int
+    project_name: str
+    parser_name: str
+    files: List[AnySourceFile]
+
+
+@dataclass
+class ParseShardResult:
+    index: int
+    worker_id: int
+    elapsed: float
+    resource_type: str = ""
+    files: Dict[str, AnySourceFile] = field(default_factory=dict)
+    nodes: List[ManifestNode] = field(default_factory=list)
+    disabled: List[GraphMemberNode] = field(default_factory=list)
+    docs: List[Documentation] = field(default_factory=list)
+    fixtures: List[UnitTestFileFixture] = field(default_factory=list)
+    env_vars: Dict[str, str] = field(default_factory=dict)
+    static_analysis_path_count: int = 0
+    static_analysis_parsed_path_count: int = 0
+    render_cache_hits: int = 0
+    render_cache_misses: int = 0
+    # The events fired and deprecations counted while parsing the shard in a
+    # worker, which the parent logs and counts as it merges the shard.
+    events: List[EventMsg] = field(default_factory=list)
+    deprecations: Dict[str, int] = field(default_factory=dict)
+    # Set when the shard raised. The caller re-parses the shard in-process
+    # so that the original exception is raised with its full context.
+    error: Optional[str] = None
+
+
+@dataclass
+class ParseWorkerContext:
+    root_project: RuntimeConfig
+    all_projects: Mapping[str, RuntimeConfig]
+    macros: MutableMapping[str, Macro]
+    parser_types: Dict[str, Type[Parser]]
+
+
+# Set by _init_worker in each process of the pool
+_WORKER_CONTEXT: Optional[ParseWorkerContext] = None
+_WORKER_INIT_ERROR: Optional[str] = None
+_WORKER_EVENTS: List[EventMsg] = []
+
+
+def build_parse_shards(
+    all_projects: Mapping[str, RuntimeConfig],
+    project_parser_files: Mapping[str, Mapping[str, List[str]]],
+    files: Mapping[str, AnySourceFile],
+    parser_names: List[str],
+    worker_count: int,
+) -> List[ParseShard]:
+    """Split the files for each project and parser into contiguous shards.
+
+    Shards are created in the same project -> parser -> file order that the
+    serial loader uses, so that merging the results in shard order produces
+    the same manifest as a serial parse.
+    """
+    total = 0
+    for project_files in project_parser_files.values():
+        for parser_name in parser_names:
+            total += len(project_files.get(parser_name, []))
+    if total == 0:
+        return []
+    shard_size = max(1, math.ceil(total / (worker_count * SHARDS_PER_WORKER)))
+
+    shards: List[ParseShard] = []
+    for project in all_projects.values():
+        if project.project_name not in project_parser_files:
+            continue
+        project_files = project_parser_files[project.project_name]
+        for parser_name in parser_names:
+            file_ids = project_files.get(parser_name, [])
+            for start in range(0, len(file_ids), shard_size):
+                shards.append(
+                    ParseShard(
+                        index=len(shards),
+                        project_name=project.project_name,
+                        parser_name=parser_name,
+                        files=[files[file_id] for file_id in file_ids[start : start + shard_size]],
+                    )
+                )
+    return shards
+
+
+def parse_shard(context: ParseWorkerContext, shard: ParseShard) -> ParseShardResult:
+    """Parse the files in a shard into a scratch manifest containing only the
+    macros and the shard's own files, and return everything the parsers added.
+    """
+    start = time.perf_counter()
+    start_render_cache = get_render_cache_info()
+    result = ParseShardResult(index=shard.index, worker_id=os.getpid(), elapsed=0.0)
+    manifest = Manifest(
+        macros=context.macros,
+        files={source_file.file_id: source_file for source_file in shard.files},
+    )
+    project = context.all_projects[shard.project_name]
+    parser: Parser = context.parser_types[shard.parser_name](
+        project, manifest, context.root_project
+    )
+    result.resource_type = parser.resource_type
+    try:
+        for source_file in shard.files:
+            parser.parse_file(FileBlock(source_file))
+    except Exception as exc:
+        result.error = str(exc)
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    result.files = dict(manifest.files)
+    result.nodes = list(manifest.nodes.values())
+    result.disabled = [node for nodes in manifest.disabled.values() for node in nodes]
+    result.docs = list(manifest.docs.values())
+    result.fixtures = list(manifest.fixtures.values())
+    result.env_vars = dict(manifest.env_vars)
+    result.static_analysis_path_count = manifest._parsing_info.static_analysis_path_count
+    result.static_analysis_parsed_path_count = (
+        manifest._parsing_info.static_analysis_parsed_path_count
+    )
+    render_cache = get_render_cache_info()
+    result.render_cache_hits = render_cache.hits - start_render_cache.hits
+    result.render_cache_misses = render_cache.misses - start_render_cache.misses
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def merge_shard_result(manifest: Manifest, result: ParseShardResult) -> None:
+    """Fold the output of a parsed shard into the real manifest. Duplicate
+    checks are the same ones the manifest applies during a serial parse.
+    """
+    manifest.files.update(result.files)
+    for node in result.nodes:
+        manifest.add_node_nofile(node)
+    for disabled in result.disabled:
+        manifest.add_disabled_nofile(disabled)
+    for doc in result.docs:
+        if doc.unique_id in manifest.docs:
+            raise DuplicateResourceNameError(doc, manifest.docs[doc.unique_id])
+        manifest.docs[doc.unique_id] = doc
+    for fixture in result.fixtures:
+        if fixture.unique_id in manifest.fixtures:
+            raise DuplicateResourceNameError(fixture, manifest.fixtures[fixture.unique_id])
+        manifest.fixtures[fixture.unique_id] = fixture
+    manifest.env_vars.update(result.env_vars)
+    manifest._parsing_info.static_analysis_path_count += result.static_analysis_path_count
+    manifest._parsing_info.static_analysis_parsed_path_count += (
+        result.static_analysis_parsed_path_count
+    )
+    _fire_worker_events(result.events)
+    for name, count in result.deprecations.items():
+        deprecations.active_deprecations[name] += count
+
+
+def _fire_worker_events(events: List[EventMsg]) -> None:
+    # Each worker warns about a deprecation the first time it sees it, so
+    # only the first of those warnings across all the workers is shown.
+    shown_deprecations = set(deprecations.active_deprecations)
+    show_all_deprecations = getattr(get_flags(), "show_all_deprecations", False)
+    event_manager = get_event_manager()
+    for msg in events:
+        deprecation = _DEPRECATION_NAMES_BY_EVENT.get(msg.info.name)
+        if deprecation is not None:
+            if deprecation in shown_deprecations and not show_all_deprecations:
+                continue
+            shown_deprecations.add(deprecation)
+        for logger in event_manager.loggers:
+            if logger.filter(msg):  # type: ignore
+                logger.write_line(msg)
+        for callback in event_manager.callbacks:
+            callback(msg)
+
+
+def _init_worker(
+    flags,
+    env: Dict[str, str],
+    active_deprecations: Dict[str, int],
+    context: ParseWorkerContext,
+) -> None:
+    # Worker processes are spawned, so nothing from the parent's globals is
+    # available. Recreate the bits of preflight that parsing depends on.
+    global _WORKER_CONTEXT, _WORKER_INIT_ERROR
+    try:
+        set_invocation_context(env)
+        set_flags(flags)
+        # Events are collected instead of logged, and handed back with each
+        # shard's result so the parent logs them and passes them to its
+        # callbacks in shard order.
+        setup_event_logger(flags=flags, callbacks=[_WORKER_EVENTS.append])
+        get_event_manager().loggers.clear()
+        deprecations.active_deprecations.update(active_deprecations)
+        load_plugin(context.root_project.credentials.type)
+        register_adapter(context.root_project, get_mp_context(), EventLevel.DEBUG)
+        adapter = get_adapter(context.root_project)
+        adapter.set_macro_context_generator(generate_runtime_macro_context)  # type: ignore[arg-type]
+        _WORKER_CONTEXT = context
+    except Exception as exc:
+        # An initializer that raises makes the pool respawn workers forever,
+        # so report the failure through the shard results instead.
+        _WORKER_INIT_ERROR = str(exc)
+
+
+def _parse_shard_in_worker(shard: ParseShard) -> ParseShardResult:
+    if _WORKER_CONTEXT is None:
+        return ParseShardResult(
+            index=shard.index, worker_id=os.getpid(), elapsed=0.0, error=_WORKER_INIT_ERROR
+        )
+    _WORKER_EVENTS.clear()
+    counts_before = dict(deprecations.active_deprecations)
+    result = parse_shard(_WORKER_CONTEXT, shard)
+    result.events = list(_WORKER_EVENTS)
+    result.deprecations = {
+        name: count - counts_before.get(name, 0)
+        for name, count in deprecations.active_deprecations.items()
+        if count != counts_before.get(name, 0)
+    }
+    return result
+
+
+def _invocation_env() -> Dict[str, str]:
+    invocation_context = get_invocation_context()
+    return {**invocation_context.env, **invocation_context.env_private}
+
+
+def parse_shards_in_pool(
+    context: ParseWorkerContext,
+    shards: List[ParseShard],
+    worker_count: int,
+) -> Iterator[ParseShardResult]:
+    """Parse shards across a process pool, yielding results in shard order."""
+    pool = get_mp_context().Pool(
+        processes=worker_count,
+        initializer=_init_worker,
+        initargs=(
+            get_flags(),
+            _invocation_env(),
+            dict(deprecations.active_deprecations),
+            context,
+        ),
+    )
+    try:
+        yield from pool.imap(_parse_shard_in_worker, shards)
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
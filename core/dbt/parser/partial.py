@@ -81,6 +81,7 @@ class PartialParsing:
             self.env_vars_changed_source_files,
             self.env_vars_changed_schema_files,
         ) = self.build_env_vars_to_files()
+        self.file_stats_changed = False
         self.build_file_diff()
         self.processing_file = None
         self.deleted_special_override_macro = False
@@ -122,6 +123,11 @@ class PartialParsing:
         for file_id in common:
             if self.saved_files[file_id].checksum == self.new_files[file_id].checksum:
                 unchanged.append(file_id)
+                # The saved file is kept, so record the stat it was checked
+                # with, so that it isn't read again next time (see read_files.py)
+                if self.saved_files[file_id].stat != self.new_files[file_id].stat:
+                    self.saved_files[file_id].stat = self.new_files[file_id].stat
+                    self.file_stats_changed = True
             else:
                 # separate out changed schema files
                 if self.saved_files[file_id].parse_file_type == ParseFileType.Schema:
@@ -267,6 +273,8 @@ class PartialParsing:
         # nodes, and update pp_files to parse unless the
         # file creating those nodes has also been deleted
         saved_source_file = self.saved_files[file_id]
+        # seed and fixture files may have rows cached for unit tests
+        self.saved_manifest.fixture_rows_cache.evict(file_id)
 
         # SQL file: models, seeds, snapshots, analyses, tests: SQL files, except
         # macros/tests
@@ -292,6 +300,7 @@ class PartialParsing:
     def update_in_saved(self, file_id):
         new_source_file = deepcopy(self.new_files[file_id])
         old_source_file = self.saved_files[file_id]
+        self.saved_manifest.fixture_rows_cache.evict(file_id)
 
         if new_source_file.parse_file_type in mssat_files:
             self.update_mssat_in_saved(new_source_file, old_source_file)
@@ -0,0 +1,157 @@
+"""Reading and writing the partial parse file.
+
+The file starts with a small prefix and a header holding everything that is
+needed to decide whether the saved manifest can be used at all (the dbt version
+and the ManifestStateCheck hashes). The body is the serialized manifest split
+into one msgpack blob per Manifest field. The body is memory-mapped, and a
+section is only decoded when it is asked for, so a partial parse file that will
+be rejected is never decoded.
+
+Files written by older versions of dbt are a single msgpack blob of the whole
+manifest and don't have the prefix; those are still readable.
+"""
+
+import mmap
+import struct
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import IO, Any, Dict, List, Optional
+
+import msgpack
+
+from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
+from dbt_common.dataclass_schema import dbtClassMixin
+
+MAGIC = b"DBTPP"
+FORMAT_VERSION = 1
+# magic, format version, header length
+_PREFIX = struct.Struct(">5sBI")
+
+
+def extended_mashumaro_encoder(data):
+    return msgpack.packb(data, default=extended_msgpack_encoder, use_bin_type=True)
+
+
+def extended_msgpack_encoder(obj):
+    if type(obj) is date:
+        date_bytes = msgpack.ExtType(1, obj.isoformat().encode())
+        return date_bytes
+    elif type(obj) is datetime:
+        datetime_bytes = msgpack.ExtType(2, obj.isoformat().encode())
+        return datetime_bytes
+
+    return obj
+
+
+def extended_mashumuro_decoder(data):
+    return msgpack.unpackb(data, ext_hook=extended_msgpack_decoder, raw=False)
+
+
+def extended_msgpack_decoder(code, data):
+    if code == 1:
+        d = date.fromisoformat(data.decode())
+        return d
+    elif code == 2:
+        dt = datetime.fromisoformat(data.decode())
+        return dt
+    else:
+        return msgpack.ExtType(code, data)
+
+
+@dataclass
+class PartialParseHeader(dbtClassMixin):
+    dbt_version: str
+    state_check: ManifestStateCheck
+    # section name -> [offset, length], relative to the start of the body
+    sections: Dict[str, List[int]] = field(default_factory=dict)
+
+
+def write_partial_parse_file(fp: IO[bytes], manifest: Manifest) -> None:
+    # An identity encoder gives us the msgpack dialect dict for the manifest,
+    # so each section is serialized exactly as Manifest.to_msgpack would.
+    manifest_dct: Dict[str, Any] = manifest.to_msgpack(encoder=lambda dct: dct)
+
+    sections: Dict[str, List[int]] = {}
+    blobs: List[bytes] = []
+    offset = 0
+    for name, value in manifest_dct.items():
+        blob = extended_mashumaro_encoder(value)
+        sections[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = PartialParseHeader(
+        dbt_version=manifest.metadata.dbt_version,
+        state_check=manifest.state_check,
+        sections=sections,
+    )
+    header_blob = extended_mashumaro_encoder(header.to_dict())
+    fp.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header_blob)))
+    fp.write(header_blob)
+    for blob in blobs:
+        fp.write(blob)
+
+
+def is_sectioned_partial_parse_file(fp: IO[bytes]) -> bool:
+    """Check for the sectioned format prefix, leaving fp at the start of the file."""
+    prefix = fp.read(_PREFIX.size)
+    fp.seek(0)
+    return (
+        isinstance(prefix, bytes)
+        and len(prefix) == _PREFIX.size
+        and _PREFIX.unpack(prefix)[0] == MAGIC
+    )
+
+
+class PartialParseFile:
+    """A memory-mapped sectioned partial parse file. The header is decoded
+    when the file is opened, and sections are decoded on first access.
+    """
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        self._mmap: Optional[mmap.mmap] = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, format_version, header_length = _PREFIX.unpack_from(self._mmap, 0)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported partial parse file format version {format_version}")
+        header_end = _PREFIX.size + header_length
+        self.header = PartialParseHeader.from_dict(
+            extended_mashumuro_decoder(self._mmap[_PREFIX.size : header_end])
+        )
+        self._body_start = header_end
+        self._decoded: Dict[str, Any] = {}
+
+    def __enter__(self) -> "PartialParseFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def section(self, name: str) -> Any:
+        if name not in self._decoded:
+            assert self._mmap is not None, "partial parse file is closed"
+            offset, length = self.header.sections[name]
+            start = self._body_start + offset
+            view = memoryview(self._mmap)[start : start + length]
+            try:
+                self._decoded[name] = extended_mashumuro_decoder(view)
+            finally:
+                view.release()
+        return self._decoded[name]
+
+    def manifest(self) -> Manifest:
+        manifest_dct = {name: self.section(name) for name in self.header.sections}
+        return Manifest.from_msgpack(manifest_dct, decoder=lambda dct: dct)  # type: ignore
+
+
+def read_manifest(fp: IO[bytes]) -> Manifest:
+    """Read the full manifest from a partial parse file in either format."""
+    if is_sectioned_partial_parse_file(fp):
+        with PartialParseFile(fp) as partial_parse_file:
+            return partial_parse_file.manifest()
+    return Manifest.from_msgpack(fp.read(), decoder=extended_mashumuro_decoder)  # type: ignore
@@ -1,7 +1,19 @@
 import os
 import pathlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, List, Mapping, MutableMapping, Optional, Protocol
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 import pathspec  # type: ignore
 
@@ -10,6 +22,7 @@ from dbt.contracts.files import (
     AnySourceFile,
     FileHash,
     FilePath,
+    FileStat,
     FixtureSourceFile,
     ParseFileType,
     SchemaSourceFile,
@@ -17,6 +30,7 @@ from dbt.contracts.files import (
 )
 from dbt.events.types import InputFileDiffError
 from dbt.exceptions import ParsingError
+from dbt.flags import get_flags
 from dbt.parser.common import schema_file_keys
 from dbt.parser.schemas import yaml_from_file
 from dbt.parser.search import filesystem_search
@@ -41,12 +55,41 @@ class FileDiff(dbtClassMixin):
     added: List[InputFile]
 
 
+def get_unchanged_saved_file(source_file: AnySourceFile, saved_files) -> Optional[AnySourceFile]:
+    """Return the saved version of source_file if the file on disk is known
+    to be unchanged since it was saved, so that it doesn't need to be read
+    or hashed again. Files are compared by path, mtime, size and inode,
+    unless the partial_parse_verify_checksums flag is set.
+    """
+    if not saved_files or source_file.file_id not in saved_files:
+        return None
+    if getattr(get_flags(), "PARTIAL_PARSE_VERIFY_CHECKSUMS", False):
+        return None
+    saved_file = saved_files[source_file.file_id]
+    if (
+        source_file.stat is not None
+        and saved_file.stat == source_file.stat
+        and saved_file.path.absolute_path == source_file.path.absolute_path
+    ):
+        return saved_file
+    # Partial parse files saved before file stats were recorded
+    if (
+        saved_file.stat is None
+        and source_file.parse_file_type == ParseFileType.Schema
+        and source_file.path.modification_time != 0.0
+        and saved_file.path.modification_time == source_file.path.modification_time
+    ):
+        return saved_file
+    return None
+
+
 # This loads the files contents and creates the SourceFile object
 def load_source_file(
     path: FilePath,
     parse_file_type: ParseFileType,
     project_name: str,
     saved_files,
+    stat: Optional[FileStat] = None,
 ) -> Optional[AnySourceFile]:
 
     if parse_file_type == ParseFileType.Schema:
@@ -61,24 +104,17 @@ def load_source_file(
         checksum=FileHash.empty(),
         parse_file_type=parse_file_type,
         project_name=project_name,
+        stat=stat or FileStat.from_path(path.absolute_path),
     )
 
-    skip_loading_schema_file = False
-    if (
-        parse_file_type == ParseFileType.Schema
-        and saved_files
-        and source_file.file_id in saved_files
-    ):
-        old_source_file = saved_files[source_file.file_id]
-        if (
-            source_file.path.modification_time != 0.0
-            and old_source_file.path.modification_time == source_file.path.modification_time
-        ):
-            source_file.checksum = old_source_file.checksum
-            source_file.dfy = old_source_file.dfy
-            skip_loading_schema_file = True
-
-    if not skip_loading_schema_file:
+    saved_file = get_unchanged_saved_file(source_file, saved_files)
+    if saved_file:
+        # The contents are left unset, and are only read if the file ends up
+        # being parsed (see load_deferred_contents)
+        source_file.checksum = saved_file.checksum
+        if isinstance(source_file, SchemaSourceFile):
+            source_file.dfy = saved_file.dfy  # type: ignore[union-attr]
+    else:
         # We strip the file_contents before generating the checksum because we want
         # the checksum to match the stored file contents
         file_contents = load_file_contents(path.absolute_path, strip=True)
@@ -93,6 +129,24 @@ def load_source_file(
     return source_file
 
 
+def load_deferred_contents(files: Mapping[str, AnySourceFile], project_parser_files) -> None:
+    """Read the contents of the files that are about to be parsed, for the
+    ones whose contents weren't read because they were unchanged.
+    """
+    for parser_files in project_parser_files.values():
+        for file_ids in parser_files.values():
+            for file_id in file_ids:
+                source_file = files[file_id]
+                if (
+                    source_file.contents is None
+                    and isinstance(source_file.path, FilePath)
+                    and source_file.parse_file_type != ParseFileType.Schema
+                ):
+                    source_file.contents = load_file_contents(
+                        source_file.path.absolute_path, strip=True
+                    )
+
+
 # Do some minimal validation of the yaml in a schema file.
 # Check version, that key values are lists and that each element in
 # the lists has a 'name' key
@@ -122,20 +176,40 @@ def validate_yaml(file_path, dct):
 
 
 # Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
+def load_seed_source_file(
+    match: FilePath, project_name, saved_files=None, stat: Optional[FileStat] = None
+) -> SourceFile:
     if match.seed_too_large():
         # We don't want to calculate a hash of this file. Use the path.
         source_file = SourceFile.big_seed(match)
     else:
-        file_contents = load_file_contents(match.absolute_path, strip=True)
-        checksum = FileHash.from_contents(file_contents)
-        source_file = SourceFile(path=match, checksum=checksum)
+        source_file = SourceFile(
+            path=match,
+            checksum=FileHash.empty(),
+            parse_file_type=ParseFileType.Seed,
+            project_name=project_name,
+            stat=stat or FileStat.from_path(match.absolute_path),
+        )
+        saved_file = get_unchanged_saved_file(source_file, saved_files)
+        if saved_file:
+            source_file.checksum = saved_file.checksum
+        else:
+            file_contents = load_file_contents(match.absolute_path, strip=True)
+            source_file.checksum = FileHash.from_contents(file_contents)
         source_file.contents = ""
     source_file.parse_file_type = ParseFileType.Seed
     source_file.project_name = project_name
     return source_file
 
 
+# singular tests live in /tests but only generic tests live
+# in /tests/generic and fixtures in /tests/fixture so we want to skip those
+def is_excluded_singular_test(fp: FilePath, parse_file_type: ParseFileType) -> bool:
+    if parse_file_type != ParseFileType.SingularTest:
+        return False
+    return pathlib.Path(fp.relative_path).parts[0] in ["generic", "fixtures"]
+
+
 # Use the FilesystemSearcher to get a bunch of FilePaths, then turn
 # them into a bunch of FileSource objects
 def get_source_files(project, paths, extension, parse_file_type, saved_files, ignore_spec):
@@ -145,14 +219,10 @@ def get_source_files(project, paths, extension, parse_file_type, saved_files, ig
     fb_list = []
     for fp in fp_list:
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
-        # singular tests live in /tests but only generic tests live
-        # in /tests/generic and fixtures in /tests/fixture so we want to skip those
+            fb_list.append(load_seed_source_file(fp, project.project_name, saved_files))
         else:
-            if parse_file_type == ParseFileType.SingularTest:
-                path = pathlib.Path(fp.relative_path)
-                if path.parts[0] in ["generic", "fixtures"]:
-                    continue
+            if is_excluded_singular_test(fp, parse_file_type):
+                continue
             file = load_source_file(fp, parse_file_type, project.project_name, saved_files)
             # only append the list if it has contents. added to fix #3568
             if file:
@@ -183,6 +253,35 @@ def generate_dbt_ignore_spec(project_root):
     return ignore_spec
 
 
+# The most file contents that ReadFilesFromFileSystem.read_files_concurrently
+# will hold in flight (being read and loaded) at once.
+READ_FILES_BYTE_BUDGET = 64 * 1024 * 1024
+
+
+class ByteBudget:
+    """Limits the total size of the files being loaded at once. A file larger
+    than the whole budget waits for everything else to finish.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def reserve(self, size: int) -> Iterator[None]:
+        size = min(size, self.limit)
+        with self._condition:
+            self._condition.wait_for(lambda: self.in_flight + size <= self.limit)
+            self.in_flight += size
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.in_flight -= size
+                self._condition.notify_all()
+
+
 # Protocol for the ReadFiles... classes
 class ReadFiles(Protocol):
     files: MutableMapping[str, AnySourceFile]
@@ -196,7 +295,7 @@ class ReadFiles(Protocol):
 class ReadFilesFromFileSystem:
     all_projects: Mapping[str, Project]
     files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
-    # saved_files is only used to compare schema files
+    # saved_files is used to skip reading files that haven't changed
     saved_files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
     # project_parser_files = {
     #   "my_project": {
@@ -206,11 +305,72 @@ class ReadFilesFromFileSystem:
     #
     project_parser_files: Dict = field(default_factory=dict)
 
+    # The number of threads used to find and load files. Files are read
+    # serially unless this is greater than 1.
+    threads: int = 0
+
     def read_files(self):
+        if self.threads > 1:
+            self.read_files_concurrently()
+            return
         for project in self.all_projects.values():
             file_types = get_file_types_for_project(project)
             self.read_files_for_project(project, file_types)
 
+    def read_files_concurrently(self):
+        """Read the same files as read_files, overlapping the directory walks
+        and file loads (including yaml loading) in a thread pool. The results
+        are collected in the order read_files would produce them.
+        """
+        budget = ByteBudget(READ_FILES_BYTE_BUDGET)
+        with ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="read-files"
+        ) as executor:
+            # Start walking the directories of every project and file type
+            searches: List[Tuple[Project, ParseFileType, str, Future]] = []
+            for project in self.all_projects.values():
+                dbt_ignore_spec = generate_dbt_ignore_spec(project.project_root)
+                for parse_ft, file_type_info in get_file_types_for_project(project).items():
+                    for extension in file_type_info["extensions"]:
+                        search = executor.submit(
+                            filesystem_search,
+                            project,
+                            file_type_info["paths"],
+                            extension,
+                            dbt_ignore_spec,
+                        )
+                        searches.append((project, parse_ft, file_type_info["parser"], search))
+
+            # Load the files found by each walk, in walk order
+            loads: List[Tuple[Project, str, List[Future]]] = []
+            for project, parse_ft, parser, search in searches:
+                file_loads = [
+                    executor.submit(self._load_file, fp, parse_ft, project.project_name, budget)
+                    for fp in search.result()
+                    if not is_excluded_singular_test(fp, parse_ft)
+                ]
+                loads.append((project, parser, file_loads))
+
+            for project in self.all_projects.values():
+                self.project_parser_files[project.project_name] = {}
+            for project, parser, file_loads in loads:
+                project_files = self.project_parser_files[project.project_name]
+                parser_files = project_files.setdefault(parser, [])
+                for file_load in file_loads:
+                    source_file = file_load.result()
+                    if source_file:
+                        self.files[source_file.file_id] = source_file
+                        parser_files.append(source_file.file_id)
+
+    def _load_file(
+        self, fp: FilePath, parse_ft: ParseFileType, project_name: str, budget: "ByteBudget"
+    ) -> Optional[AnySourceFile]:
+        stat = FileStat.from_path(fp.absolute_path)
+        with budget.reserve(stat.size):
+            if parse_ft == ParseFileType.Seed:
+                return load_seed_source_file(fp, project_name, self.saved_files, stat)
+            return load_source_file(fp, parse_ft, project_name, self.saved_files, stat)
+
     def read_files_for_project(self, project, file_types):
         dbt_ignore_spec = generate_dbt_ignore_spec(project.project_root)
         project_files = self.project_parser_files[project.project_name] = {}
@@ -254,6 +414,7 @@ class ReadFilesFromDiff:
                 project_name=source_file.project_name,
                 parse_file_type=source_file.parse_file_type,
                 contents=source_file.contents,
+                stat=source_file.stat,
             )
             self.files[file_id] = new_source_file
 
@@ -279,6 +440,7 @@ class ReadFilesFromDiff:
                 source_file.contents = input_file.content
                 source_file.checksum = FileHash.from_contents(input_file.content)
                 source_file.path.modification_time = input_file.modification_time
+                source_file.stat = None
                 # Handle creation of dictionary version of schema file content
                 if isinstance(source_file, SchemaSourceFile) and source_file.contents:
                     dfy = yaml_from_file(source_file)
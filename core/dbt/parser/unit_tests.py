@@ -373,16 +373,13 @@ class UnitTestParser(YamlReader):
                 )
 
             if ut_fixture.fixture:
-                csv_rows = self.get_fixture_file_rows(
+                ut_fixture.rows = self.get_csv_fixture_file_rows(
                     ut_fixture.fixture, self.project.project_name, unit_test_definition.unique_id
                 )
             else:
-                csv_rows = self._convert_csv_to_list_of_dicts(ut_fixture.rows)
-
-            # Empty values (e.g. ,,) in a csv fixture should default to null, not ""
-            ut_fixture.rows = [
-                {k: (None if v == "" else v) for k, v in row.items()} for row in csv_rows
-            ]
+                ut_fixture.rows = self._convert_empty_values_to_null(
+                    self._convert_csv_to_list_of_dicts(ut_fixture.rows)
+                )
 
         elif ut_fixture.format == UnitTestFormat.SQL:
             if not (isinstance(ut_fixture.rows, str) or isinstance(ut_fixture.fixture, str)):
@@ -441,6 +438,23 @@ class UnitTestParser(YamlReader):
         fixture_source_file.unit_tests.append(utdef_unique_id)
         return fixture.rows
 
+    def get_csv_fixture_file_rows(
+        self, fixture_name, project_name, utdef_unique_id
+    ) -> List[Dict[str, Any]]:
+        fixture = self._get_fixture(fixture_name, project_name)
+        fixture_source_file = self.manifest.files[fixture.file_id]
+        fixture_source_file.unit_tests.append(utdef_unique_id)
+        # The rows of a fixture file are converted once and shared by every unit test using it
+        return self.manifest.fixture_rows_cache.get_rows(
+            fixture.file_id,
+            fixture_source_file.checksum.checksum,
+            lambda: self._convert_empty_values_to_null(fixture.rows),
+        )
+
+    def _convert_empty_values_to_null(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Empty values (e.g. ,,) in a csv fixture should default to null, not ""
+        return [{k: (None if v == "" else v) for k, v in row.items()} for row in rows]
+
     def _convert_csv_to_list_of_dicts(self, csv_string: str) -> List[Dict[str, Any]]:
         dummy_file = StringIO(csv_string)
         reader = csv.DictReader(dummy_file)
@@ -453,8 +467,6 @@ class UnitTestParser(YamlReader):
         """Read rows from seed file on disk if not specified in YAML config. If seed file doesn't exist, return empty list."""
         ref = py_extract_from_source("{{ " + ref_str + " }}")["refs"][0]
 
-        rows: List[Dict[str, Any]] = []
-
         seed_name = ref["name"]
         package_name = ref.get("package", self.project.project_name)
 
@@ -472,11 +484,22 @@ class UnitTestParser(YamlReader):
                 )
 
         seed_path = Path(self.project.project_root) / seed_node.original_file_path
-        with open(seed_path, "r") as f:
-            for row in DictReader(f):
-                rows.append(row)
 
-        return rows
+        def read_seed_rows() -> List[Dict[str, Any]]:
+            rows: List[Dict[str, Any]] = []
+            with open(seed_path, "r") as f:
+                for row in DictReader(f):
+                    rows.append(row)
+            return rows
+
+        # Seeds too large to hash have a checksum of their path, which doesn't change
+        # with their contents, so those are read again each time
+        seed_file = self.manifest.files.get(seed_node.file_id)
+        if seed_file is None or seed_file.checksum.name == "path":
+            return read_seed_rows()
+        return self.manifest.fixture_rows_cache.get_rows(
+            seed_node.file_id, seed_file.checksum.checksum, read_seed_rows
+        )
 
 
 def find_tested_model_node(
@@ -43,6 +43,7 @@ from dbt.flags import get_flags
 from dbt.graph import Graph
 from dbt.task import group_lookup
 from dbt.task.printer import print_run_result_error
+from dbt.tracing import phase
 from dbt_common.events.contextvars import get_node_info
 from dbt_common.events.functions import fire_event
 from dbt_common.exceptions import DbtInternalError, DbtRuntimeError, NotImplementedError
@@ -132,7 +133,8 @@ class ConfiguredTask(BaseTask):
 
         start_compile_manifest = time.perf_counter()
 
-        self.graph = self.compiler.compile(self.manifest)
+        with phase("link graph"):
+            self.graph = self.compiler.compile(self.manifest)
 
         compile_time = time.perf_counter() - start_compile_manifest
         if dbt.tracking.active_user is not None:
@@ -292,7 +294,9 @@ class BaseRunner(metaclass=ABCMeta):
                     node_info=ctx.node.node_info,
                 )
             )
-            with collect_timing_info("compile", ctx.timing.append):
+            with collect_timing_info("compile", ctx.timing.append), phase(
+                "compile", node=self.node.unique_id
+            ):
                 # if we fail here, we still have a compiled node to return
                 # this has the benefit of showing a build path for the errant
                 # model.  This calls the 'compile' method in CompileTask
@@ -306,7 +310,9 @@ class BaseRunner(metaclass=ABCMeta):
                         node_info=ctx.node.node_info,
                     )
                 )
-                with collect_timing_info("execute", ctx.timing.append):
+                with collect_timing_info("execute", ctx.timing.append), phase(
+                    "execute", node=self.node.unique_id
+                ):
                     result = self.run(ctx.node, manifest)
                     ctx.node = result.node
 
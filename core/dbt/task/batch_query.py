@@ -0,0 +1,50 @@
+import threading
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+from dbt_common.events.base_types import EventLevel
+from dbt_common.events.functions import fire_event
+from dbt_common.events.types import Note
+from dbt_common.exceptions import DbtBaseException
+
+Node = TypeVar("Node")
+Result = TypeVar("Result")
+
+
+class BatchQuery(Generic[Node, Result]):
+    """The results of running several tests in one query. The first test to
+    ask for its result runs the query for all of them, and if it fails, each
+    test runs on its own instead.
+    """
+
+    def __init__(self, description: str) -> None:
+        # what the query runs, e.g. "the data tests of model.pkg.model_a"
+        self.description = description
+        self._lock = threading.Lock()
+        self._results: Optional[Dict[str, Result]] = None
+
+    def get_result(
+        self,
+        unique_id: str,
+        get_nodes: Callable[[], List[Node]],
+        execute: Callable[[List[Node]], Dict[str, Result]],
+    ) -> Optional[Result]:
+        """Return the result of a test from the batch query, running the query
+        for the nodes from get_nodes on first use. None means the test must run
+        on its own."""
+        with self._lock:
+            if self._results is None:
+                self._results = {}
+                nodes = get_nodes()
+                # a single test is run on its own as usual
+                if len(nodes) > 1:
+                    try:
+                        self._results = execute(nodes)
+                    except DbtBaseException as exc:
+                        fire_event(
+                            Note(
+                                msg=f"Running {self.description} one at a time, "
+                                f"the batch query failed: {exc}"
+                            ),
+                            level=EventLevel.DEBUG,
+                        )
+        return self._results.get(unique_id)
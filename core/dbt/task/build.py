@@ -1,6 +1,7 @@
-from typing import Dict, List, Optional, Set, Type
+from typing import AbstractSet, Dict, List, Optional, Set, Type
 
-from dbt.artifacts.schemas.results import NodeStatus
+from dbt.adapters.base import BaseAdapter
+from dbt.artifacts.schemas.results import NodeStatus, RunStatus
 from dbt.artifacts.schemas.run import RunResult
 from dbt.cli.flags import Flags
 from dbt.config.runtime import RuntimeConfig
@@ -10,6 +11,7 @@ from dbt.graph import Graph, GraphQueue, ResourceTypeSelector
 from dbt.node_types import NodeType
 from dbt.runners import ExposureRunner as exposure_runner
 from dbt.runners import SavedQueryRunner as saved_query_runner
+from dbt.task import data_test_batches, unit_test_batches
 from dbt.task.base import BaseRunner, resource_types_from_args
 from dbt.task.run import MicrobatchModelRunner
 
@@ -87,6 +89,12 @@ class BuildTask(RunTask):
         # in the node_selector (filter_selection).
         return selector_wo_unit_tests.get_graph_queue(spec)
 
+    def before_run(self, adapter: BaseAdapter, selected_uids: AbstractSet[str]) -> RunStatus:
+        # unit tests are not in the graph queue, so they are not in selected_uids
+        unit_test_batches.init(self.manifest, self.selected_unit_tests)
+        data_test_batches.init(self.manifest, selected_uids)
+        return super().before_run(adapter, selected_uids)
+
     # overrides handle_job_queue in runnable.py
     def handle_job_queue(self, pool, callback):
         if self.run_count == 0:
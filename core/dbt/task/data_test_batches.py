@@ -0,0 +1,127 @@
+import copy
+import dataclasses
+import json
+from typing import TYPE_CHECKING, AbstractSet, Callable, Dict, List, Optional
+
+from dbt.artifacts.resources import TestConfig
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import GenericTestNode
+from dbt.flags import get_flags
+from dbt.task.batch_query import BatchQuery
+
+if TYPE_CHECKING:
+    from dbt.compilation import Compiler
+    from dbt.task.test import TestResultData
+
+
+DataTestResults = Dict[str, "TestResultData"]
+
+_data_test_id_to_batch_map: Dict[str, "DataTestBatch"] = {}
+
+_TEST_CONFIG_FIELDS = frozenset(field.name for field in dataclasses.fields(TestConfig))
+
+
+class DataTestBatch:
+    """The selected generic tests of one model that can share a query. The
+    first of them to run compiles the others, and runs them all in one query
+    returning the failure count of each test.
+    """
+
+    def __init__(self, attached_node: str, data_test_ids: List[str]) -> None:
+        self.attached_node = attached_node
+        self.data_test_ids = data_test_ids
+        self._batch_query: BatchQuery[GenericTestNode, "TestResultData"] = BatchQuery(
+            f"the data tests of {attached_node}"
+        )
+
+    def get_result(
+        self,
+        data_test: GenericTestNode,
+        manifest: Manifest,
+        compiler: "Compiler",
+        execute: Callable[[List[GenericTestNode], Manifest], DataTestResults],
+    ) -> Optional["TestResultData"]:
+        """Return the result of a test from the batch query, running it on
+        first use. None means the test must run on its own."""
+        return self._batch_query.get_result(
+            data_test.unique_id,
+            lambda: self._compile(data_test, manifest, compiler),
+            lambda nodes: execute(nodes, manifest),
+        )
+
+    def _compile(
+        self, data_test: GenericTestNode, manifest: Manifest, compiler: "Compiler"
+    ) -> List[GenericTestNode]:
+        # The other tests are compiled again by their own runners, so they are
+        # compiled here as copies, leaving the manifest's nodes untouched. A test
+        # that fails to compile is left out, to fail on its own.
+        nodes = []
+        for unique_id in self.data_test_ids:
+            if unique_id == data_test.unique_id:
+                nodes.append(data_test)
+                continue
+            try:
+                node = compiler.compile_node(
+                    copy.deepcopy(manifest.nodes[unique_id]), manifest, {}, write=False
+                )
+            except Exception:
+                continue
+            assert isinstance(node, GenericTestNode)
+            nodes.append(node)
+        return nodes
+
+
+def can_batch(data_test: GenericTestNode) -> bool:
+    # Tests that store their failures create a table with the materialization,
+    # and tests on several nodes may be ready to run before the others of their
+    # model when building.
+    store_failures = data_test.config.store_failures
+    if store_failures is None:
+        store_failures = getattr(get_flags(), "STORE_FAILURES", False)
+    return (
+        not store_failures
+        and data_test.get_materialization() == "test"
+        and data_test.depends_on.nodes == [data_test.attached_node]
+    )
+
+
+def _batch_key(data_test: GenericTestNode) -> str:
+    # Adapter-specific configs, like the warehouse to run in, apply to the whole
+    # query, so only tests that agree on them are batched together.
+    extra_config = {
+        key: value
+        for key, value in data_test.config.to_dict(omit_none=True).items()
+        if key not in _TEST_CONFIG_FIELDS
+    }
+    return json.dumps([data_test.attached_node, extra_config], sort_keys=True, default=str)
+
+
+def init(manifest: Optional[Manifest], selected_ids: AbstractSet[str]) -> None:
+    _data_test_id_to_batch_map.clear()
+    if not manifest or not getattr(get_flags(), "DATA_TEST_BATCHING", False):
+        return
+
+    data_test_ids_by_key: Dict[str, List[str]] = {}
+    attached_nodes: Dict[str, str] = {}
+    for unique_id in sorted(selected_ids):
+        data_test = manifest.nodes.get(unique_id)
+        if (
+            not isinstance(data_test, GenericTestNode)
+            or data_test.attached_node is None
+            or not can_batch(data_test)
+        ):
+            continue
+        key = _batch_key(data_test)
+        data_test_ids_by_key.setdefault(key, []).append(unique_id)
+        attached_nodes[key] = data_test.attached_node
+
+    for key, data_test_ids in data_test_ids_by_key.items():
+        if len(data_test_ids) < 2:
+            continue
+        batch = DataTestBatch(attached_nodes[key], data_test_ids)
+        for unique_id in data_test_ids:
+            _data_test_id_to_batch_map[unique_id] = batch
+
+
+def get(unique_id: str) -> Optional[DataTestBatch]:
+    return _data_test_id_to_batch_map.get(unique_id)
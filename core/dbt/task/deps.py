@@ -1,4 +1,5 @@
 import json
+import os
 from hashlib import sha1
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -11,9 +12,15 @@ import dbt.utils
 from dbt.config import Project
 from dbt.config.project import load_yml_dict, package_config_from_data
 from dbt.config.renderer import PackageRenderer
-from dbt.constants import PACKAGE_LOCK_FILE_NAME, PACKAGE_LOCK_HASH_KEY
+from dbt.constants import (
+    PACKAGE_LOCK_FILE_NAME,
+    PACKAGE_LOCK_HASH_KEY,
+    PACKAGES_INSTALLED_FILE_NAME,
+)
 from dbt.contracts.project import PackageSpec
-from dbt.deps.base import downloads_directory
+from dbt.deps.base import PinnedPackage, downloads_directory, map_packages
+from dbt.deps.cache import PackageCache
+from dbt.deps.local import LocalPinnedPackage
 from dbt.deps.registry import RegistryPinnedPackage
 from dbt.deps.resolver import resolve_lock_packages, resolve_packages
 from dbt.events.types import (
@@ -30,8 +37,9 @@ from dbt.events.types import (
 )
 from dbt.task.base import BaseTask, move_to_nearest_project_dir
 from dbt_common.clients import system
+from dbt_common.events.base_types import EventLevel
 from dbt_common.events.functions import fire_event
-from dbt_common.events.types import Formatting
+from dbt_common.events.types import Formatting, Note
 
 
 class dbtPackageDumper(yaml.Dumper):
@@ -97,6 +105,9 @@ class DepsTask(BaseTask):
         project.project_root = str(Path(project.project_root).resolve())
         self.project = project
         self.cli_vars = args.vars
+        self.threads: int = getattr(args, "deps_threads", None) or 1
+        cache_dir = getattr(args, "packages_cache_dir", None)
+        self.cache: Optional[PackageCache] = PackageCache(cache_dir) if cache_dir else None
 
     def track_package_install(
         self, package_name: str, source_type: str, version: Optional[str]
@@ -184,7 +195,9 @@ class DepsTask(BaseTask):
             return
 
         with downloads_directory():
-            resolved_deps = resolve_packages(packages, self.project, self.cli_vars)
+            resolved_deps = resolve_packages(
+                packages, self.project, self.cli_vars, threads=self.threads
+            )
 
         # this loop is to create the package-lock.yml in the same format as original packages.yml
         # package-lock.yml includes both the stated packages in packages.yml along with dependent packages
@@ -227,6 +240,11 @@ class DepsTask(BaseTask):
         if self.args.lock:
             return
 
+        lock_sha1 = sha1(system.load_file_contents(lock_file_path).encode("utf-8")).hexdigest()
+        if self.is_installed(lock_sha1):
+            fire_event(Note(msg=f"Packages in {PACKAGE_LOCK_FILE_NAME} are already installed"))
+            return
+
         if system.path_exists(self.project.packages_install_path):
             system.rmtree(self.project.packages_install_path)
 
@@ -244,18 +262,26 @@ class DepsTask(BaseTask):
             return
 
         with downloads_directory():
-            lock_defined_deps = resolve_lock_packages(packages_lock_config)
+            lock_defined_deps = resolve_lock_packages(packages_lock_config, self.cache)
             renderer = PackageRenderer(self.cli_vars)
 
             packages_to_upgrade = []
-
+            installed_paths = []
+
+            # Packages install into their own directories, so they can be installed
+            # concurrently. Events are still fired in the order of the lock file.
+            installs = map_packages(
+                lambda package: self.install_package(package, renderer),
+                lock_defined_deps,
+                self.threads,
+            )
             for package in lock_defined_deps:
                 package_name = package.name
                 source_type = package.source_type()
                 version = package.get_version()
 
                 fire_event(DepsStartPackageInstall(package_name=package_name))
-                package.install(self.project, renderer)
+                installed_paths.append(next(installs))
 
                 fire_event(DepsInstallInfo(version_name=package.nice_version_name()))
 
@@ -278,3 +304,56 @@ class DepsTask(BaseTask):
             if packages_to_upgrade:
                 fire_event(Formatting(""))
                 fire_event(DepsNotifyUpdatesAvailable(packages=packages_to_upgrade))
+
+        # local packages that had to be copied rather than symlinked go stale, so
+        # they are installed again every time
+        if not any(
+            isinstance(package, LocalPinnedPackage) and not system.path_is_symlink(path)
+            for package, path in zip(lock_defined_deps, installed_paths)
+        ):
+            self.write_installed(lock_sha1, installed_paths)
+
+    def install_package(self, package: PinnedPackage, renderer: PackageRenderer) -> str:
+        """Install the package, from the package cache when it's there, and return
+        its installation path."""
+        if self.cache is not None:
+            project_name = self.cache.install(package, self.project.packages_install_path)
+            if project_name is not None:
+                fire_event(
+                    Note(msg=f"Installed {package.name} from the package cache"),
+                    level=EventLevel.DEBUG,
+                )
+                return os.path.join(self.project.packages_install_path, project_name)
+
+        package.install(self.project, renderer)
+        installed_path = package.get_installation_path(self.project, renderer)
+        if self.cache is not None:
+            self.cache.add(package, installed_path)
+        return installed_path
+
+    def is_installed(self, lock_sha1: str) -> bool:
+        """Whether the packages of the lock file with this hash are the ones
+        installed by the last run of deps, and are all still there."""
+        installed_file_path = os.path.join(
+            self.project.packages_install_path, PACKAGES_INSTALLED_FILE_NAME
+        )
+        if not system.path_exists(installed_file_path):
+            return False
+        try:
+            installed = json.loads(system.load_file_contents(installed_file_path))
+        except ValueError:
+            return False
+        return installed.get(PACKAGE_LOCK_HASH_KEY) == lock_sha1 and all(
+            os.path.isdir(os.path.join(self.project.packages_install_path, name))
+            for name in installed.get("packages", [])
+        )
+
+    def write_installed(self, lock_sha1: str, installed_paths: List[str]) -> None:
+        installed = {
+            PACKAGE_LOCK_HASH_KEY: lock_sha1,
+            "packages": [os.path.basename(path) for path in installed_paths],
+        }
+        system.write_file(
+            os.path.join(self.project.packages_install_path, PACKAGES_INSTALLED_FILE_NAME),
+            json.dumps(installed),
+        )
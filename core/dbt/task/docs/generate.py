@@ -1,8 +1,11 @@
+import importlib.util
 import os
 import shutil
+import sys
 from dataclasses import replace
 from datetime import datetime, timezone
 from itertools import chain
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import agate
@@ -30,22 +33,28 @@ from dbt.artifacts.schemas.catalog import (
     TableMetadata,
 )
 from dbt.artifacts.schemas.results import NodeStatus
-from dbt.constants import CATALOG_FILENAME, MANIFEST_FILE_NAME
+from dbt.constants import CATALOG_FILENAME, MANIFEST_FILE_NAME, RUN_RESULTS_FILE_NAME
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import ResultNode
+from dbt.contracts.state import load_result_state
 from dbt.events.types import ArtifactWritten
 from dbt.exceptions import AmbiguousCatalogMatchError
 from dbt.graph import ResourceTypeSelector
 from dbt.graph.graph import UniqueId
+from dbt.graph.selector_methods import StateSelectorMethod
 from dbt.node_types import EXECUTABLE_NODE_TYPES, NodeType
 from dbt.parser.manifest import write_manifest
 from dbt.task.compile import CompileTask
 from dbt.task.docs import DOCS_INDEX_FILE_PATH
+from dbt.tracing import phase
+from dbt.utils import try_get_max_rss_kb
 from dbt.utils.artifact_upload import add_artifact_produced
 from dbt_common.clients.system import load_file_contents
 from dbt_common.dataclass_schema import ValidationError
+from dbt_common.events.format import pluralize
 from dbt_common.events.functions import fire_event
-from dbt_common.exceptions import DbtInternalError
+from dbt_common.events.types import Note
+from dbt_common.exceptions import DbtInternalError, DbtRuntimeError
 
 
 def get_stripped_prefix(source: Dict[str, Any], prefix: str) -> Dict[str, Any]:
@@ -68,6 +77,34 @@ def build_catalog_table(data) -> CatalogTable:
     )
 
 
+def build_column_metadata(data: PrimitiveDict) -> ColumnMetadata:
+    column_data = get_stripped_prefix(data, "column_")
+    # the index should really never be that big so it's ok to end up
+    # serializing this to JSON (2^53 is the max safe value there)
+    column_data["index"] = int(column_data["index"])
+
+    return ColumnMetadata.from_dict(column_data)
+
+
+def get_catalog_key(data: PrimitiveDict) -> CatalogKey:
+    database = data.get("table_database")
+    if database is None:
+        dkey: Optional[str] = None
+    else:
+        dkey = str(database)
+
+    try:
+        return CatalogKey(
+            dkey,
+            str(data["table_schema"]),
+            str(data["table_name"]),
+        )
+    except KeyError as exc:
+        raise dbt_common.exceptions.CompilationError(
+            "Catalog information missing required key {} (got {})".format(exc, data)
+        )
+
+
 # keys are database name, schema name, table name
 class Catalog(Dict[CatalogKey, CatalogTable]):
     def __init__(self, columns: List[PrimitiveDict]) -> None:
@@ -76,22 +113,7 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
             self.add_column(col)
 
     def get_table(self, data: PrimitiveDict) -> CatalogTable:
-        database = data.get("table_database")
-        if database is None:
-            dkey: Optional[str] = None
-        else:
-            dkey = str(database)
-
-        try:
-            key = CatalogKey(
-                dkey,
-                str(data["table_schema"]),
-                str(data["table_name"]),
-            )
-        except KeyError as exc:
-            raise dbt_common.exceptions.CompilationError(
-                "Catalog information missing required key {} (got {})".format(exc, data)
-            )
+        key = get_catalog_key(data)
         table: CatalogTable
         if key in self:
             table = self[key]
@@ -102,12 +124,7 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
 
     def add_column(self, data: PrimitiveDict):
         table = self.get_table(data)
-        column_data = get_stripped_prefix(data, "column_")
-        # the index should really never be that big so it's ok to end up
-        # serializing this to JSON (2^53 is the max safe value there)
-        column_data["index"] = int(column_data["index"])
-
-        column = ColumnMetadata.from_dict(column_data)
+        column = build_column_metadata(data)
         table.columns[column.name] = column
 
     def make_unique_id_map(
@@ -143,6 +160,77 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         return nodes, sources
 
 
+class StreamingCatalog:
+    """Builds the catalog tables of nodes and sources one catalog row at a time.
+
+    This gives the same nodes and sources as Catalog(rows).make_unique_id_map,
+    without holding every row as a dict or copying every table to set its
+    unique_id. Rows of relations that aren't selected nodes or sources are
+    dropped as they are read.
+    """
+
+    def __init__(
+        self, manifest: Manifest, selected_node_ids: Optional[Set[UniqueId]] = None
+    ) -> None:
+        self.node_map, self.source_map = get_unique_id_mapping(manifest)
+        self.selected_node_ids = selected_node_ids
+        self.nodes: Dict[str, CatalogTable] = {}
+        self.sources: Dict[str, CatalogTable] = {}
+        # the columns of each catalog table, shared by the node and sources it maps to
+        self._columns: Dict[CatalogKey, Optional[Dict[str, ColumnMetadata]]] = {}
+        self.num_rows = 0
+
+    def add_rows(self, column_names: Iterable[str], rows: Iterable[Iterable[Any]]) -> None:
+        column_names = list(column_names)
+        for row in rows:
+            self.add_column(dict(zip(column_names, map(dbt.utils._coerce_decimal, row))))
+
+    def add_column(self, data: PrimitiveDict) -> None:
+        self.num_rows += 1
+        key = get_catalog_key(data)
+        if key in self._columns:
+            columns = self._columns[key]
+        else:
+            columns = self._columns[key] = self._add_table(data)
+        if columns is not None:
+            column = build_column_metadata(data)
+            columns[column.name] = column
+
+    def _add_table(self, data: PrimitiveDict) -> Optional[Dict[str, ColumnMetadata]]:
+        table = build_catalog_table(data)
+        key = table.key()
+        mapped = False
+        if key in self.node_map:
+            unique_id = self.node_map[key]
+            if self.selected_node_ids is None or unique_id in self.selected_node_ids:
+                self.nodes[unique_id] = replace(table, unique_id=unique_id)
+                mapped = True
+
+        for unique_id in self.source_map.get(key, set()):
+            if unique_id in self.sources:
+                raise AmbiguousCatalogMatchError(
+                    unique_id,
+                    self.sources[unique_id].to_dict(omit_none=True),
+                    table.to_dict(omit_none=True),
+                )
+            elif self.selected_node_ids is None or unique_id in self.selected_node_ids:
+                self.sources[unique_id] = replace(table, unique_id=unique_id)
+                mapped = True
+
+        return table.columns if mapped else None
+
+
+def get_peak_rss_kb() -> Optional[int]:
+    # The resource module isn't available on Windows
+    if importlib.util.find_spec("resource") is None:
+        return try_get_max_rss_kb()
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, and kilobytes elsewhere
+    return try_get_max_rss_kb() or (max_rss // 1024 if sys.platform == "darwin" else max_rss)
+
+
 def format_stats(stats: PrimitiveDict) -> StatsDict:
     """Given a dictionary following this layout:
 
@@ -212,8 +300,49 @@ def get_unique_id_mapping(
     return node_map, source_map
 
 
+# commands whose run results mean the relations of the successful nodes changed
+MATERIALIZING_COMMANDS = frozenset(["run", "build", "seed", "snapshot", "clone", "retry"])
+
+
+def merge_previous_catalog(
+    previous_catalog: CatalogArtifact,
+    reused_node_ids: Set[UniqueId],
+    nodes: Dict[str, CatalogTable],
+    sources: Dict[str, CatalogTable],
+) -> Tuple[Dict[str, CatalogTable], Dict[str, CatalogTable]]:
+    """Add the tables of the previous catalog for the nodes and sources that were
+    not queried again. Refreshed relations that no longer exist are left out,
+    rather than kept from the previous catalog."""
+    merged_nodes = {
+        unique_id: table
+        for unique_id, table in previous_catalog.nodes.items()
+        if unique_id in reused_node_ids
+    }
+    merged_nodes.update(nodes)
+    merged_sources = {
+        unique_id: table
+        for unique_id, table in previous_catalog.sources.items()
+        if unique_id in reused_node_ids
+    }
+    merged_sources.update(sources)
+    return merged_nodes, merged_sources
+
+
 class GenerateTask(CompileTask):
     def run(self) -> CatalogArtifact:
+        # compiling overwrites run_results.json, so read the relations materialized
+        # by the latest run first
+        previous_catalog: Optional[CatalogArtifact] = None
+        materialized_node_ids: Set[UniqueId] = set()
+        if self.args.incremental_catalog and not self.args.empty_catalog:
+            previous_catalog = self._read_previous_catalog()
+            if previous_catalog is not None:
+                node_ids = self._get_materialized_node_ids(previous_catalog)
+                if node_ids is None:
+                    previous_catalog = None
+                else:
+                    materialized_node_ids = node_ids
+
         compile_results = None
         if self.args.compile:
             compile_results = CompileTask.run(self)
@@ -246,6 +375,7 @@ class GenerateTask(CompileTask):
             raise DbtInternalError("self.manifest was None in run!")
 
         selected_node_ids: Optional[Set[UniqueId]] = None
+        reused_node_ids: Set[UniqueId] = set()
         if self.args.empty_catalog:
             catalog_table: agate.Table = agate.Table([])
             exceptions: List[Exception] = []
@@ -276,7 +406,7 @@ class GenerateTask(CompileTask):
                     }
 
                 # This generates the catalog as an agate.Table
-                catalogable_nodes = chain(
+                catalogable_nodes: Iterable[ResultNode] = chain(
                     [
                         node
                         for node in self.manifest.nodes.values()
@@ -284,23 +414,55 @@ class GenerateTask(CompileTask):
                     ],
                     self.manifest.sources.values(),
                 )
-                used_schemas = self.manifest.get_used_schemas()
-                catalog_table, exceptions = adapter.get_filtered_catalog(
-                    catalogable_nodes, used_schemas, relations
-                )
 
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
+                if previous_catalog is not None:
+                    # Only query the relations that may have changed since the
+                    # previous catalog, and reuse the rest of it
+                    candidate_ids = self.get_catalog_candidate_ids(selected_node_ids)
+                    refresh_node_ids = self.get_refresh_node_ids(
+                        previous_catalog, candidate_ids, materialized_node_ids
+                    )
+                    reused_node_ids = candidate_ids - refresh_node_ids
+                    fire_event(
+                        Note(
+                            msg=f"Refreshing the catalog of "
+                            f"{pluralize(len(refresh_node_ids), 'relation')}, "
+                            f"reusing the previous catalog for the rest"
+                        )
+                    )
+                    selected_node_ids = refresh_node_ids
+                    catalogable_nodes = self._get_nodes_from_ids(self.manifest, refresh_node_ids)
+                    relations = {
+                        adapter.Relation.create_from(adapter.config, node)
+                        for node in catalogable_nodes
+                    }
 
-        catalog = Catalog(catalog_data)
+                used_schemas = self.manifest.get_used_schemas()
+                if relations is not None and not relations:
+                    # an empty set of relations would select every relation
+                    catalog_table, exceptions = agate.Table([]), []
+                else:
+                    with phase("query catalog"):
+                        catalog_table, exceptions = adapter.get_filtered_catalog(
+                            catalogable_nodes, used_schemas, relations
+                        )
+
+        # Fold the catalog rows straight into the tables of the nodes and sources
+        # they describe, then let go of the rows
+        catalog = StreamingCatalog(self.manifest, selected_node_ids)
+        catalog.add_rows(catalog_table.column_names, catalog_table.rows)
+        del catalog_table
 
         errors: Optional[List[str]] = None
         if exceptions:
             errors = [str(e) for e in exceptions]
 
-        nodes, sources = catalog.make_unique_id_map(self.manifest, selected_node_ids)
+        nodes, sources = catalog.nodes, catalog.sources
+        if previous_catalog is not None:
+            nodes, sources = merge_previous_catalog(
+                previous_catalog, reused_node_ids, nodes, sources
+            )
+
         results = self.get_catalog_results(
             nodes=nodes,
             sources=sources,
@@ -310,7 +472,8 @@ class GenerateTask(CompileTask):
         )
 
         catalog_path = os.path.join(self.config.project_target_path, CATALOG_FILENAME)
-        results.write(catalog_path)
+        with phase("write catalog"):
+            results.write(catalog_path)
         add_artifact_produced(catalog_path)
         fire_event(
             ArtifactWritten(artifact_type=results.__class__.__name__, artifact_path=catalog_path)
@@ -340,8 +503,127 @@ class GenerateTask(CompileTask):
         if exceptions:
             fire_event(WriteCatalogFailure(num_exceptions=len(exceptions)))
         fire_event(CatalogWritten(path=os.path.abspath(catalog_path)))
+        peak_rss_kb = get_peak_rss_kb()
+        fire_event(
+            Note(
+                msg=f"Catalog built from {catalog.num_rows} columns for "
+                f"{pluralize(len(catalog.nodes), 'node')} and "
+                f"{pluralize(len(catalog.sources), 'source')}"
+                + (f", peak memory use {peak_rss_kb // 1024} MiB" if peak_rss_kb else "")
+            )
+        )
         return results
 
+    def _get_materialized_node_ids(
+        self, previous_catalog: CatalogArtifact
+    ) -> Optional[Set[UniqueId]]:
+        """The nodes whose relations were built since the previous catalog, by the
+        command that last wrote run_results.json to the target path, or None if
+        that can't be told, and the full catalog must be generated."""
+        try:
+            run_results = load_result_state(
+                Path(self.config.project_target_path) / RUN_RESULTS_FILE_NAME
+            )
+        except DbtRuntimeError as exc:
+            fire_event(
+                Note(
+                    msg=f"Could not read the latest run results, generating the full catalog: {exc}"
+                )
+            )
+            return None
+        # both are written in UTC, but may be read back with or without a timezone
+        if run_results is None or run_results.metadata.generated_at.replace(
+            tzinfo=None
+        ) <= previous_catalog.metadata.generated_at.replace(tzinfo=None):
+            return set()
+        if run_results.args.get("which") not in MATERIALIZING_COMMANDS:
+            # A command that ran after the previous catalog but doesn't materialize,
+            # like "test", may have overwritten the run results of one that did.
+            fire_event(
+                Note(
+                    msg="The latest run results are newer than the previous catalog, but "
+                    "not from a command that builds relations, generating the full catalog"
+                )
+            )
+            return None
+        return {
+            UniqueId(result.unique_id)
+            for result in run_results.results
+            if result.status in (NodeStatus.Success, NodeStatus.PartialSuccess)
+        }
+
+    def _read_previous_catalog(self) -> Optional[CatalogArtifact]:
+        # With --state, the catalog is refreshed relative to the state's catalog.json
+        if self.previous_state is not None:
+            catalog_path = self.previous_state.project_root / self.previous_state.state_path
+        else:
+            catalog_path = Path(self.config.project_target_path)
+        catalog_path = catalog_path / CATALOG_FILENAME
+
+        if not catalog_path.is_file():
+            fire_event(
+                Note(msg=f"No previous catalog at {catalog_path}, generating the full catalog")
+            )
+            return None
+        try:
+            previous_catalog = CatalogArtifact.read_and_check_versions(str(catalog_path))
+        except DbtRuntimeError as exc:
+            fire_event(
+                Note(
+                    msg=f"Could not read the previous catalog, generating the full catalog: {exc}"
+                )
+            )
+            return None
+        if previous_catalog.errors:
+            # relations that failed to be cataloged before would be left out for good
+            fire_event(Note(msg="The previous catalog had errors, generating the full catalog"))
+            return None
+        return previous_catalog
+
+    def get_catalog_candidate_ids(
+        self, selected_node_ids: Optional[Set[UniqueId]]
+    ) -> Set[UniqueId]:
+        if self.manifest is None:
+            raise DbtInternalError("manifest must be set to get the catalog candidates")
+        candidate_ids: Set[UniqueId] = {
+            UniqueId(unique_id)
+            for unique_id, node in self.manifest.nodes.items()
+            if node.is_relational and not node.is_ephemeral_model
+        }
+        candidate_ids.update(UniqueId(unique_id) for unique_id in self.manifest.sources)
+        if selected_node_ids is not None:
+            candidate_ids &= selected_node_ids
+        return candidate_ids
+
+    def get_refresh_node_ids(
+        self,
+        previous_catalog: CatalogArtifact,
+        candidate_ids: Set[UniqueId],
+        materialized_node_ids: Set[UniqueId],
+    ) -> Set[UniqueId]:
+        """Return the candidate nodes and sources that need to be queried again:
+        those missing from the previous catalog, those materialized by the latest
+        run, and those that are state:modified, when there is a state manifest."""
+        refresh_node_ids = {
+            unique_id
+            for unique_id in candidate_ids
+            if unique_id not in previous_catalog.nodes
+            and unique_id not in previous_catalog.sources
+        }
+        refresh_node_ids.update(candidate_ids & materialized_node_ids)
+        if (
+            self.manifest is not None
+            and self.previous_state is not None
+            and self.previous_state.manifest is not None
+        ):
+            state_method = StateSelectorMethod(self.manifest, self.previous_state, [])
+            refresh_node_ids.update(
+                unique_id
+                for unique_id in state_method.search(candidate_ids, "modified")
+                if unique_id in candidate_ids
+            )
+        return refresh_node_ids
+
     def get_node_selector(self) -> ResourceTypeSelector:
         if self.manifest is None or self.graph is None:
             raise DbtInternalError("manifest and graph must be set to perform node selection")
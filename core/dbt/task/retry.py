@@ -10,7 +10,7 @@ from dbt.config import RuntimeConfig
 from dbt.constants import RUN_RESULTS_FILE_NAME
 from dbt.contracts.state import load_result_state
 from dbt.flags import get_flags, set_flags
-from dbt.graph import GraphQueue
+from dbt.graph import build_graph_queue
 from dbt.parser.manifest import parse_manifest
 from dbt.task.base import ConfiguredTask
 from dbt.task.build import BuildTask
@@ -153,7 +153,7 @@ class RetryTask(ConfiguredTask):
         class TaskWrapper(self.task_class):
             def get_graph_queue(self):
                 new_graph = self.graph.get_subset_graph(unique_ids)
-                return GraphQueue(
+                return build_graph_queue(
                     new_graph.graph,
                     self.manifest,
                     unique_ids,
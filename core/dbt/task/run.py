@@ -3,9 +3,9 @@ from __future__ import annotations
 import functools
 import threading
 import time
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import asdict
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 from dbt import tracking, utils
@@ -357,6 +357,20 @@ class MicrobatchBatchRunner(ModelRunner):
         self.batches = batches
         self.relation_exists = relation_exists
         self.incremental_batch = incremental_batch
+        # Time between the batch being submitted and a thread picking it up
+        self.queued_timing: Optional[TimingInfo] = None
+
+    def mark_queued(self) -> None:
+        self.queued_timing = TimingInfo(name="queued")
+        self.queued_timing.begin()
+
+    def run_with_hooks(self, manifest):
+        if self.queued_timing is not None:
+            self.queued_timing.end()
+        result = super().run_with_hooks(manifest)
+        if self.queued_timing is not None:
+            result.timing.insert(0, self.queued_timing)
+        return result
 
     def describe_batch(self) -> str:
         batch_start = self.batches[self.batch_idx][0]
@@ -570,6 +584,63 @@ class MicrobatchBatchRunner(ModelRunner):
         return batch_result
 
 
+class MicrobatchBatchResults:
+    """The results of a microbatch model's batches, which are appended from the
+    threads running the batches. The orchestrating thread can wait on the
+    results arriving instead of polling for them.
+    """
+
+    def __init__(self) -> None:
+        self._results: List[RunResult] = []
+        self._condition = threading.Condition()
+
+    def append(self, result: RunResult) -> None:
+        with self._condition:
+            self._results.append(result)
+            self._condition.notify_all()
+
+    def wait_for(self, count: int, timeout: Optional[float] = None) -> bool:
+        """Block until there are at least `count` results, or the timeout
+        expires. Returns whether there are at least `count` results.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self._results) >= count, timeout)
+
+    def snapshot(self) -> List[RunResult]:
+        with self._condition:
+            return list(self._results)
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._results)
+
+    def __getitem__(self, idx: int) -> RunResult:
+        with self._condition:
+            return self._results[idx]
+
+
+def _batch_node(node: ModelNode) -> ModelNode:
+    """Build the node for running a single batch of a microbatch model.
+
+    Running a batch sets the batch context, its config, compiled code and
+    event status on the node, adds the ephemeral models it refs to its extra
+    ctes, and compiles foreign key constraints in place, so only those are
+    copied. Everything else (raw code, columns without
+    constraints, docs, depends_on, ...) is shared with the model rather than
+    deep copying the whole node for every batch.
+    """
+    batch_node = copy(node)
+    batch_node.config = deepcopy(node.config)
+    batch_node.constraints = deepcopy(node.constraints)
+    batch_node.extra_ctes = [copy(cte) for cte in node.extra_ctes]
+    batch_node.columns = {
+        name: deepcopy(column) if column.constraints else column
+        for name, column in node.columns.items()
+    }
+    batch_node._event_status = dict(node._event_status)
+    return batch_node
+
+
 class MicrobatchModelRunner(ModelRunner):
     """Handles the orchestration of batches to run for a given microbatch model"""
 
@@ -580,10 +651,18 @@ class MicrobatchModelRunner(ModelRunner):
         self._parent_task: Optional[RunTask] = None
         # The pool is necessary because we need to batches to be executed within the same thread pool
         self._pool: Optional[DbtThreadPool] = None
+        # Time the batches spent between being submitted and a thread picking them up
+        self.queued_timing: Optional[TimingInfo] = None
 
     def set_parent_task(self, parent_task: RunTask) -> None:
         self._parent_task = parent_task
 
+    def run_with_hooks(self, manifest):
+        result = super().run_with_hooks(manifest)
+        if self.queued_timing is not None:
+            result.timing.append(self.queued_timing)
+        return result
+
     def set_pool(self, pool: DbtThreadPool) -> None:
         self._pool = pool
 
@@ -660,6 +739,7 @@ class MicrobatchModelRunner(ModelRunner):
             if batch_result.batch_results is not None:
                 result.batch_results += batch_result.batch_results
             result.execution_time += batch_result.execution_time
+        self._set_queued_timing(batch_results)
 
         num_successes = len(result.batch_results.successful)
         num_failures = len(result.batch_results.failed)
@@ -755,7 +835,7 @@ class MicrobatchModelRunner(ModelRunner):
         if len(batches) == 0:
             return result
 
-        batch_results: List[RunResult] = []
+        batch_results = MicrobatchBatchResults()
         batch_idx = 0
 
         # Run first batch not in parallel
@@ -787,8 +867,9 @@ class MicrobatchModelRunner(ModelRunner):
             )
             batch_idx += 1
 
-        # Wait until all submitted batches have completed
-        while len(batch_results) != batch_idx:
+        # Wait until all submitted batches have completed. Each completed batch wakes
+        # this thread up; the timeout is only there to notice the pool being closed.
+        while not batch_results.wait_for(batch_idx, timeout=0.1):
             # Check if the pool was closed, because if it was, then the main thread is trying to exit.
             # If the main thread is trying to exit, we need to shutdown. If we _don't_ shutdown, then
             # batches will continue to execute and we'll delay the run from stopping
@@ -796,14 +877,11 @@ class MicrobatchModelRunner(ModelRunner):
                 # It's technically possible for more results to come in while we clean up
                 # instead we're going to say the didn't finish, regardless of if they finished
                 # or not. Thus, lets get a copy of the results as they exist right "now".
-                frozen_batch_results = deepcopy(batch_results)
+                frozen_batch_results = batch_results.snapshot()
                 self.merge_batch_results(result, frozen_batch_results)
                 self._update_result_with_unfinished_batches(result, batches)
                 return result
 
-            # breifly sleep so that this thread doesn't go brrrrr while waiting
-            time.sleep(0.1)
-
         # Only run "last" batch if there is more than one batch
         if len(batches) != 1:
             # Final batch runs once all others complete to ensure post_hook runs at the end
@@ -820,10 +898,42 @@ class MicrobatchModelRunner(ModelRunner):
             )
 
         # Finalize run: merge results, track model run, and print final result line
-        self.merge_batch_results(result, batch_results)
+        self.merge_batch_results(result, batch_results.snapshot())
 
         return result
 
+    def _set_queued_timing(self, batch_results: List[RunResult]) -> None:
+        """Set the "queued" timing added to the model's result, for how long its
+        batches waited between being submitted and starting to run, from the
+        "queued" timing on each batch's result. It starts when the first batch
+        was submitted, and lasts for the total wait of all the batches; the
+        longest wait is logged along with the total.
+        """
+        queued = [
+            (timing.started_at, (timing.completed_at - timing.started_at).total_seconds())
+            for batch_result in batch_results
+            for timing in batch_result.timing
+            if timing.name == "queued" and timing.started_at and timing.completed_at
+        ]
+        if not queued:
+            return
+        queued_seconds = [seconds for _, seconds in queued]
+        started_at = min(started_at for started_at, _ in queued)
+        self.queued_timing = TimingInfo(
+            name="queued",
+            started_at=started_at,
+            completed_at=started_at + timedelta(seconds=sum(queued_seconds)),
+        )
+        fire_event(
+            MicrobatchExecutionDebug(
+                msg=(
+                    f"{len(queued_seconds)} batches of {self.get_node_representation()} waited "
+                    f"{sum(queued_seconds):.3f}s in total (max {max(queued_seconds):.3f}s) "
+                    "to be scheduled"
+                )
+            )
+        )
+
 
 class RunTask(CompileTask):
     def __init__(
@@ -873,13 +983,13 @@ class RunTask(CompileTask):
         relation_exists: bool,
         batches: Dict[int, BatchType],
         batch_idx: int,
-        batch_results: List[RunResult],
+        batch_results: MicrobatchBatchResults,
         pool: DbtThreadPool,
         force_sequential_run: bool = False,
         skip: bool = False,
         incremental_batch: bool = True,
     ):
-        node_copy = deepcopy(node)
+        node_copy = _batch_node(node)
         # Only run pre_hook(s) for first batch
         if batch_idx != 0:
             node_copy.config.pre_hook = []
@@ -906,6 +1016,7 @@ class RunTask(CompileTask):
         if skip:
             batch_runner.do_skip()
 
+        batch_runner.mark_queued()
         if not pool.is_closed():
             if not force_sequential_run and batch_runner.should_run_in_parallel():
                 fire_event(
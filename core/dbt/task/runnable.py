@@ -53,6 +53,7 @@ from dbt.parser.manifest import write_manifest
 from dbt.task import group_lookup
 from dbt.task.base import BaseRunner, ConfiguredTask
 from dbt.task.printer import print_run_end_messages, print_run_result_error
+from dbt.tracing import phase, start_phase
 from dbt.utils.artifact_upload import add_artifact_produced
 from dbt_common.context import _INVOCATION_CONTEXT_VAR, get_invocation_context
 from dbt_common.dataclass_schema import StrEnum
@@ -485,6 +486,7 @@ class GraphRunnableTask(ConfiguredTask):
             raise DbtInternalError("manifest was None in populate_adapter_cache")
 
         start_populate_cache = time.perf_counter()
+        traced_populate_cache = start_phase("populate adapter cache")
         # the cache only cares about executable nodes
         cachable_nodes = [
             node
@@ -497,6 +499,7 @@ class GraphRunnableTask(ConfiguredTask):
         else:
             adapter.set_relations_cache(cachable_nodes)
         cache_populate_time = time.perf_counter() - start_populate_cache
+        traced_populate_cache.end()
         if dbt.tracking.active_user is not None:
             dbt.tracking.track_runnable_timing(
                 {"adapter_cache_construction_elapsed": cache_populate_time}
@@ -613,7 +616,8 @@ class GraphRunnableTask(ConfiguredTask):
         if self.args.write_json:
             write_manifest(self.manifest, self.config.project_target_path)
             if hasattr(result, "write"):
-                result.write(self.result_path())
+                with phase("write results"):
+                    result.write(self.result_path())
                 add_artifact_produced(self.result_path())
                 fire_event(
                     ArtifactWritten(
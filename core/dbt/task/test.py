@@ -5,11 +5,13 @@ import threading
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Collection,
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -17,9 +19,11 @@ from typing import (
 
 import daff
 
+from dbt.adapters.base import BaseAdapter
 from dbt.adapters.exceptions import MissingMaterializationError
+from dbt.adapters.factory import get_adapter_package_names
 from dbt.artifacts.schemas.catalog import PrimitiveDict
-from dbt.artifacts.schemas.results import TestStatus
+from dbt.artifacts.schemas.results import RunStatus, TestStatus
 from dbt.artifacts.schemas.run import RunResult
 from dbt.clients.jinja import MacroGenerator
 from dbt.context.providers import generate_runtime_model_context
@@ -37,7 +41,7 @@ from dbt.flags import get_flags
 from dbt.graph import ResourceTypeSelector
 from dbt.node_types import TEST_NODE_TYPES, NodeType
 from dbt.parser.unit_tests import UnitTestManifestLoader
-from dbt.task import group_lookup
+from dbt.task import data_test_batches, group_lookup, unit_test_batches
 from dbt.task.base import BaseRunner, resource_types_from_args
 from dbt.task.compile import CompileRunner
 from dbt.task.run import RunTask
@@ -61,6 +65,8 @@ class UnitTestDiff(dbtClassMixin):
 
 @dataclass
 class TestResultData(dbtClassMixin):
+    __test__ = False
+
     failures: int
     should_warn: bool
     should_error: bool
@@ -92,6 +98,8 @@ class UnitTestResultData(dbtClassMixin):
 
 
 class TestRunner(CompileRunner):
+    __test__ = False
+
     _ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
     def describe_node_name(self) -> str:
@@ -140,10 +148,6 @@ class TestRunner(CompileRunner):
         self.print_start_line()
 
     def execute_data_test(self, data_test: TestNode, manifest: Manifest) -> TestResultData:
-        context = generate_runtime_model_context(data_test, self.config, manifest)
-
-        hook_ctx = self.adapter.pre_model_hook(context["config"])
-
         materialization_macro = manifest.find_materialization_macro_by_name(
             self.config.project_name, data_test.get_materialization(), self.adapter.type()
         )
@@ -153,6 +157,25 @@ class TestRunner(CompileRunner):
                 materialization=data_test.get_materialization(), adapter_type=self.adapter.type()
             )
 
+        # The batch query stands in for the test materialization, so tests only
+        # use it while that is not overridden by the project or a package.
+        batch = data_test_batches.get(data_test.unique_id)
+        if (
+            batch is not None
+            and isinstance(data_test, GenericTestNode)
+            and materialization_macro.package_name
+            in get_adapter_package_names(self.adapter.type())
+        ):
+            batch_result = batch.get_result(
+                data_test, manifest, self.compiler, self.execute_data_test_batch
+            )
+            if batch_result is not None:
+                return batch_result
+
+        context = generate_runtime_model_context(data_test, self.config, manifest)
+
+        hook_ctx = self.adapter.pre_model_hook(context["config"])
+
         if "config" not in context:
             raise DbtInternalError(
                 "Invalid materialization context generated, missing config: {}".format(context)
@@ -170,14 +193,66 @@ class TestRunner(CompileRunner):
         # could eventually be returned directly by materialization
         result = context["load_result"]("main")
         table = result["table"]
-        num_rows = len(table.rows)
+        return self._build_test_result_data(
+            data_test,
+            table.column_names,
+            table.rows,
+            result["response"].to_dict(omit_none=True),
+        )
+
+    def execute_data_test_batch(
+        self, data_tests: List[GenericTestNode], manifest: Manifest
+    ) -> Dict[str, TestResultData]:
+        """Run several generic tests of the same model in one query, instead of
+        running the test materialization once per test. The failure count of
+        each test is tagged with its position in the batch."""
+        context = generate_runtime_model_context(data_tests[0], self.config, manifest)
+        hook_ctx = self.adapter.pre_model_hook(context["config"])
+        case_column = "dbt_internal_data_test_case"
+        try:
+            queries = []
+            for index, data_test in enumerate(data_tests):
+                config = data_test.config
+                sql_with_limit = context["get_limit_subquery_sql"](
+                    data_test.compiled_code, config.limit
+                )
+                test_sql = context["get_test_sql"](
+                    sql_with_limit, config.fail_calc, config.warn_if, config.error_if, None
+                )
+                queries.append(
+                    f"select *, {index} as {self.adapter.quote(case_column)} from (\n{test_sql}\n) "
+                    f"{case_column}_{index}"
+                )
+            response, table = self.adapter.execute(
+                "\nunion all\n".join(queries), auto_begin=True, fetch=True
+            )
+        finally:
+            self.adapter.post_model_hook(context, hook_ctx)
+
+        adapter_response = response.to_dict(omit_none=True)
+        column_names, rows = split_data_test_batch_rows(table, case_column)
+        return {
+            data_test.unique_id: self._build_test_result_data(
+                data_test, column_names, rows.get(index, []), adapter_response
+            )
+            for index, data_test in enumerate(data_tests)
+        }
+
+    def _build_test_result_data(
+        self,
+        data_test: TestNode,
+        column_names: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        adapter_response: Dict[str, Any],
+    ) -> TestResultData:
+        num_rows = len(rows)
         if num_rows != 1:
             raise DbtInternalError(
                 f"dbt internally failed to execute {data_test.unique_id}: "
                 f"Returned {num_rows} rows, but expected "
                 f"1 row"
             )
-        num_cols = len(table.columns)
+        num_cols = len(column_names)
         if num_cols != 3:
             raise DbtInternalError(
                 f"dbt internally failed to execute {data_test.unique_id}: "
@@ -187,11 +262,11 @@ class TestRunner(CompileRunner):
 
         test_result_dct: PrimitiveDict = dict(
             zip(
-                [column_name.lower() for column_name in table.column_names],
-                map(_coerce_decimal, table.rows[0]),
+                [column_name.lower() for column_name in column_names],
+                map(_coerce_decimal, rows[0]),
             )
         )
-        test_result_dct["adapter_response"] = result["response"].to_dict(omit_none=True)
+        test_result_dct["adapter_response"] = adapter_response
         TestResultData.validate(test_result_dct)
         return TestResultData.from_dict(test_result_dct)
 
@@ -202,20 +277,12 @@ class TestRunner(CompileRunner):
         loader = UnitTestManifestLoader(manifest, self.config, {unit_test_def.unique_id})
         return loader.load()
 
-    def execute_unit_test(
-        self, unit_test_def: UnitTestDefinition, manifest: Manifest
-    ) -> Tuple[UnitTestNode, UnitTestResultData]:
-
-        unit_test_manifest = self.build_unit_test_manifest_from_test(unit_test_def, manifest)
-
-        # The unit test node and definition have the same unique_id
-        unit_test_node = unit_test_manifest.nodes[unit_test_def.unique_id]
-        assert isinstance(unit_test_node, UnitTestNode)
-
-        # Compile the node
-        unit_test_node = self.compiler.compile_node(unit_test_node, unit_test_manifest, {})
-        assert isinstance(unit_test_node, UnitTestNode)
-
+    def execute_unit_test_materialization(
+        self,
+        unit_test_def: UnitTestDefinition,
+        unit_test_node: UnitTestNode,
+        unit_test_manifest: Manifest,
+    ) -> Tuple[Dict[str, Any], "agate.Table"]:
         # generate_runtime_unit_test_context not strictly needed - this is to run the 'unit'
         # materialization, not compile the node.compiled_code
         context = generate_runtime_model_context(unit_test_node, self.config, unit_test_manifest)
@@ -253,8 +320,111 @@ class TestRunner(CompileRunner):
         # load results from context
         # could eventually be returned directly by materialization
         result = context["load_result"]("main")
-        adapter_response = result["response"].to_dict(omit_none=True)
-        table = result["table"]
+        return result["response"].to_dict(omit_none=True), result["table"]
+
+    def execute_unit_test_batch(
+        self, unit_test_nodes: List[UnitTestNode], unit_test_manifest: Manifest
+    ) -> Dict[str, Tuple[Dict[str, Any], "agate.Table"]]:
+        """Compare several unit tests of the same model in one query, instead of
+        running the unit materialization once per test. The column types of the
+        model are looked up once, and the actual and expected rows of each test
+        are tagged with its position in the batch."""
+        context = generate_runtime_model_context(
+            unit_test_nodes[0], self.config, unit_test_manifest
+        )
+        hook_ctx = self.adapter.pre_model_hook(context["config"])
+        try:
+            temp_relation = context["make_temp_relation"](
+                context["this"].incorporate(type="table")
+            )
+            self.adapter.execute(
+                context["get_create_table_as_sql"](
+                    True,
+                    temp_relation,
+                    context["get_empty_subquery_sql"](unit_test_nodes[0].compiled_code),
+                ),
+                auto_begin=True,
+            )
+            columns_in_relation = self.adapter.get_columns_in_relation(temp_relation)
+            self.adapter.drop_relation(temp_relation)
+            column_name_to_data_types = {
+                column.name.lower(): column.data_type for column in columns_in_relation
+            }
+
+            # UNION ALL needs the same columns in every branch, so tests whose
+            # expected rows name different columns go in separate queries
+            unit_test_sql: Dict[Tuple[str, ...], List[Tuple[int, str]]] = {}
+            for index, unit_test_node in enumerate(unit_test_nodes):
+                expected_rows = unit_test_node.config.expected_rows
+                expected_sql = unit_test_node.config.expected_sql
+                if expected_rows:
+                    column_names = tuple(expected_rows[0].keys())
+                else:
+                    column_names = tuple(column.name for column in columns_in_relation)
+                if not expected_sql:
+                    expected_sql = context["get_expected_sql"](
+                        expected_rows, column_name_to_data_types
+                    )
+                unit_test_sql.setdefault(column_names, []).append(
+                    (
+                        index,
+                        context["get_unit_test_sql"](
+                            unit_test_node.compiled_code, expected_sql, column_names
+                        ),
+                    )
+                )
+
+            case_column = "dbt_internal_unit_test_case"
+            tables: Dict[str, Tuple[Dict[str, Any], "agate.Table"]] = {}
+            for queries in unit_test_sql.values():
+                sql = "\nunion all\n".join(
+                    f"select *, {index} as {self.adapter.quote(case_column)} from (\n{query}\n) "
+                    f"{case_column}_{index}"
+                    for index, query in queries
+                )
+                response, table = self.adapter.execute(sql, auto_begin=True, fetch=True)
+                adapter_response = response.to_dict(omit_none=True)
+                for index, case_table in split_unit_test_batch_table(
+                    table, case_column, [index for index, _ in queries]
+                ).items():
+                    tables[unit_test_nodes[index].unique_id] = (adapter_response, case_table)
+        finally:
+            self.adapter.post_model_hook(context, hook_ctx)
+        return tables
+
+    def execute_unit_test(
+        self, unit_test_def: UnitTestDefinition, manifest: Manifest
+    ) -> Tuple[UnitTestNode, UnitTestResultData]:
+
+        batch = unit_test_batches.get(unit_test_def.unique_id)
+        if batch is None:
+            unit_test_manifest = self.build_unit_test_manifest_from_test(unit_test_def, manifest)
+
+            # The unit test node and definition have the same unique_id
+            unit_test_node = unit_test_manifest.nodes[unit_test_def.unique_id]
+            assert isinstance(unit_test_node, UnitTestNode)
+
+            # Compile the node
+            unit_test_node = self.compiler.compile_node(unit_test_node, unit_test_manifest, {})
+            assert isinstance(unit_test_node, UnitTestNode)
+        else:
+            # The other unit tests of the model share this manifest, already compiled
+            unit_test_node, unit_test_manifest = batch.get_node(
+                manifest, self.config, self.compiler, unit_test_def.unique_id
+            )
+
+        batch_table = (
+            batch.get_table(unit_test_def.unique_id, self.execute_unit_test_batch)
+            if batch is not None
+            else None
+        )
+        if batch_table is None:
+            adapter_response, table = self.execute_unit_test_materialization(
+                unit_test_def, unit_test_node, unit_test_manifest
+            )
+        else:
+            adapter_response, table = batch_table
+
         actual = self._get_unit_test_agate_table(table, "actual")
         expected = self._get_unit_test_agate_table(table, "expected")
 
@@ -424,10 +594,43 @@ class TestTask(RunTask):
             resource_types=self.resource_types,
         )
 
+    def before_run(self, adapter: BaseAdapter, selected_uids: AbstractSet[str]) -> RunStatus:
+        unit_test_batches.init(self.manifest, selected_uids)
+        data_test_batches.init(self.manifest, selected_uids)
+        return super().before_run(adapter, selected_uids)
+
     def get_runner_type(self, _) -> Optional[Type[BaseRunner]]:
         return TestRunner
 
 
+def split_unit_test_batch_table(
+    table: "agate.Table", case_column: str, indexes: List[int]
+) -> Dict[int, "agate.Table"]:
+    "Split the result of a batched unit test query into one table per unit test"
+    columns = [column_name for column_name in table.column_names if column_name != case_column]
+    return {
+        index: table.where(lambda row, index=index: row[case_column] == index).select(columns)
+        for index in indexes
+    }
+
+
+def split_data_test_batch_rows(
+    table: "agate.Table", case_column: str
+) -> Tuple[List[str], Dict[int, List[List[Any]]]]:
+    """Split the result of a batched data test query into the rows of each data
+    test, returning them without the case column, along with its column names"""
+    case_index = [column_name.lower() for column_name in table.column_names].index(case_column)
+    column_names = [
+        column_name for i, column_name in enumerate(table.column_names) if i != case_index
+    ]
+    rows: Dict[int, List[List[Any]]] = {}
+    for row in table.rows:
+        values = list(row.values())
+        case = int(values.pop(case_index))
+        rows.setdefault(case, []).append(values)
+    return column_names, rows
+
+
 # This was originally in agate_helper, but that was moved out into dbt_common
 def json_rows_from_table(table: "agate.Table") -> List[Dict[str, Any]]:
     "Convert a table to a list of row dict objects"
@@ -0,0 +1,141 @@
+import threading
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from dbt.artifacts.resources import UnitTestFormat
+from dbt.config import RuntimeConfig
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import UnitTestDefinition, UnitTestNode
+from dbt.flags import get_flags
+from dbt.parser.unit_tests import UnitTestManifestLoader
+from dbt.task.batch_query import BatchQuery
+
+if TYPE_CHECKING:
+    import agate
+
+    from dbt.compilation import Compiler
+
+
+UnitTestTable = Tuple[Dict[str, Any], "agate.Table"]
+UnitTestTables = Dict[str, UnitTestTable]
+
+_unit_test_id_to_batch_map: Dict[str, "UnitTestBatch"] = {}
+
+
+class UnitTestBatch:
+    """The selected unit tests of one model. They share a single unit test
+    manifest, compiled once for all of them, and with query batching the
+    eligible cases are compared in one query.
+    """
+
+    def __init__(self, tested_node_unique_id: str, unit_test_ids: List[str], query: bool) -> None:
+        self.tested_node_unique_id = tested_node_unique_id
+        self.unit_test_ids = unit_test_ids
+        self.query = query
+        self._lock = threading.Lock()
+        self._manifest: Optional[Manifest] = None
+        self._errors: Dict[str, Exception] = {}
+        self._batch_query: BatchQuery[UnitTestNode, UnitTestTable] = BatchQuery(
+            f"the unit tests of {tested_node_unique_id}"
+        )
+        self._query_ids: List[str] = []
+
+    def get_node(
+        self, manifest: Manifest, config: RuntimeConfig, compiler: "Compiler", unique_id: str
+    ) -> Tuple[UnitTestNode, Manifest]:
+        """Return the compiled unit test node and the shared unit test manifest,
+        building and compiling every case of the batch on first use. An error
+        in one case is raised only for that case."""
+        with self._lock:
+            if self._manifest is None:
+                self._manifest = self._load(manifest, config, compiler)
+        if unique_id in self._errors:
+            raise self._errors[unique_id]
+        node = self._manifest.nodes[unique_id]
+        assert isinstance(node, UnitTestNode)
+        return node, self._manifest
+
+    def _load(self, manifest: Manifest, config: RuntimeConfig, compiler: "Compiler") -> Manifest:
+        loader = UnitTestManifestLoader(manifest, config, set(self.unit_test_ids))
+        unit_test_manifest = loader.unit_test_manifest
+        for unique_id in self.unit_test_ids:
+            if self.query and can_batch_query(manifest.unit_tests[unique_id]):
+                self._query_ids.append(unique_id)
+            try:
+                loader.parse_unit_test_case(manifest.unit_tests[unique_id])
+                # Every case registers its fixtures under the same input node
+                # ids, so drop the lookups the previous case's compile cached.
+                unit_test_manifest.rebuild_ref_lookup()
+                unit_test_manifest.rebuild_source_lookup()
+                unit_test_manifest.nodes[unique_id] = compiler.compile_node(
+                    unit_test_manifest.nodes[unique_id], unit_test_manifest, {}
+                )
+            except Exception as exc:
+                self._errors[unique_id] = exc
+        return unit_test_manifest
+
+    def get_table(
+        self,
+        unique_id: str,
+        execute: Callable[[List[UnitTestNode], Manifest], UnitTestTables],
+    ) -> Optional[UnitTestTable]:
+        """Return the adapter response and actual/expected rows of a unit test
+        from the batch query, running it on first use. None means the test
+        must run on its own."""
+        if not self.query:
+            return None
+        assert self._manifest is not None
+        manifest = self._manifest
+        return self._batch_query.get_result(
+            unique_id, self._query_nodes, lambda nodes: execute(nodes, manifest)
+        )
+
+    def _query_nodes(self) -> List[UnitTestNode]:
+        assert self._manifest is not None
+        nodes = []
+        for unique_id in self._query_ids:
+            node = self._manifest.nodes.get(unique_id)
+            if unique_id not in self._errors and isinstance(node, UnitTestNode):
+                nodes.append(node)
+        return nodes
+
+
+def can_batch_query(unit_test: UnitTestDefinition) -> bool:
+    # Cases that override vars or macros, or that give inputs as sql, may
+    # change the columns or column types of the model, so they run alone.
+    if unit_test.overrides and (unit_test.overrides.macros or unit_test.overrides.vars):
+        return False
+    if not unit_test.expect.rows:
+        return False
+    return all(given.format != UnitTestFormat.SQL for given in unit_test.given)
+
+
+def init(manifest: Optional[Manifest], selected_ids: AbstractSet[str]) -> None:
+    _unit_test_id_to_batch_map.clear()
+    batching = getattr(get_flags(), "UNIT_TEST_BATCHING", None) or "none"
+    if not manifest or batching == "none":
+        return
+
+    unit_test_ids_by_model: Dict[str, List[str]] = {}
+    for unique_id in sorted(selected_ids):
+        unit_test = manifest.unit_tests.get(unique_id)
+        if not isinstance(unit_test, UnitTestDefinition) or not unit_test.config.enabled:
+            continue
+        unit_test_ids_by_model.setdefault(unit_test.depends_on.nodes[0], []).append(unique_id)
+
+    for tested_node_unique_id, unit_test_ids in unit_test_ids_by_model.items():
+        batch = UnitTestBatch(tested_node_unique_id, unit_test_ids, query=batching == "query")
+        for unique_id in unit_test_ids:
+            _unit_test_id_to_batch_map[unique_id] = batch
+
+
+def get(unique_id: str) -> Optional[UnitTestBatch]:
+    return _unit_test_id_to_batch_map.get(unique_id)
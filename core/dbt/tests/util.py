@@ -16,6 +16,7 @@ from dbt.adapters.factory import Adapter
 from dbt.cli.main import dbtRunner
 from dbt.contracts.graph.manifest import Manifest
 from dbt.materializations.incremental.microbatch import MicrobatchBuilder
+from dbt.parser.partial_parse_file import read_manifest
 from dbt_common.context import _INVOCATION_CONTEXT_VAR, InvocationContext
 from dbt_common.events.base_types import EventLevel, EventMsg
 from dbt_common.events.functions import (
@@ -152,8 +153,7 @@ def get_manifest(project_root) -> Optional[Manifest]:
     path = os.path.join(project_root, "target", "partial_parse.msgpack")
     if os.path.exists(path):
         with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)  # type: ignore[attr-defined]
+            manifest: Manifest = read_manifest(fp)
         return manifest
     else:
         return None
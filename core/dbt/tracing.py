@@ -0,0 +1,133 @@
+"""Phase-level tracing of a dbt invocation.
+
+With --trace-file, the wall time, CPU time and memory use of each major phase
+of the invocation (loading config, reading and parsing files, linking the graph,
+selecting, compiling and executing each node, writing artifacts, ...) are
+written as Chrome trace-event JSON, which chrome://tracing and
+https://ui.perfetto.dev can display as a timeline per thread.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from dbt.utils import try_get_max_rss_kb, try_get_rss_kb
+
+_tracer: Optional["Tracer"] = None
+
+
+class Phase:
+    """A phase of the invocation that has started. Calling end() records it,
+    with any args that are only known once it's done."""
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.thread = threading.current_thread()
+        self.rss_kb = try_get_rss_kb()
+        self.start_ns = time.perf_counter_ns()
+        self.thread_cpu = time.thread_time()
+        self.process_cpu = time.process_time()
+
+    def end(self, **args: Any) -> None:
+        end_ns = time.perf_counter_ns()
+        # CPU time of this thread, and of the whole process, which includes any
+        # threads working on this phase's behalf
+        args["cpu_ms"] = round((time.thread_time() - self.thread_cpu) * 1000, 3)
+        args["process_cpu_ms"] = round((time.process_time() - self.process_cpu) * 1000, 3)
+        rss_kb = try_get_rss_kb()
+        if rss_kb is not None and self.rss_kb is not None:
+            args["rss_kb"] = rss_kb
+            args["rss_delta_kb"] = rss_kb - self.rss_kb
+        max_rss_kb = try_get_max_rss_kb()
+        if max_rss_kb is not None:
+            args["max_rss_kb"] = max_rss_kb
+        self.tracer.add_phase(self, end_ns, {**self.args, **args})
+
+
+class _NoPhase:
+    def end(self, **args: Any) -> None:
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.start_ns = time.perf_counter_ns()
+        self.events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def add_phase(self, phase: Phase, end_ns: int, args: Dict[str, Any]) -> None:
+        tid = phase.thread.ident or 0
+        event = {
+            "name": phase.name,
+            "cat": "dbt",
+            "ph": "X",
+            "ts": (phase.start_ns - self.start_ns) / 1000,
+            "dur": (end_ns - phase.start_ns) / 1000,
+            "pid": self.pid,
+            "tid": tid,
+            "args": args,
+        }
+        with self._lock:
+            self.events.append(event)
+            self._thread_names.setdefault(tid, phase.thread.name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            thread_names = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self.pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self._thread_names.items()
+            ]
+            return {"traceEvents": thread_names + self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as fp:
+            json.dump(self.to_dict(), fp)
+
+
+def start_phase(name: str, **args: Any) -> Any:
+    """Start timing a phase, returning an object whose end() records it. This
+    does nothing unless tracing is enabled."""
+    if _tracer is None:
+        return _NO_PHASE
+    return Phase(_tracer, name, args)
+
+
+@contextmanager
+def phase(name: str, **args: Any) -> Iterator[None]:
+    traced = start_phase(name, **args)
+    try:
+        yield
+    finally:
+        traced.end()
+
+
+@contextmanager
+def tracing(outfile: Optional[str]) -> Iterator[None]:
+    global _tracer
+    if not outfile:
+        yield
+        return
+
+    _tracer = tracer = Tracer()
+    try:
+        with phase("invocation"):
+            yield
+    finally:
+        _tracer = None
+        tracer.write(outfile)
@@ -406,3 +406,17 @@ def try_get_max_rss_kb() -> Optional[int]:
             pass
 
     return None
+
+
+def try_get_rss_kb() -> Optional[int]:
+    """Attempts to get this process's current memory use. Currently only
+    implemented for Linux."""
+    if sys.platform == "linux":
+        try:
+            # The second field of /proc/self/statm is the resident set size in pages
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+        except Exception:
+            pass
+
+    return None
@@ -0,0 +1,135 @@
+"""Benchmark the peak memory of building and writing catalog.json from the
+adapter's catalog table, against the list-of-dicts pipeline it replaced, on a
+synthetic warehouse where most relations are dbt models.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Tuple
+from unittest import mock
+
+import agate
+
+from dbt.artifacts.schemas.catalog import CatalogArtifact, CatalogKey, CatalogTable
+from dbt.task.docs import generate
+from dbt.utils import _coerce_decimal
+from dbt_common.clients.system import write_json
+
+COLUMN_NAMES = [
+    "table_database",
+    "table_schema",
+    "table_name",
+    "table_type",
+    "table_comment",
+    "table_owner",
+    "column_name",
+    "column_index",
+    "column_type",
+    "column_comment",
+]
+
+
+def make_catalog_table(tables: int, columns: int) -> agate.Table:
+    rows = [
+        [
+            "bench",
+            "analytics",
+            f"table_{t}",
+            "BASE TABLE",
+            None,
+            "dbt",
+            f"column_{c}",
+            c,
+            "text",
+            "",
+        ]
+        for t in range(tables)
+        for c in range(columns)
+    ]
+    return agate.Table(
+        rows, COLUMN_NAMES, [agate.Text()] * 7 + [agate.Number()] + [agate.Text()] * 2
+    )
+
+
+def make_node_map(tables: int, mapped: float) -> Dict[CatalogKey, str]:
+    return {
+        CatalogKey("bench", "analytics", f"table_{t}"): f"model.bench.table_{t}"
+        for t in range(int(tables * mapped))
+    }
+
+
+def write_artifact(nodes: Dict[str, CatalogTable], path: str, streaming: bool) -> None:
+    artifact = CatalogArtifact.from_results(
+        generated_at=datetime(2024, 1, 1),
+        nodes=nodes,
+        sources={},
+        compile_results=None,
+        errors=None,
+    )
+    if streaming:
+        artifact.write(path)
+    else:
+        write_json(path, artifact.to_dict(omit_none=False, context={"artifact": True}))
+
+
+def list_of_dicts_catalog(catalog_table: agate.Table, path: str) -> None:
+    """The previous pipeline in GenerateTask.run."""
+    catalog_data = [
+        dict(zip(catalog_table.column_names, map(_coerce_decimal, row))) for row in catalog_table
+    ]
+    catalog = generate.Catalog(catalog_data)
+    nodes, _ = catalog.make_unique_id_map(mock.Mock())
+    write_artifact(nodes, path, streaming=False)
+
+
+def streaming_catalog(catalog_table: agate.Table, path: str) -> None:
+    catalog = generate.StreamingCatalog(mock.Mock())
+    catalog.add_rows(catalog_table.column_names, catalog_table.rows)
+    write_artifact(catalog.nodes, path, streaming=True)
+
+
+def measure(func: Callable[[agate.Table, str], None], catalog_table, path) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(catalog_table, path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--columns", type=int, default=40, help="Columns per table")
+    parser.add_argument(
+        "--mapped", type=float, default=0.8, help="Fraction of tables that are dbt models"
+    )
+    args = parser.parse_args()
+
+    print(f"{'columns':>9} {'old peak':>10} {'new peak':>10} {'old':>8} {'new':>8}")
+    for tables in args.tables:
+        catalog_table = make_catalog_table(tables, args.columns)
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(
+            generate,
+            "get_unique_id_mapping",
+            return_value=(make_node_map(tables, args.mapped), {}),
+        ):
+            old_path = os.path.join(tmpdir, "old.json")
+            new_path = os.path.join(tmpdir, "new.json")
+            old, old_peak = measure(list_of_dicts_catalog, catalog_table, old_path)
+            new, new_peak = measure(streaming_catalog, catalog_table, new_path)
+            with open(old_path) as old_file, open(new_path) as new_file:
+                assert old_file.read() == new_file.read()
+        print(
+            f"{len(catalog_table.rows):>9} {old_peak / 2**20:>8.1f}MB {new_peak / 2**20:>8.1f}MB"
+            f" {old:>7.2f}s {new:>7.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark linking the graph of a synthetic project, with its test edges, from
+scratch against linking it from the cached edge list of an earlier link, both
+when nothing has changed and when a few models' dependencies have.
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+import msgpack
+
+from dbt.compilation import Linker
+from dbt.node_types import NodeType
+
+
+def make_manifest(model_count: int, tests_per_model: int, rng: random.Random) -> SimpleNamespace:
+    nodes: Dict[str, SimpleNamespace] = {}
+    sources = {f"source.bench.raw.s{i}": SimpleNamespace() for i in range(10)}
+    for i in range(model_count):
+        if i < 10:
+            parents = [f"source.bench.raw.s{i}"]
+        else:
+            parents = [f"model.bench.m{parent}" for parent in rng.sample(range(i), 2)]
+        unique_id = f"model.bench.m{i}"
+        nodes[unique_id] = SimpleNamespace(
+            unique_id=unique_id, resource_type=NodeType.Model, depends_on_nodes=parents
+        )
+        for t in range(tests_per_model):
+            test_parents = [unique_id]
+            if t % 2 and i:
+                test_parents.append(f"model.bench.m{rng.randrange(i)}")
+            test_id = f"test.bench.t{i}_{t}"
+            nodes[test_id] = SimpleNamespace(
+                unique_id=test_id, resource_type=NodeType.Test, depends_on_nodes=test_parents
+            )
+
+    for unique_id, source in sources.items():
+        source.unique_id = unique_id
+    return SimpleNamespace(
+        nodes=nodes,
+        sources=sources,
+        semantic_models={},
+        exposures={},
+        metrics={},
+        unit_tests={},
+        saved_queries={},
+        child_map=build_child_map(nodes),
+    )
+
+
+def build_child_map(nodes: Dict[str, SimpleNamespace]) -> Dict[str, List[str]]:
+    child_map: Dict[str, List[str]] = defaultdict(list)
+    for node in nodes.values():
+        for parent in node.depends_on_nodes:
+            child_map[parent].append(node.unique_id)
+    return child_map
+
+
+def add_test_edges(linker: Linker, manifest: SimpleNamespace, fast: bool) -> None:
+    if fast:
+        linker.add_test_edges_2(manifest)  # type: ignore
+    else:
+        linker.add_test_edges_1(manifest)  # type: ignore
+
+
+def link(manifest: SimpleNamespace, fast: bool) -> Linker:
+    linker = Linker()
+    linker.link_graph(manifest)  # type: ignore
+    add_test_edges(linker, manifest, fast)
+    return linker
+
+
+def link_cached(manifest: SimpleNamespace, cache: bytes, fast: bool) -> Linker:
+    edge_list = msgpack.unpackb(cache, raw=False)
+    linker = Linker()
+    if linker.link_graph_from_edge_list(manifest, edge_list):  # type: ignore
+        add_test_edges(linker, manifest, fast)
+    else:
+        linker.add_test_edges_from_edge_list(edge_list)
+    return linker
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--tests-per-model", type=int, default=2)
+    parser.add_argument("--changed", type=int, default=5, help="Number of models to rewire")
+    parser.add_argument(
+        "--fast-test-edges",
+        action="store_true",
+        help="Add test edges as with --use-fast-test-edges",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    manifest = make_manifest(args.models, args.tests_per_model, rng)
+    cache = msgpack.packb(link(manifest, args.fast_test_edges).to_edge_list(with_test_edges=True))
+    print(f"{len(manifest.nodes)} nodes, cached edge list of {len(cache) // 1024} KiB")
+
+    changed = make_manifest(args.models, args.tests_per_model, random.Random(args.seed))
+    for i in rng.sample(range(10, args.models), args.changed):
+        changed.nodes[f"model.bench.m{i}"].depends_on_nodes = [f"model.bench.m{i - 1}"]
+    changed.child_map = build_child_map(changed.nodes)
+
+    print(f"{'project':<10} {'full link':>10} {'cached':>8}")
+    for name, project in (("unchanged", manifest), ("changed", changed)):
+        expected = link(project, args.fast_test_edges).graph
+        actual = link_cached(project, cache, args.fast_test_edges).graph
+        assert set(expected.nodes) == set(actual.nodes)
+        assert set(expected.edges(data="edge_type")) == set(actual.edges(data="edge_type"))
+
+        old = time_call(lambda: link(project, args.fast_test_edges), args.repeat)
+        new = time_call(lambda: link_cached(project, cache, args.fast_test_edges), args.repeat)
+        print(f"{name:<10} {old:>9.3f}s {new:>7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
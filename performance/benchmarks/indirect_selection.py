@@ -0,0 +1,210 @@
+"""Benchmark the indirect selection of tests in NodeSelector against the
+implementation it replaced, in each indirect selection mode, on a synthetic
+project where most models are selected by a union of two criteria.
+"""
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, Set, Tuple
+
+import networkx as nx
+
+from dbt.graph.graph import Graph, UniqueId
+from dbt.graph.selector import NodeSelector, can_select_indirectly
+from dbt.graph.selector_spec import IndirectSelection, SelectionCriteria, SelectionUnion
+from dbt.node_types import NodeType
+
+
+class PreviousNodeSelector(NodeSelector):
+    """NodeSelector with the previous indirect selection, which copied the
+    selected set for every test it checked."""
+
+    def expand_selection(
+        self,
+        selected: Set[UniqueId],
+        indirect_selection: IndirectSelection = IndirectSelection.Eager,
+    ) -> Tuple[Set[UniqueId], Set[UniqueId]]:
+        direct_nodes = set(selected)
+        indirect_nodes = set()
+        selected_and_parents = set()
+        if indirect_selection == IndirectSelection.Buildable:
+            selected_and_parents = selected.union(self.graph.select_parents(selected)).union(
+                self.manifest.sources
+            )
+
+        for unique_id in self.graph.select_successors(selected):
+            if unique_id in self.manifest.nodes:
+                node = self.manifest.nodes[unique_id]
+                if can_select_indirectly(node):
+                    if indirect_selection == IndirectSelection.Eager or set(
+                        node.depends_on_nodes
+                    ) <= set(selected):
+                        direct_nodes.add(unique_id)
+                    elif indirect_selection == IndirectSelection.Buildable and set(
+                        node.depends_on_nodes
+                    ) <= set(selected_and_parents):
+                        direct_nodes.add(unique_id)
+                    elif indirect_selection == IndirectSelection.Empty:
+                        pass
+                    else:
+                        indirect_nodes.add(unique_id)
+
+        return direct_nodes, indirect_nodes
+
+    def incorporate_indirect_nodes(
+        self,
+        direct_nodes: Set[UniqueId],
+        indirect_nodes: Set[UniqueId] = set(),
+        indirect_selection: IndirectSelection = IndirectSelection.Eager,
+    ) -> Set[UniqueId]:
+        if set(direct_nodes) == set(indirect_nodes):
+            return direct_nodes
+
+        selected = set(direct_nodes)
+
+        if indirect_selection == IndirectSelection.Cautious:
+            for unique_id in indirect_nodes:
+                if unique_id in self.manifest.nodes:
+                    node = self.manifest.nodes[unique_id]
+                    if set(node.depends_on_nodes) <= set(selected):
+                        selected.add(unique_id)
+        elif indirect_selection == IndirectSelection.Buildable:
+            selected_and_parents = selected.union(self.graph.select_parents(selected))
+            for unique_id in indirect_nodes:
+                if unique_id in self.manifest.nodes:
+                    node = self.manifest.nodes[unique_id]
+                    if set(node.depends_on_nodes) <= set(selected_and_parents):
+                        selected.add(unique_id)
+
+        return selected
+
+
+def make_node(unique_id: str, resource_type: NodeType, **kwargs) -> SimpleNamespace:
+    return SimpleNamespace(
+        unique_id=unique_id,
+        resource_type=resource_type,
+        package_name="bench",
+        fqn=unique_id.split("."),
+        is_versioned=False,
+        config=SimpleNamespace(enabled=True),
+        empty=False,
+        **kwargs,
+    )
+
+
+def make_project(
+    model_count: int, tests_per_model: int, selected: float, rng: random.Random
+) -> Tuple[Graph, SimpleNamespace]:
+    """Models in a DAG, tagged "left" or "right" when selected, each with
+    tests on itself and, for relationships tests, on another model."""
+    graph = nx.DiGraph()
+    nodes: Dict[str, SimpleNamespace] = {}
+    for i in range(model_count):
+        unique_id = f"model.bench.m{i}"
+        tags = []
+        if rng.random() < selected:
+            tags = [rng.choice(["left", "right"])]
+        parents = [f"model.bench.m{parent}" for parent in rng.sample(range(i), min(i, 2))]
+        nodes[unique_id] = make_node(
+            unique_id, NodeType.Model, tags=tags, depends_on_nodes=parents
+        )
+        graph.add_node(unique_id)
+        for parent in parents:
+            graph.add_edge(parent, unique_id)
+
+    for i in range(model_count):
+        for t in range(tests_per_model):
+            unique_id = f"test.bench.t{i}_{t}"
+            parents = [f"model.bench.m{i}"]
+            if t % 2 and i:
+                parents.append(f"model.bench.m{rng.randrange(i)}")
+            nodes[unique_id] = make_node(
+                unique_id, NodeType.Test, tags=[], depends_on_nodes=parents
+            )
+            for parent in parents:
+                graph.add_edge(parent, unique_id)
+
+    manifest = SimpleNamespace(
+        nodes=nodes,
+        sources={},
+        exposures={},
+        metrics={},
+        semantic_models={},
+        unit_tests={},
+        saved_queries={},
+        metadata=SimpleNamespace(project_name="bench"),
+    )
+    return Graph(graph), manifest
+
+
+def union_spec(indirect_selection: IndirectSelection) -> SelectionUnion:
+    return SelectionUnion(
+        [
+            SelectionCriteria(
+                raw=f"tag:{tag}",
+                method="tag",
+                method_arguments=[],
+                value=tag,
+                childrens_parents=False,
+                parents=False,
+                parents_depth=None,
+                children=False,
+                children_depth=None,
+                indirect_selection=indirect_selection,
+            )
+            for tag in ("left", "right")
+        ],
+        indirect_selection=indirect_selection,
+    )
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=5000)
+    parser.add_argument("--tests-per-model", type=int, default=4)
+    parser.add_argument(
+        "--selected", type=float, default=0.8, help="Fraction of models that are selected"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph, manifest = make_project(
+        args.models, args.tests_per_model, args.selected, random.Random(args.seed)
+    )
+    print(f"{'mode':<10} {'tests':>7} {'selected':>9} {'previous':>9} {'current':>8}")
+    for indirect_selection in IndirectSelection:
+        spec = union_spec(indirect_selection)
+        # new selectors each time, so that nothing is cached between runs
+        expected = PreviousNodeSelector(graph, manifest).select_nodes(spec)  # type: ignore
+        actual = NodeSelector(graph, manifest).select_nodes(spec)  # type: ignore
+        assert expected == actual
+
+        old = time_call(
+            lambda: PreviousNodeSelector(graph, manifest).select_nodes(spec),  # type: ignore
+            args.repeat,
+        )
+        new = time_call(
+            lambda: NodeSelector(graph, manifest).select_nodes(spec),  # type: ignore
+            args.repeat,
+        )
+        test_count = args.models * args.tests_per_model
+        print(
+            f"{indirect_selection.value:<10} {test_count:>7} {len(actual[0]):>9}"
+            f" {old:>8.3f}s {new:>7.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
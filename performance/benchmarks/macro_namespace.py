@@ -0,0 +1,130 @@
+"""Benchmark building the macro namespace for one node context against the
+eager builder it replaced, as the number of macros in installed packages grows.
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from dbt.clients.jinja import MacroStack
+from dbt.context.macros import MacroNamespace, MacroNamespaceBuilder
+from dbt.contracts.graph.nodes import Macro
+from dbt.node_types import NodeType
+
+INTERNAL_PACKAGES = ["dbt_postgres", "dbt"]
+ROOT_PACKAGE = "bench"
+
+
+def make_macros(package_name: str, count: int) -> Dict[str, Macro]:
+    macros = {}
+    for i in range(count):
+        name = f"macro_{i}"
+        macros[name] = Macro(
+            name=name,
+            resource_type=NodeType.Macro,
+            package_name=package_name,
+            path=f"macros/{name}.sql",
+            original_file_path=f"macros/{name}.sql",
+            unique_id=f"macro.{package_name}.{name}",
+            macro_sql=f"{{% macro {name}() %}}select {i}{{% endmacro %}}",
+        )
+    return macros
+
+
+def make_macros_by_package(
+    package_macro_count: int, package_count: int
+) -> Dict[str, Dict[str, Macro]]:
+    macros_by_package = {
+        "dbt": make_macros("dbt", 400),
+        "dbt_postgres": make_macros("dbt_postgres", 50),
+        ROOT_PACKAGE: make_macros(ROOT_PACKAGE, 50),
+    }
+    for i in range(package_count if package_macro_count else 0):
+        package_name = f"package_{i}"
+        macros_by_package[package_name] = make_macros(
+            package_name, package_macro_count // package_count
+        )
+    return macros_by_package
+
+
+def new_builder() -> MacroNamespaceBuilder:
+    return MacroNamespaceBuilder(ROOT_PACKAGE, ROOT_PACKAGE, MacroStack(), INTERNAL_PACKAGES)
+
+
+def eager_build_namespace(
+    builder: MacroNamespaceBuilder, macros_by_package: Dict[str, Dict[str, Macro]], ctx
+) -> MacroNamespace:
+    """The previous implementation of MacroNamespaceBuilder.build_namespace."""
+    for package in macros_by_package.values():
+        builder.add_macros(package.values(), ctx)
+
+    global_project_namespace: Dict[str, Any] = {}
+    for pkg in reversed(builder.internal_package_names_order):
+        if pkg in builder.internal_packages:
+            global_project_namespace.update(builder.internal_packages[pkg])
+
+    return MacroNamespace(
+        global_namespace=builder.globals,
+        local_namespace=builder.locals,
+        global_project_namespace=global_project_namespace,
+        packages=builder.packages,
+    )
+
+
+def context_keys(namespace: MacroNamespace) -> List[str]:
+    # ManifestContext.to_dict flattens the namespace into the context
+    return sorted(dict(namespace))
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--macros",
+        type=int,
+        nargs="+",
+        default=[0, 1000, 3000, 10000],
+        help="Numbers of macros in installed (non-root, non-adapter) packages",
+    )
+    parser.add_argument("--packages", type=int, default=10)
+    parser.add_argument("--contexts", type=int, default=100, help="Node contexts per timing")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'macros':>7} {'eager':>11} {'lazy':>11}  (per node context)")
+    for macro_count in args.macros:
+        macros_by_package = make_macros_by_package(macro_count, args.packages)
+        total = sum(len(macros) for macros in macros_by_package.values())
+
+        eager = eager_build_namespace(new_builder(), macros_by_package, {})
+        lazy = new_builder().build_namespace(macros_by_package, {})
+        assert context_keys(eager) == context_keys(lazy)
+        for package_name in ["dbt", *eager.packages]:
+            for name in eager.packages.get(package_name, eager.global_project_namespace):
+                assert (
+                    eager.get_from_package(package_name, name).macro  # type: ignore[union-attr]
+                    is lazy.get_from_package(package_name, name).macro  # type: ignore[union-attr]
+                )
+
+        def build(build_namespace: Callable[..., MacroNamespace]) -> None:
+            for _ in range(args.contexts):
+                dict(build_namespace(new_builder(), macros_by_package, {}))
+
+        old = time_call(lambda: build(eager_build_namespace), args.repeat) / args.contexts
+        new = (
+            time_call(lambda: build(MacroNamespaceBuilder.build_namespace), args.repeat)
+            / args.contexts
+        )
+        print(f"{total:>7} {old * 1000:>9.3f}ms {new * 1000:>9.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
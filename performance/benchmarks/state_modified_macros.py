@@ -0,0 +1,168 @@
+"""Benchmark the macro check behind state:modified (and state:modified.macros)
+against the per-node traversal it replaced, on a synthetic manifest where
+macros call other macros.
+"""
+
+import argparse
+import random
+import time
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import Callable, List, Set
+
+from dbt.artifacts.resources import MacroDependsOn
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import DependsOn, Macro, ModelNode, NodeConfig
+from dbt.graph.selector_methods import StateSelectorMethod
+from dbt.node_types import NodeType
+
+
+class TraversalStateSelectorMethod(StateSelectorMethod):
+    """The previous implementation of the macro check."""
+
+    def recursively_check_macros_modified(self, node, visited_macros):
+        if not hasattr(node, "depends_on"):
+            return False
+
+        for macro_uid in node.depends_on.macros:
+            if macro_uid in visited_macros:
+                continue
+            visited_macros.append(macro_uid)
+
+            if macro_uid in self.modified_macros:
+                return True
+
+            macro_node = self.manifest.macros[macro_uid]
+            if len(macro_node.depends_on.macros) > 0:
+                upstream_macros_changed = self.recursively_check_macros_modified(
+                    macro_node, visited_macros
+                )
+                if upstream_macros_changed:
+                    return True
+                continue
+
+            if len(node.depends_on.macros) > len(visited_macros):
+                continue
+
+        return False
+
+    def check_macros_modified(self, node):
+        if self.modified_macros is None:
+            self.modified_macros = list(self._macros_modified())
+        if not self.modified_macros:
+            return False
+        else:
+            visited_macros: List[str] = []
+            return self.recursively_check_macros_modified(node, visited_macros)
+
+
+def make_macro(i: int, depends_on: List[str]) -> Macro:
+    return Macro(
+        name=f"macro_{i}",
+        resource_type=NodeType.Macro,
+        package_name="bench",
+        path="macros/macros.sql",
+        original_file_path="macros/macros.sql",
+        unique_id=f"macro.bench.macro_{i}",
+        macro_sql=f"{{% macro macro_{i}() %}}{i}{{% endmacro %}}",
+        depends_on=MacroDependsOn(macros=depends_on),
+    )
+
+
+def make_model(i: int, depends_on_macros: List[str]) -> ModelNode:
+    return ModelNode(
+        language="sql",
+        raw_code="select 1",
+        database="dbt",
+        schema="dbt_schema",
+        alias=f"model_{i}",
+        name=f"model_{i}",
+        fqn=["bench", f"model_{i}"],
+        unique_id=f"model.bench.model_{i}",
+        package_name="bench",
+        path=f"model_{i}.sql",
+        original_file_path=f"models/model_{i}.sql",
+        config=NodeConfig(),
+        resource_type=NodeType.Model,
+        checksum=None,  # type: ignore[arg-type]
+        depends_on=DependsOn(macros=depends_on_macros),
+    )
+
+
+def make_manifests(macro_count: int, node_count: int, modified: float, rng: random.Random):
+    macros = []
+    for i in range(macro_count):
+        # macros mostly call a few lower level macros, like adapter dispatch chains
+        depends_on = [f"macro.bench.macro_{j}" for j in set(rng.sample(range(i), min(i, 3)))]
+        macros.append(make_macro(i, depends_on))
+    old_macros = list(macros)
+    for i in rng.sample(range(macro_count), max(1, int(macro_count * modified))):
+        old_macros[i] = replace(macros[i], macro_sql="changed")
+
+    nodes = [
+        make_model(i, [f"macro.bench.macro_{j}" for j in rng.sample(range(macro_count), 3)])
+        for i in range(node_count)
+    ]
+    manifest = Manifest(
+        macros={macro.unique_id: macro for macro in macros},
+        nodes={node.unique_id: node for node in nodes},
+    )
+    old_manifest = Manifest(macros={macro.unique_id: macro for macro in old_macros})
+    return manifest, SimpleNamespace(manifest=old_manifest)
+
+
+def modified_nodes(method: StateSelectorMethod) -> Set[str]:
+    return {
+        unique_id
+        for unique_id, node in method.manifest.nodes.items()
+        if method.check_macros_modified(node)
+    }
+
+
+def time_call(func: Callable[[], Set[str]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--macros", type=int, default=5000)
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument(
+        "--modified",
+        type=float,
+        nargs="+",
+        default=[0.0005, 0.01],
+        help="Fraction of macros modified",
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'macros':>7} {'nodes':>7} {'modified':>9} {'selected':>9} {'traversal':>10} {'set':>8}"
+    )
+    for modified in args.modified:
+        manifest, previous_state = make_manifests(args.macros, args.nodes, modified, rng)
+
+        def run(method_cls) -> Set[str]:
+            return modified_nodes(method_cls(manifest, previous_state, []))  # type: ignore
+
+        selected = run(StateSelectorMethod)
+        assert selected == run(TraversalStateSelectorMethod)
+
+        old = time_call(lambda: run(TraversalStateSelectorMethod), args.repeat)
+        new = time_call(lambda: run(StateSelectorMethod), args.repeat)
+        print(
+            f"{args.macros:>7} {args.nodes:>7} {modified:>9.2%} {len(selected):>9}"
+            f" {old:>9.3f}s {new:>7.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
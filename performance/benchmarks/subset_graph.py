@@ -0,0 +1,111 @@
+"""Benchmark Graph.get_subset_graph against the node contraction algorithm it
+replaced, on synthetic wide and deep DAGs with a narrow selection.
+"""
+
+import argparse
+import random
+import time
+from itertools import product
+from typing import Callable, Iterable, Set
+
+import networkx as nx
+
+from dbt.graph.graph import Graph, UniqueId
+
+
+def contraction_subset_graph(graph: nx.DiGraph, selected: Iterable[UniqueId]) -> nx.DiGraph:
+    """The previous implementation of Graph.get_subset_graph."""
+    new_graph: nx.DiGraph = graph.copy()
+    include_nodes: Set[UniqueId] = set(selected)
+
+    still_removing: bool = True
+    while still_removing:
+        nodes_to_remove = list(
+            node
+            for node in new_graph
+            if node not in include_nodes
+            and (new_graph.in_degree(node) * new_graph.out_degree(node)) == 0
+        )
+        if len(nodes_to_remove) == 0:
+            still_removing = False
+        else:
+            new_graph.remove_nodes_from(nodes_to_remove)
+
+    remaining_nodes = list(new_graph.nodes())
+    remaining_nodes.sort(key=lambda node: new_graph.in_degree(node) * new_graph.out_degree(node))
+
+    for node in remaining_nodes:
+        if node not in include_nodes:
+            source_nodes = [x for x, _ in new_graph.in_edges(node)]
+            target_nodes = [x for _, x in new_graph.out_edges(node)]
+            new_edges = product(source_nodes, target_nodes)
+            non_cyclic_new_edges = [
+                (source, target)
+                for source, target in new_edges
+                if source != target and not new_graph.has_edge(source, target)
+            ]
+            new_graph.add_edges_from(non_cyclic_new_edges)
+            new_graph.remove_node(node)
+
+    return new_graph
+
+
+def wide_dag(node_count: int, rng: random.Random) -> nx.DiGraph:
+    """A shallow DAG: a few layers of many models, each with several parents."""
+    layer_width = max(1, node_count // 5)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(f"model.bench.m{i}" for i in range(node_count))
+    for i in range(layer_width, node_count):
+        layer_start = (i // layer_width - 1) * layer_width
+        for parent in rng.sample(range(layer_start, layer_start + layer_width), 3):
+            graph.add_edge(f"model.bench.m{parent}", f"model.bench.m{i}")
+    return graph
+
+
+def deep_dag(node_count: int, rng: random.Random) -> nx.DiGraph:
+    """A deep DAG: long chains, each model depending on a few recent models."""
+    graph = nx.DiGraph()
+    graph.add_nodes_from(f"model.bench.m{i}" for i in range(node_count))
+    for i in range(1, node_count):
+        for parent in {i - 1, max(0, i - rng.randint(2, 20))}:
+            graph.add_edge(f"model.bench.m{parent}", f"model.bench.m{i}")
+    return graph
+
+
+def time_call(func: Callable[[], nx.DiGraph], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument(
+        "--selected", type=float, default=0.02, help="Fraction of nodes that are selected"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'shape':<6} {'nodes':>7} {'selected':>9} {'contraction':>12} {'reachability':>13}")
+    for shape, build in (("wide", wide_dag), ("deep", deep_dag)):
+        graph = build(args.nodes, rng)
+        selected = set(rng.sample(list(graph.nodes), max(1, int(args.nodes * args.selected))))
+
+        expected = contraction_subset_graph(graph, selected)
+        actual = Graph(graph).get_subset_graph(selected).graph
+        assert set(expected.nodes) == set(actual.nodes)
+        assert set(expected.edges) == set(actual.edges)
+
+        old = time_call(lambda: contraction_subset_graph(graph, selected), args.repeat)
+        new = time_call(lambda: Graph(graph).get_subset_graph(selected), args.repeat)
+        print(f"{shape:<6} {len(graph):>7} {len(selected):>9} {old:>11.3f}s {new:>12.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Generate a synthetic dbt project for performance testing.
+
+Models are laid out in layers: each model refs --fan-in models of the layer
+before it, so --depth sets the length of the longest ref chain (a depth equal
+to --models is a single chain) and a depth of 1 gives a wide, flat project.
+Every model calls one of --macros macros, which call each other, and has
+--columns documented columns with --tests-per-model generic tests in the
+schema file of its layer. Local packages, microbatch models and unit tests can
+be added on top.
+"""
+
+import argparse
+import os
+import random
+import shutil
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+GENERIC_TESTS = ["unique", "not_null", "accepted_values", "relationships"]
+
+
+def write(path: str, contents: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fp:
+        fp.write(contents)
+
+
+def write_yaml(path: str, data: Dict[str, Any]) -> None:
+    write(path, yaml.safe_dump(data, sort_keys=False))
+
+
+def layer_sizes(models: int, depth: int) -> List[int]:
+    depth = max(1, min(depth, models))
+    return [models // depth + (1 if layer < models % depth else 0) for layer in range(depth)]
+
+
+def macro_sql(index: int, rng: random.Random) -> str:
+    # macros mostly call a couple of lower level macros, like dispatch chains do
+    calls = " ~ ".join(
+        f"macro_{j}(column)" for j in sorted(rng.sample(range(index), min(index, 2)))
+    )
+    body = calls if calls else "column"
+    return f"{{% macro macro_{index}(column) %}}{{{{ {body} }}}}{{% endmacro %}}\n"
+
+
+def model_sql(layer: int, refs: List[str], columns: int, macro: Optional[str]) -> str:
+    if layer == 0:
+        selects = ["1 as id", "current_timestamp as event_time"]
+        selects += [f"'{column}' as column_{column}" for column in range(columns)]
+        config = "{{ config(event_time='event_time') }}\n\n"
+        return config + "select\n    " + ",\n    ".join(selects) + "\n"
+
+    id_column = f"{refs[0]}.id"
+    if macro:
+        id_column = f"{{{{ {macro}('{id_column}') }}}}"
+    selects = [f"{id_column} as id", f"{refs[0]}.event_time"]
+    selects += [f"{refs[0]}.column_{column}" for column in range(columns)]
+    sql = "select\n    " + ",\n    ".join(selects)
+    sql += f"\nfrom {{{{ ref('{refs[0]}') }}}} as {refs[0]}"
+    for ref in refs[1:]:
+        sql += f"\njoin {{{{ ref('{ref}') }}}} as {ref} on {ref}.id = {refs[0]}.id"
+    return sql + "\n"
+
+
+def model_tests(count: int, first_model: str) -> List[Any]:
+    tests: List[Any] = []
+    for index in range(count):
+        name = GENERIC_TESTS[index % len(GENERIC_TESTS)]
+        if name == "accepted_values":
+            tests.append({name: {"values": [1, 2, 3]}})
+        elif name == "relationships":
+            tests.append({name: {"to": f"ref('{first_model}')", "field": "id"}})
+        else:
+            tests.append(name)
+    return tests
+
+
+def model_yaml(name: str, columns: int, tests: int, first_model: str) -> Dict[str, Any]:
+    id_column: Dict[str, Any] = {"name": "id", "description": f"The id of {name}."}
+    if tests:
+        id_column["data_tests"] = model_tests(tests, first_model)
+    return {
+        "name": name,
+        "description": f"Model {name}, generated for performance testing.",
+        "columns": [id_column]
+        + [
+            {"name": f"column_{column}", "description": f"Column {column} of {name}."}
+            for column in range(columns)
+        ],
+    }
+
+
+def unit_test_yaml(name: str, refs: List[str]) -> Dict[str, Any]:
+    return {
+        "name": f"test_{name}",
+        "model": name,
+        "given": [{"input": f"ref('{ref}')", "rows": [{"id": 1}, {"id": 2}]} for ref in refs],
+        "expect": {"rows": [{"id": 1}, {"id": 2}]},
+    }
+
+
+def generate_package(path: str, name: str, models: int, macros: int) -> None:
+    write_yaml(
+        os.path.join(path, "dbt_project.yml"),
+        {"name": name, "version": "1.0.0", "config-version": 2},
+    )
+    for index in range(macros):
+        write(
+            os.path.join(path, "macros", f"{name}_macro_{index}.sql"),
+            f"{{% macro {name}_macro_{index}(column) %}}{{{{ column }}}}{{% endmacro %}}\n",
+        )
+    for index in range(models):
+        write(
+            os.path.join(path, "models", f"{name}_model_{index}.sql"),
+            f"select {index} as id\n",
+        )
+
+
+def generate_project(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    path = args.output
+    if os.path.exists(path):
+        # only ever replace a project, not an arbitrary directory
+        if os.listdir(path) and not os.path.exists(os.path.join(path, "dbt_project.yml")):
+            raise SystemExit(f"{path} is not empty and isn't a dbt project")
+        shutil.rmtree(path)
+
+    write_yaml(
+        os.path.join(path, "dbt_project.yml"),
+        {
+            "name": "synthetic",
+            "version": "1.0.0",
+            "config-version": 2,
+            "profile": "default",
+            "model-paths": ["models"],
+            "macro-paths": ["macros"],
+            "target-path": "target",
+            "clean-targets": ["target", "dbt_packages"],
+            "models": {"synthetic": {"+materialized": "view"}},
+        },
+    )
+
+    for index in range(args.macros):
+        write(os.path.join(path, "macros", f"macro_{index}.sql"), macro_sql(index, rng))
+
+    layers: List[List[str]] = []
+    model_index = 0
+    unit_tests = args.unit_tests
+    for layer, size in enumerate(layer_sizes(args.models, args.depth)):
+        names = [f"model_{model_index + offset}" for offset in range(size)]
+        model_index += size
+        layers.append(names)
+
+        schema: Dict[str, Any] = {"models": [], "unit_tests": []}
+        for name in names:
+            refs = []
+            if layer:
+                refs = rng.sample(layers[layer - 1], min(args.fan_in, len(layers[layer - 1])))
+            macro = f"macro_{rng.randrange(args.macros)}" if args.macros else None
+            write(
+                os.path.join(path, "models", f"layer_{layer}", f"{name}.sql"),
+                model_sql(layer, refs, args.columns, macro),
+            )
+            schema["models"].append(
+                model_yaml(name, args.columns, args.tests_per_model, layers[0][0])
+            )
+            if refs and unit_tests:
+                schema["unit_tests"].append(unit_test_yaml(name, refs))
+                unit_tests -= 1
+        if not schema["unit_tests"]:
+            del schema["unit_tests"]
+        write_yaml(os.path.join(path, "models", f"layer_{layer}", "schema.yml"), schema)
+
+    for index in range(args.microbatch):
+        ref = rng.choice(layers[0])
+        write(
+            os.path.join(path, "models", "microbatch", f"microbatch_{index}.sql"),
+            "{{ config(materialized='incremental', incremental_strategy='microbatch', "
+            "unique_key='id', event_time='event_time', batch_size='day', "
+            "begin=modules.datetime.datetime(2020, 1, 1)) }}\n\n"
+            f"select * from {{{{ ref('{ref}') }}}}\n",
+        )
+
+    if args.packages:
+        packages = []
+        for index in range(args.packages):
+            name = f"package_{index}"
+            generate_package(
+                os.path.join(path, "packages", name), name, args.package_models, args.macros // 10
+            )
+            packages.append({"local": f"packages/{name}"})
+        write_yaml(os.path.join(path, "packages.yml"), {"packages": packages})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", help="Directory to write the project to, replacing it")
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--depth", type=int, default=10, help="Number of layers of models")
+    parser.add_argument("--fan-in", type=int, default=2, help="Refs per model")
+    parser.add_argument("--macros", type=int, default=500)
+    parser.add_argument("--columns", type=int, default=10, help="Documented columns per model")
+    parser.add_argument("--tests-per-model", type=int, default=2)
+    parser.add_argument("--packages", type=int, default=0, help="Number of local packages")
+    parser.add_argument("--package-models", type=int, default=20, help="Models per package")
+    parser.add_argument("--microbatch", type=int, default=0, help="Number of microbatch models")
+    parser.add_argument("--unit-tests", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    generate_project(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
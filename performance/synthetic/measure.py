@@ -0,0 +1,189 @@
+"""Measure the wall time and peak memory of dbt commands on projects made with
+generate_project.py, and optionally compare them to a previous run.
+
+Commands that need the database (compile, docs generate) use the profile in
+performance/project_config, like the projects of the regression test runner.
+"""
+
+import argparse
+import json
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple, Union
+
+PROFILES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "project_config")
+
+# the model that "one-file edit" metrics change, it's in every generated project
+EDITED_FILE = os.path.join("models", "layer_0", "model_0.sql")
+EDIT_MARKER = "-- edited for performance testing\n"
+
+Step = Union[List[str], Callable[[str], None]]
+
+
+def edit_one_file(project_dir: str) -> None:
+    """Change the contents of one model, alternating between two versions so
+    that every edit changes its checksum."""
+    path = os.path.join(project_dir, EDITED_FILE)
+    with open(path) as fp:
+        contents = fp.read()
+    if contents.endswith(EDIT_MARKER):
+        contents = contents[: -len(EDIT_MARKER)]
+    else:
+        contents += EDIT_MARKER
+    with open(path, "w") as fp:
+        fp.write(contents)
+
+
+def undo_edit(project_dir: str) -> None:
+    path = os.path.join(project_dir, EDITED_FILE)
+    with open(path) as fp:
+        contents = fp.read()
+    if contents.endswith(EDIT_MARKER):
+        with open(path, "w") as fp:
+            fp.write(contents[: -len(EDIT_MARKER)])
+
+
+@dataclass
+class Metric:
+    name: str
+    command: List[str]
+    # run before every measured run of the command, and not measured
+    prepare: List[Step] = field(default_factory=list)
+
+
+METRICS = [
+    Metric("parse", ["parse"], prepare=[["clean"], ["deps"]]),
+    Metric("partial_parse_one_file_edit", ["parse"], prepare=[["parse"], edit_one_file]),
+    Metric(
+        "ls_state_modified",
+        ["ls", "--select", "state:modified+", "--state", "state"],
+        prepare=[["parse", "--target-path", "state"], edit_one_file, ["parse"]],
+    ),
+    Metric("compile", ["compile"], prepare=[["parse"]]),
+    Metric("docs_generate_empty_catalog", ["docs", "generate", "--empty-catalog"]),
+]
+
+
+def run_dbt(dbt: List[str], args: List[str], project_dir: str) -> Tuple[float, int]:
+    """Run a dbt command, returning its wall time in seconds and its peak
+    resident memory in bytes."""
+    cmd = dbt + args + ["--profiles-dir", PROFILES_DIR]
+    env = {**os.environ, "DBT_SEND_ANONYMOUS_USAGE_STATS": "false"}
+    with tempfile.TemporaryFile() as output:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            cmd, cwd=project_dir, env=env, stdout=output, stderr=subprocess.STDOUT
+        )
+        # wait4 gives the resource usage of this one child, rather than the peak
+        # over every child so far
+        _, status, rusage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if process.returncode != 0:
+            output.seek(0)
+            raise SystemExit(
+                f"`{shlex.join(cmd)}` failed in {project_dir}:\n{output.read().decode()}"
+            )
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS
+    peak_rss = rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+    return elapsed, peak_rss
+
+
+def measure(dbt: List[str], metric: Metric, project_dir: str, runs: int) -> Dict[str, float]:
+    times: List[float] = []
+    peak_rss: List[int] = []
+    try:
+        # the first run warms filesystem caches and isn't counted
+        for run in range(runs + 1):
+            for step in metric.prepare:
+                if callable(step):
+                    step(project_dir)
+                else:
+                    run_dbt(dbt, step, project_dir)
+            elapsed, rss = run_dbt(dbt, metric.command, project_dir)
+            if run:
+                times.append(elapsed)
+                peak_rss.append(rss)
+    finally:
+        undo_edit(project_dir)
+    return {
+        "mean": statistics.mean(times),
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "min": min(times),
+        "max": max(times),
+        "peak_rss": max(peak_rss),
+    }
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float
+) -> List[str]:
+    regressions = []
+    for key, result in sorted(results.items()):
+        if key not in baseline:
+            continue
+        for stat in ("mean", "peak_rss"):
+            limit = baseline[key][stat] * (1 + tolerance)
+            if result[stat] > limit:
+                regressions.append(f"{key} {stat}: {result[stat]:.2f} > {limit:.2f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("projects", nargs="+", help="Project directories to measure")
+    parser.add_argument(
+        "--metrics",
+        nargs="+",
+        choices=[metric.name for metric in METRICS],
+        default=[metric.name for metric in METRICS],
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--dbt", default="dbt", help="The dbt command to run")
+    parser.add_argument("--output", help="Write the results to this json file")
+    parser.add_argument("--baseline", help="Compare to the results in this json file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Fraction over the baseline mean time or peak memory that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    dbt = shlex.split(args.dbt)
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'project':<30} {'metric':<30} {'mean':>8} {'stddev':>8} {'peak rss':>10}")
+    for project_dir in args.projects:
+        project_name = os.path.basename(os.path.normpath(project_dir))
+        for metric in METRICS:
+            if metric.name not in args.metrics:
+                continue
+            result = measure(dbt, metric, project_dir, args.runs)
+            # named like the metrics of the regression test runner
+            results[f"{metric.name}___{project_name}"] = result
+            print(
+                f"{project_name:<30} {metric.name:<30} {result['mean']:>7.2f}s"
+                f" {result['stddev']:>7.2f}s {result['peak_rss'] / 2**20:>8.0f}MB"
+            )
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            regressions = find_regressions(results, json.load(fp), args.tolerance)
+        if regressions:
+            print("Regressions found:\n" + "\n".join(regressions))
+            sys.exit(1)
+        print("No regressions found")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import pytest
 
 from dbt.artifacts.resources import RefArgs
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.partial_parse_file import read_manifest
 from dbt.tests.util import run_dbt
 
 
@@ -11,8 +12,7 @@ def get_manifest():
     path = "./target/partial_parse.msgpack"
     if os.path.exists(path):
         with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+            manifest: Manifest = read_manifest(fp)
         return manifest
     else:
         return None
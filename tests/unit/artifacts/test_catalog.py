@@ -0,0 +1,50 @@
+import json
+from datetime import datetime
+
+from dbt.artifacts.schemas.catalog import (
+    CatalogArtifact,
+    CatalogTable,
+    ColumnMetadata,
+    StatsItem,
+    TableMetadata,
+)
+from dbt_common.clients.system import write_json
+
+
+def make_table(name: str, unique_id: str) -> CatalogTable:
+    return CatalogTable(
+        metadata=TableMetadata(
+            type="BASE TABLE", schema="test_schema", name=name, database=None, comment="ünïcode"
+        ),
+        columns={
+            "id": ColumnMetadata(type="integer", index=1, name="id", comment=None),
+        },
+        stats={
+            "has_stats": StatsItem(
+                id="has_stats", label="Has Stats?", value=False, include=False, description=""
+            )
+        },
+        unique_id=unique_id,
+    )
+
+
+def test_write_catalog_artifact(tmp_path):
+    catalog = CatalogArtifact.from_results(
+        generated_at=datetime(2024, 1, 1),
+        nodes={
+            "model.test.a": make_table("a", "model.test.a"),
+            "model.test.b": make_table("b", "model.test.b"),
+        },
+        sources={},
+        compile_results=None,
+        errors=["an error"],
+    )
+    catalog.write(str(tmp_path / "target" / "catalog.json"))
+    write_json(
+        str(tmp_path / "expected.json"),
+        catalog.to_dict(omit_none=False, context={"artifact": True}),
+    )
+
+    written = (tmp_path / "target" / "catalog.json").read_text()
+    assert written == (tmp_path / "expected.json").read_text()
+    assert CatalogArtifact.from_dict(json.loads(written)).nodes == catalog.nodes
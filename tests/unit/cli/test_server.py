@@ -0,0 +1,204 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from dbt.artifacts.schemas.results import RunStatus
+from dbt.artifacts.schemas.run import RunExecutionResult, RunResult
+from dbt.cli.main import dbtRunnerResult
+from dbt.cli.server import ManifestServer, ProjectWatcher, serialize_result
+from dbt.contracts.graph.manifest import Manifest
+from dbt.exceptions import DbtRuntimeError
+
+
+def write(path, contents: str = "select 1") -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fp:
+        fp.write(contents)
+
+
+@pytest.fixture
+def project_root(tmp_path) -> str:
+    write(str(tmp_path / "dbt_project.yml"), "name: test\ntarget-path: build\n")
+    write(str(tmp_path / "models" / "model_one.sql"))
+    write(str(tmp_path / "models" / "model_two.sql"))
+    write(str(tmp_path / "build" / "compiled.sql"))
+    write(str(tmp_path / ".git" / "HEAD.sql"))
+    return str(tmp_path)
+
+
+class TestProjectWatcher:
+    def test_poll(self, project_root):
+        watcher = ProjectWatcher.for_project(project_root)
+        assert set(watcher._mtimes) == {
+            "dbt_project.yml",
+            "models/model_one.sql",
+            "models/model_two.sql",
+        }
+        assert not watcher.poll()
+
+        write(os.path.join(project_root, "models", "model_one.sql"), "select 2")
+        os.utime(os.path.join(project_root, "models", "model_one.sql"), (1, 1))
+        os.remove(os.path.join(project_root, "models", "model_two.sql"))
+        write(os.path.join(project_root, "models", "model_three.sql"), "select 3")
+        write(os.path.join(project_root, "build", "model_three.sql"))
+
+        changes = watcher.poll()
+        assert not changes.requires_full_parse
+        assert changes.file_diff.deleted == ["models/model_two.sql"]
+        assert [(f.path, f.content) for f in changes.file_diff.changed] == [
+            ("models/model_one.sql", "select 2")
+        ]
+        assert [(f.path, f.content) for f in changes.file_diff.added] == [
+            ("models/model_three.sql", "select 3")
+        ]
+        assert not watcher.poll()
+
+    def test_project_config_requires_full_parse(self, project_root):
+        watcher = ProjectWatcher.for_project(project_root)
+        write(os.path.join(project_root, "packages.yml"), "packages: []")
+        assert watcher.poll().requires_full_parse
+
+    @pytest.mark.parametrize("error", [FileNotFoundError, UnicodeDecodeError])
+    def test_unreadable_file_requires_full_parse(self, project_root, error):
+        watcher = ProjectWatcher.for_project(project_root)
+        model_one = os.path.join(project_root, "models", "model_one.sql")
+        model_two = os.path.join(project_root, "models", "model_two.sql")
+        if error is UnicodeDecodeError:
+            with open(model_one, "wb") as fp:
+                fp.write(b"select '\xff'")
+        os.utime(model_one, (1, 1))
+        write(os.path.join(project_root, "models", "model_three.sql"), "select 3")
+        scan = watcher._scan
+
+        def scan_then_change():
+            mtimes = scan()
+            if error is FileNotFoundError:
+                os.remove(model_one)
+            return mtimes
+
+        with mock.patch.object(watcher, "_scan", scan_then_change):
+            changes = watcher.poll()
+        assert changes.requires_full_parse
+        assert not changes.file_diff.changed and not changes.file_diff.added
+
+        # the full parse reads the files as they are now, so they are not
+        # reported again on the next poll
+        expected = {"dbt_project.yml", "models/model_two.sql", "models/model_three.sql"}
+        if error is UnicodeDecodeError:
+            expected.add("models/model_one.sql")
+        assert set(watcher._mtimes) == expected
+        os.utime(model_two, (1, 1))
+        changes = watcher.poll()
+        assert not changes.requires_full_parse
+        assert changes.file_diff.deleted == []
+        assert [f.path for f in changes.file_diff.changed] == ["models/model_two.sql"]
+
+
+class TestManifestServer:
+    @pytest.fixture
+    def server(self, project_root) -> ManifestServer:
+        server = ManifestServer(project_root, ["--profiles-dir", project_root])
+        server.watcher = ProjectWatcher.for_project(project_root)
+        server.manifest = Manifest()
+        server._needs_full_parse = False
+        return server
+
+    @pytest.mark.parametrize(
+        "args,error",
+        [
+            (None, "non-empty list of strings"),
+            (["seed"], "Command 'seed' is not served"),
+            (["run", "--vars={a: 1}"], "'--vars={a: 1}' is set when the server starts"),
+            (["ls", "--target", "prod"], "'--target' is set when the server starts"),
+        ],
+    )
+    def test_invalid_requests(self, server, args, error):
+        response = server.handle_request({"args": args})
+        assert not response["success"]
+        assert error in response["exception"]
+
+    @pytest.mark.parametrize("command,copied", [("ls", False), ("run", True)])
+    def test_handle_request(self, server, command, copied):
+        with mock.patch("dbt.cli.server.dbtRunner") as runner_cls:
+            runner_cls.return_value.invoke.return_value = dbtRunnerResult(
+                success=True, result=["test.model_one"]
+            )
+            response = server.handle_request({"args": [command, "--select", "model_one"]})
+
+        assert response == {"success": True, "result": ["test.model_one"], "exception": None}
+        assert (runner_cls.call_args.kwargs["manifest"] is not server.manifest) == copied
+        invoked_args = runner_cls.return_value.invoke.call_args.args[0]
+        assert invoked_args[:3] == [command, "--select", "model_one"]
+        assert invoked_args[3:] == server.server_args
+
+    @pytest.mark.parametrize(
+        "needs_full_parse,changed_file,diff_parse",
+        [
+            (False, "models/model_one.sql", True),
+            (False, "dbt_project.yml", False),
+            (True, "models/model_one.sql", False),
+        ],
+    )
+    def test_refresh(self, server, project_root, needs_full_parse, changed_file, diff_parse):
+        server._needs_full_parse = needs_full_parse
+        path = os.path.join(project_root, changed_file)
+        os.utime(path, (1, 1))
+        with mock.patch("dbt.cli.server._ParseRunner") as runner_cls:
+            runner_cls.return_value.invoke.return_value = dbtRunnerResult(
+                success=True, result=Manifest()
+            )
+            server.refresh()
+            file_diff = runner_cls.call_args.args[0]
+            assert (file_diff is not None) == diff_parse
+            if diff_parse:
+                assert [f.path for f in file_diff.changed] == [changed_file]
+
+            # nothing changed since
+            runner_cls.reset_mock()
+            server.refresh()
+            runner_cls.assert_not_called()
+
+    def test_failed_refresh_keeps_manifest(self, server, project_root):
+        manifest = server.manifest
+        os.utime(os.path.join(project_root, "models", "model_one.sql"), (1, 1))
+        with mock.patch("dbt.cli.server._ParseRunner") as runner_cls:
+            runner_cls.return_value.invoke.return_value = dbtRunnerResult(success=False)
+            server.refresh()
+        assert server.manifest is manifest
+        assert server._needs_full_parse
+
+
+def test_serve_forever_refuses_to_remove_other_files(tmp_path):
+    socket_path = str(tmp_path / "dbt.sock")
+    write(socket_path, "not a socket")
+    server = ManifestServer(str(tmp_path), [])
+    with mock.patch("socketserver.UnixStreamServer") as server_cls:
+        with pytest.raises(DbtRuntimeError, match="not a socket"):
+            server.serve_forever(socket_path)
+    server_cls.assert_not_called()
+    assert os.path.exists(socket_path)
+
+
+def test_serialize_result(table_model):
+    run_result = RunResult(
+        status=RunStatus.Success,
+        timing=[],
+        thread_id="Thread-1",
+        execution_time=1.5,
+        adapter_response={},
+        message="OK",
+        failures=None,
+        node=table_model,
+        batch_results=None,
+    )
+    result = dbtRunnerResult(
+        success=True, result=RunExecutionResult(results=[run_result], elapsed_time=2.0)
+    )
+    serialized = serialize_result(result)
+    assert serialized["success"]
+    assert serialized["result"]["elapsed_time"] == 2.0
+    assert serialized["result"]["results"][0]["unique_id"] == table_model.unique_id
+    assert serialized["result"]["results"][0]["status"] == "success"
+    assert json.loads(json.dumps(serialized)) == serialized
@@ -3,7 +3,7 @@ from contextlib import contextmanager
 import pytest
 import yaml
 
-from dbt.clients.jinja import get_rendered, get_template
+from dbt.clients.jinja import RenderCache, get_rendered, get_template
 from dbt_common.exceptions import JinjaRenderingError
 
 
@@ -414,3 +414,36 @@ def test_native_render():
     s = "{{ 1991 | as_text }}"
     value = get_rendered(s, {}, native=True)
     assert value == "1991"
+
+
+class TestRenderCache:
+    def test_lru_eviction(self):
+        cache = RenderCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        # "b" was the least recently used
+        assert list(cache._entries) == ["a", "c"]
+        assert cache.get("c") == 3
+        assert cache.get("b") != 2
+        info = cache.info()
+        assert (info.hits, info.misses, info.size, info.max_size) == (2, 1, 2, 2)
+
+    def test_get_rendered_reuses_compiled_templates(self, mocker):
+        cache = RenderCache()
+        mocker.patch("dbt.clients.jinja._render_cache", cache)
+
+        assert get_rendered("{{ a }}", {"a": "1"}, native=False) == "1"
+        assert get_rendered("{{ a }}", {"a": "2"}, native=False) == "2"
+        assert get_rendered("{{ a }}", {"a": 3}, native=True) == 3
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        # globals from an earlier render don't leak into the cached template
+        assert get_rendered("{{ a is defined }}", {"a": 1}, native=True) is True
+        assert get_rendered("{{ a is defined }}", {}, native=True) is False
+
+        # native renders of strings without jinja are cached as values
+        assert get_rendered("1991", {}, native=True) == "1991"
+        assert get_rendered("1991", {}, native=True) == "1991"
+        assert cache.info().hits == 3
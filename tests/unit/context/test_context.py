@@ -542,6 +542,41 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result["some_macro"].macro is package_macro
 
 
+def test_macro_namespace_binds_packages_lazily():
+    mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt"])
+    mbp = {
+        "root": {"root_macro": mock_macro("root_macro", "root")},
+        "search": {"local_macro": mock_macro("local_macro", "search")},
+        "other": {
+            "macro_a": mock_macro("macro_a", "other"),
+            "macro_b": mock_macro("macro_b", "other"),
+        },
+    }
+    ctx: Dict[str, Any] = {}
+    namespace = mn.build_namespace(mbp, ctx)
+
+    other = namespace.packages["other"]
+    assert isinstance(other, macros.MacroPackageNamespace)
+    assert other._generators == {}
+    assert namespace.local_namespace["local_macro"] is namespace.packages["search"]["local_macro"]
+    assert namespace.global_namespace["root_macro"] is namespace.packages["root"]["root_macro"]
+
+    macro_a = namespace.get_from_package("other", "macro_a")
+    assert macro_a.macro is mbp["other"]["macro_a"]
+    assert macro_a.context is ctx
+    assert namespace.get_from_package("other", "macro_a") is macro_a
+    assert list(other._generators) == ["macro_a"]
+    assert namespace.get_from_package("other", "missing") is None
+
+    # overrides only apply to this namespace, and are visible through iteration
+    other["macro_b"] = "override"
+    other["macro_c"] = "added"
+    assert other["macro_b"] == "override"
+    assert list(other) == ["macro_a", "macro_b", "macro_c"]
+    assert len(other) == 3
+    assert "macro_c" not in mbp["other"]
+
+
 def test_dbt_metadata_envs(
     monkeypatch, config_postgres, manifest_fx, get_adapter, get_include_paths
 ):
@@ -26,7 +26,12 @@ from dbt.artifacts.resources import (
     WhereFilterIntersection,
 )
 from dbt.contracts.files import FileHash
-from dbt.contracts.graph.manifest import DisabledLookup, Manifest, ManifestMetadata
+from dbt.contracts.graph.manifest import (
+    DisabledLookup,
+    FixtureRowsCache,
+    Manifest,
+    ManifestMetadata,
+)
 from dbt.contracts.graph.nodes import (
     DependsOn,
     Exposure,
@@ -2163,3 +2168,37 @@ class TestDisabledLookup:
         lookup = DisabledLookup(manifest)
 
         assert lookup.find("name", "package", resource_types=[]) is None
+
+
+class TestFixtureRowsCache:
+    def test_get_rows(self):
+        cache = FixtureRowsCache()
+        load = mock.Mock(return_value=[{"a": "1", "b": None}, {"a": "2", "b": "x"}])
+
+        rows = cache.get_rows("pkg://seeds/seed.csv", "abc", load)
+        cached_rows = cache.get_rows("pkg://seeds/seed.csv", "abc", load)
+        assert load.call_count == 1
+        assert cached_rows == rows
+        # every caller gets its own rows to modify
+        assert cached_rows[0] is not rows[0]
+        cached_rows[0]["a"] = "changed"
+        assert cache.get_rows("pkg://seeds/seed.csv", "abc", load)[0]["a"] == "1"
+
+        # a new checksum loads the file again
+        cache.get_rows("pkg://seeds/seed.csv", "def", load)
+        assert load.call_count == 2
+        cache.evict("pkg://seeds/seed.csv")
+        cache.get_rows("pkg://seeds/seed.csv", "def", load)
+        assert load.call_count == 3
+
+    def test_ragged_rows_not_cached(self):
+        cache = FixtureRowsCache()
+        load = mock.Mock(return_value=[{"a": "1"}, {"b": "2"}])
+        cache.get_rows("pkg://seeds/seed.csv", "abc", load)
+        assert cache.get_rows("pkg://seeds/seed.csv", "abc", load) == [{"a": "1"}, {"b": "2"}]
+        assert load.call_count == 2
+
+    def test_no_columns(self):
+        cache = FixtureRowsCache()
+        cache.get_rows("pkg://seeds/seed.csv", "abc", lambda: [{}, {}])
+        assert cache.get_rows("pkg://seeds/seed.csv", "abc", lambda: []) == [{}, {}]
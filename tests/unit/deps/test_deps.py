@@ -1,3 +1,7 @@
+import os
+import shutil
+import tempfile
+import threading
 import unittest
 from argparse import Namespace
 from copy import deepcopy
@@ -5,6 +9,7 @@ from unittest import mock
 
 import dbt.deps
 import dbt.exceptions
+import dbt.utils
 from dbt.clients.registry import is_compatible_version
 from dbt.config.project import PartialProject
 from dbt.config.renderer import DbtProjectYamlRenderer
@@ -15,9 +20,11 @@ from dbt.contracts.project import (
     RegistryPackage,
     TarballPackage,
 )
-from dbt.deps.git import GitUnpinnedPackage
+from dbt.deps.base import map_packages
+from dbt.deps.cache import PackageCache
+from dbt.deps.git import GitPinnedPackage, GitUnpinnedPackage
 from dbt.deps.local import LocalPinnedPackage, LocalUnpinnedPackage
-from dbt.deps.registry import RegistryUnpinnedPackage
+from dbt.deps.registry import RegistryPinnedPackage, RegistryUnpinnedPackage
 from dbt.deps.resolver import resolve_packages
 from dbt.deps.tarball import TarballUnpinnedPackage
 from dbt.flags import set_from_args
@@ -297,6 +304,23 @@ class TestGitPackage(unittest.TestCase):
         self.assertEqual(a_pinned.source_type(), "git")
         self.assertIs(a_pinned.warn_unpinned, True)
 
+    @mock.patch("dbt.clients.git.run_cmd")
+    def test_get_remote_sha(self, mock_run_cmd):
+        tag, commit, branch = "a" * 40, "b" * 40, "c" * 40
+        mock_run_cmd.return_value = (
+            f"{branch}\trefs/heads/v1\n{tag}\trefs/tags/v1\n{commit}\trefs/tags/v1^{{}}\n".encode(),
+            b"",
+        )
+        package = GitPinnedPackage("https://a/b.git", "https://a/b.git", "v1")
+        with mock.patch("dbt.deps.git.get_downloads_path", return_value="/tmp"):
+            # the commit of an annotated tag, which is preferred to a branch
+            self.assertEqual(package.get_remote_sha(), commit)
+            mock_run_cmd.return_value = (b"", b"")
+            self.assertIsNone(package.get_remote_sha())
+        self.assertEqual(
+            mock_run_cmd.call_args.args[1], ["git", "ls-remote", "https://a/b.git", "v1", "v1^{}"]
+        )
+
 
 class TestHubPackage(unittest.TestCase):
     def setUp(self):
@@ -791,6 +815,27 @@ class TestPackageSpec(unittest.TestCase):
         self.assertEqual(resolved[1].name, "dbt-labs-test/b")
         self.assertEqual(resolved[1].version, "0.2.1")
 
+    def test_dependency_resolution_threads(self):
+        package_config = PackageConfig.from_dict(
+            {
+                "packages": [
+                    {"package": "dbt-labs-test/b", "version": "0.2.1"},
+                    {"package": "dbt-labs-test/a", "version": ">0.1.2"},
+                ],
+            }
+        )
+        project = mock.MagicMock(project_name="test")
+        with mock.patch("dbt.deps.resolver.registry") as resolver_registry:
+            resolved = resolve_packages(package_config.packages, project, {}, threads=4)
+        resolver_registry.index_cached.assert_called_with()
+        serial = resolve_packages(package_config.packages, project, {})
+        self.assertEqual(
+            [package.to_dict() for package in resolved], [package.to_dict() for package in serial]
+        )
+        self.assertEqual(
+            [package.name for package in resolved], ["dbt-labs-test/b", "dbt-labs-test/a"]
+        )
+
     def test_private_package_raise_error(self):
         package_config = PackageConfig.from_dict(
             {
@@ -840,3 +885,121 @@ class TestPackageSpec(unittest.TestCase):
 
         msg = "dbt-labs was not found in the package index. Packages on the index require a namespace, e.g dbt-labs/dbt_utils"
         assert msg in str(exc.exception)
+
+
+class TestMapPackages(unittest.TestCase):
+    def test_serial_is_lazy(self):
+        calls = []
+        results = map_packages(calls.append, ["a", "b"])
+        self.assertEqual(calls, [])
+        next(results)
+        self.assertEqual(calls, ["a"])
+
+    def test_concurrent_keeps_order(self):
+        started = threading.Barrier(3, timeout=5)
+
+        def install(name):
+            # every install runs at the same time
+            started.wait()
+            return name.upper()
+
+        self.assertEqual(list(map_packages(install, ["a", "b", "c"], threads=3)), ["A", "B", "C"])
+
+    def test_concurrent_raises_first_error_in_order(self):
+        def install(name):
+            if name != "a":
+                raise dbt.exceptions.DependencyError(name)
+            return name
+
+        results = map_packages(install, ["a", "b", "c"], threads=3)
+        self.assertEqual(next(results), "a")
+        with self.assertRaisesRegex(dbt.exceptions.DependencyError, "b"):
+            next(results)
+
+
+class TestPackageCache(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache = PackageCache(os.path.join(tmpdir.name, "cache"))
+        self.install_path = os.path.join(tmpdir.name, "dbt_packages")
+        os.makedirs(os.path.join(self.install_path, "utils", "macros"))
+        with open(os.path.join(self.install_path, "utils", "macros", "m.sql"), "w") as fp:
+            fp.write("{% macro m() %}{% endmacro %}")
+        self.package = RegistryPinnedPackage("dbt-labs/dbt_utils", "1.1.1", "1.3.0")
+
+    def test_cache_keys(self):
+        self.assertEqual(self.package.get_cache_key(), "hub/dbt-labs/dbt_utils/1.1.1")
+        sha = "0" * 40
+        self.assertEqual(
+            GitPinnedPackage("https://a/b.git", "https://a/b.git", sha).get_cache_key(),
+            f"git/{dbt.utils.md5('https://a/b.git', 'latin-1')}/{sha}",
+        )
+        branch_package = GitPinnedPackage("https://a/b.git", "https://a/b.git", "main")
+        self.assertIsNone(branch_package.get_cache_key())
+        branch_package.resolved_sha = sha
+        self.assertEqual(
+            branch_package.get_cache_key(),
+            f"git/{dbt.utils.md5('https://a/b.git', 'latin-1')}/{sha}",
+        )
+        self.assertIsNone(LocalPinnedPackage("path/to/pkg").get_cache_key())
+
+    def test_add_and_install(self):
+        self.assertIsNone(self.cache.install(self.package, self.install_path))
+        self.cache.add(self.package, os.path.join(self.install_path, "utils"))
+        shutil.rmtree(self.install_path)
+        os.makedirs(self.install_path)
+
+        self.assertEqual(self.cache.install(self.package, self.install_path), "utils")
+        with open(os.path.join(self.install_path, "utils", "macros", "m.sql")) as fp:
+            self.assertEqual(fp.read(), "{% macro m() %}{% endmacro %}")
+        # the first entry wins
+        self.cache.add(self.package, os.path.join(self.install_path, "utils"))
+        self.assertEqual(self.cache.get_project_name(self.package.get_cache_key()), "utils")
+
+    def test_resolve_cached_registry_package(self):
+        lock_package = RegistryUnpinnedPackage(
+            "dbt-labs/dbt_utils", [VersionSpecifier.from_version_string("1.1.1")], False
+        )
+        self.assertIsNone(self.cache.resolve(lock_package))
+        self.cache.add(self.package, os.path.join(self.install_path, "utils"))
+
+        pinned = self.cache.resolve(lock_package)
+        self.assertEqual(pinned.to_dict(), self.package.to_dict())
+        range_package = RegistryUnpinnedPackage(
+            "dbt-labs/dbt_utils", [VersionSpecifier.from_version_string(">=1.1.1")], False
+        )
+        self.assertIsNone(self.cache.resolve(range_package))
+
+    def test_resolve_cached_git_package(self):
+        sha = "0" * 40
+        lock_package = GitUnpinnedPackage("https://a/b.git", "https://a/b.git", ["v1"])
+        package = lock_package.resolved()
+        package.resolved_sha = sha
+        # the revision is replaced by the commit when the metadata is fetched
+        package.revision = sha
+        self.cache.add(package, os.path.join(self.install_path, "utils"))
+
+        with mock.patch.object(GitPinnedPackage, "get_remote_sha") as get_remote_sha:
+            get_remote_sha.return_value = sha
+            pinned = self.cache.resolve(lock_package)
+            self.assertEqual(pinned.get_cache_key(), package.get_cache_key())
+            self.assertEqual(pinned.to_dict(), {"git": "https://a/b.git", "revision": "v1"})
+
+            # offline, the commit the tag pointed to when it was last installed is used
+            offline = dbt.exceptions.CommandResultError(
+                cwd=".", cmd=["git"], returncode=128, stdout=b"", stderr=b""
+            )
+            get_remote_sha.side_effect = offline
+            self.assertEqual(
+                self.cache.resolve(lock_package).get_cache_key(), package.get_cache_key()
+            )
+
+            # the tag moved to a commit that isn't cached
+            get_remote_sha.side_effect = None
+            get_remote_sha.return_value = "1" * 40
+            self.assertIsNone(self.cache.resolve(lock_package))
+            get_remote_sha.side_effect = offline
+            self.assertIsNone(self.cache.resolve(lock_package))
+            other_tag = GitUnpinnedPackage("https://a/b.git", "https://a/b.git", ["v2"])
+            self.assertIsNone(self.cache.resolve(other_tag))
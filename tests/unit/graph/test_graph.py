@@ -1,3 +1,6 @@
+import random
+
+import networkx as nx
 import pytest
 
 from dbt.compilation import Linker
@@ -162,3 +165,41 @@ class TestGraph:
         # neither nodes parents set is a subset of the other
         assert not non_shareds_parents.issubset(tables_parents)
         assert not tables_parents.issubset(non_shareds_parents)
+
+    def test_get_subset_graph(self) -> None:
+        graph = nx.DiGraph()
+        graph.add_edges_from(
+            [("a", "x"), ("x", "b"), ("x", "y"), ("y", "c"), ("a", "b"), ("b", "z"), ("q", "c")]
+        )
+        graph.add_edge("c", "t", edge_type="parent_test")
+
+        subset = Graph(graph).get_subset_graph({"a", "b", "c", "t"}).graph
+
+        assert list(subset.nodes) == ["a", "b", "c", "t"]
+        assert set(subset.edges) == {("a", "b"), ("a", "c"), ("c", "t")}
+        assert subset.edges["c", "t"] == {"edge_type": "parent_test"}
+
+    def test_get_subset_graph_matches_paths_through_removed_nodes(self) -> None:
+        rng = random.Random(0)
+        graph = nx.gn_graph(300, seed=0).reverse()
+        selected = set(rng.sample(list(graph.nodes), 30))
+
+        subset = Graph(graph).get_subset_graph(selected).graph
+
+        # an edge exists iff there is a path whose intermediate nodes were all removed
+        removed = graph.subgraph(set(graph.nodes) - selected)
+        expected = set()
+        for source in selected:
+            through = set()
+            for successor in graph.successors(source):
+                if successor not in selected:
+                    through |= {successor} | nx.descendants(removed, successor)
+            targets = set(graph.successors(source))
+            targets |= {target for node in through for target in graph.successors(node)}
+            expected |= {(source, target) for target in targets & selected if target != source}
+        assert set(subset.nodes) == selected
+        assert set(subset.edges) == expected
+
+    def test_get_subset_graph_missing_node(self, graph: Graph) -> None:
+        with pytest.raises(ValueError, match="Couldn't find model 'model.pkg.missing'"):
+            graph.get_subset_graph({"model.pkg.missing"})
@@ -1,8 +1,19 @@
+import threading
+from argparse import Namespace
+from queue import Empty
+from unittest import mock
+
 import networkx as nx
 import pytest
 
 from dbt.contracts.graph.manifest import Manifest
-from dbt.graph.queue import GraphQueue
+from dbt.flags import set_from_args
+from dbt.graph.queue import (
+    CompactGraphQueue,
+    GraphQueue,
+    build_graph_queue,
+    estimate_node_durations,
+)
 from tests.unit.utils import MockNode, make_manifest
 
 
@@ -45,3 +56,133 @@ class TestGraphQueue:
             "model.test_package.upstream_model",
             "model.test_package.downstream_model",
         }
+
+
+class TestCompactGraphQueue:
+    @pytest.fixture
+    def graph(self) -> nx.DiGraph:
+        graph = nx.relabel_nodes(nx.gn_graph(200, seed=42).reverse(), lambda n: f"model.{n}")
+        # a second, disconnected component
+        graph.add_edges_from([("a", "b"), ("b", "c"), ("a", "c"), ("d", "c")])
+        return graph
+
+    @pytest.fixture
+    def manifest(self, graph) -> Manifest:
+        manifest = mock.MagicMock()
+        manifest.expect.side_effect = lambda n: mock.MagicMock(unique_id=n)
+        return manifest
+
+    def test_scores_match_graph_queue(self, graph, manifest):
+        compact_queue = CompactGraphQueue(graph, manifest, set())
+        graph_queue = GraphQueue(graph.copy(), manifest, set())
+        compact_scores = {
+            node_id: compact_queue._scores[idx]
+            for idx, node_id in enumerate(compact_queue._node_ids)
+        }
+        assert compact_scores == graph_queue._scores
+        assert sorted(compact_queue.inner.queue) == sorted(graph_queue.inner.queue)
+
+    def test_preserve_edges_false(self, graph, manifest):
+        queue = CompactGraphQueue(graph, manifest, set(), preserve_edges=False)
+        assert len(queue.inner.queue) == len(graph)
+        assert all(score == 0 for score, _ in queue.inner.queue)
+
+    def test_drains_in_dependency_order(self, graph, manifest):
+        queue = CompactGraphQueue(graph, manifest, set())
+        done = set()
+        while not queue.empty():
+            node_id = queue.get(block=False).unique_id
+            assert all(parent in done for parent in graph.predecessors(node_id))
+            queue.mark_done(node_id)
+            done.add(node_id)
+        assert done == set(graph.nodes)
+        assert queue.inner.unfinished_tasks == 0
+        # the input graph is left as it was
+        assert len(graph) == 204
+
+    def test_concurrent_workers(self, graph, manifest):
+        queue = CompactGraphQueue(graph, manifest, set())
+        done = []
+        errors = []
+
+        def work():
+            while True:
+                try:
+                    node_id = queue.get(timeout=0.5).unique_id
+                except Empty:
+                    return
+                if not all(parent in done for parent in graph.predecessors(node_id)):
+                    errors.append(node_id)
+                done.append(node_id)
+                queue.mark_done(node_id)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert sorted(done) == sorted(graph.nodes)
+        assert queue.empty()
+        assert queue.inner.unfinished_tasks == 0
+
+    def test_build_graph_queue(self, graph, manifest):
+        set_from_args(Namespace(use_compact_graph_queue=True), {})
+        assert isinstance(build_graph_queue(graph, manifest, set()), CompactGraphQueue)
+        set_from_args(Namespace(use_compact_graph_queue=False), {})
+        assert type(build_graph_queue(graph, manifest, set())) is GraphQueue
+
+
+class TestCriticalPathScheduling:
+    @pytest.fixture
+    def graph(self) -> nx.DiGraph:
+        # a short chain of slow models and a long chain of fast ones
+        graph = nx.DiGraph()
+        graph.add_edges_from([("slow_1", "slow_2"), ("fast_1", "fast_2"), ("fast_2", "fast_3")])
+        graph.add_node("new")
+        return graph
+
+    @pytest.fixture
+    def manifest(self) -> Manifest:
+        manifest = mock.MagicMock()
+        manifest.expect.side_effect = lambda n: mock.MagicMock(unique_id=n)
+        return manifest
+
+    @pytest.fixture
+    def node_durations(self):
+        return {"slow_1": 10.0, "slow_2": 20.0, "fast_1": 1.0, "fast_2": 1.0, "fast_3": 1.0}
+
+    def test_estimate_node_durations(self, node_durations):
+        assert estimate_node_durations(["fast_1", "new"], node_durations) == {
+            "fast_1": 1.0,
+            "new": 1.0,
+        }
+        assert estimate_node_durations(["new"], node_durations) is None
+        assert estimate_node_durations(["new"], None) is None
+
+    @pytest.mark.parametrize("queue_cls", [GraphQueue, CompactGraphQueue])
+    def test_longest_chain_first(self, queue_cls, graph, manifest, node_durations):
+        queue = queue_cls(graph, manifest, set(), node_durations=node_durations)
+        order = [queue.get(block=False).unique_id for _ in range(3)]
+        # the new node is estimated at the mean duration (6.6s)
+        assert order == ["slow_1", "new", "fast_1"]
+
+        queue.mark_done("slow_1")
+        assert queue.get(block=False).unique_id == "slow_2"
+
+    @pytest.mark.parametrize("queue_cls", [GraphQueue, CompactGraphQueue])
+    def test_falls_back_to_depth(self, queue_cls, graph, manifest):
+        depth_queue = queue_cls(graph.copy(), manifest, set())
+        queue = queue_cls(graph.copy(), manifest, set(), node_durations={"other": 1.0})
+        assert sorted(queue.inner.queue) == sorted(depth_queue.inner.queue)
+
+    def test_compact_scores_match(self, graph, manifest, node_durations):
+        compact_queue = CompactGraphQueue(graph, manifest, set(), node_durations=node_durations)
+        graph_queue = GraphQueue(graph.copy(), manifest, set(), node_durations=node_durations)
+        compact_scores = {
+            node_id: compact_queue._scores[idx]
+            for idx, node_id in enumerate(compact_queue._node_ids)
+        }
+        assert compact_scores == pytest.approx(graph_queue._scores)
+        assert graph_queue._scores["slow_1"] == -30.0
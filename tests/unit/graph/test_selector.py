@@ -19,6 +19,7 @@ import dbt_common.exceptions
 from dbt.config.runtime import RuntimeConfig
 from dbt.flags import set_from_args
 from dbt.graph import NodeSelector, parse_difference
+from dbt.graph.selector_spec import IndirectSelection, SelectionCriteria, SelectionUnion
 from dbt.node_types import NodeType
 from tests.unit.utils.manifest import make_manifest, make_model
 
@@ -137,6 +138,80 @@ def test_run_specs(include, exclude, expected, graph, mock_manifest_with_mock_gr
     assert selected == expected
 
 
+@pytest.fixture
+def selector_with_tests():
+    # m.X.a -> m.X.b, and m.X.c on its own, with tests on combinations of them
+    graph = nx.DiGraph()
+    graph.add_edge("m.X.a", "m.X.b")
+    graph.add_node("m.X.c")
+    tests = {
+        "t.X.test_a": ["m.X.a"],
+        "t.X.test_ab": ["m.X.a", "m.X.b"],
+        "t.X.test_bc": ["m.X.b", "m.X.c"],
+    }
+    nodes = {
+        unique_id: MagicMock(
+            unique_id=unique_id,
+            fqn=unique_id.split("."),
+            resource_type=NodeType.Model,
+            empty=False,
+            config=MagicMock(enabled=True),
+            is_versioned=False,
+        )
+        for unique_id in graph
+    }
+    for unique_id, parents in tests.items():
+        nodes[unique_id] = MagicMock(
+            unique_id=unique_id,
+            fqn=unique_id.split("."),
+            resource_type=NodeType.Test,
+            depends_on_nodes=parents,
+            empty=False,
+            config=MagicMock(enabled=True),
+            is_versioned=False,
+        )
+        for parent in parents:
+            graph.add_edge(parent, unique_id)
+    manifest = MagicMock(nodes=nodes, sources={}, unit_tests={})
+    return graph_selector.NodeSelector(graph_selector.Graph(graph), manifest)
+
+
+@pytest.mark.parametrize(
+    "indirect_selection,selected,expected",
+    [
+        ("eager", ["m.X.b"], {"m.X.b", "t.X.test_ab", "t.X.test_bc"}),
+        ("cautious", ["m.X.b"], {"m.X.b"}),
+        ("buildable", ["m.X.b"], {"m.X.b", "t.X.test_ab"}),
+        ("empty", ["m.X.b"], {"m.X.b"}),
+        ("cautious", ["m.X.b", "m.X.c"], {"m.X.b", "m.X.c", "t.X.test_bc"}),
+        ("buildable", ["m.X.b", "m.X.c"], {"m.X.b", "m.X.c", "t.X.test_ab", "t.X.test_bc"}),
+        ("cautious", ["m.X.a", "m.X.b"], {"m.X.a", "m.X.b", "t.X.test_a", "t.X.test_ab"}),
+    ],
+)
+def test_indirect_selection(selector_with_tests, indirect_selection, selected, expected):
+    indirect_selection = IndirectSelection(indirect_selection)
+    spec = SelectionUnion(
+        [
+            SelectionCriteria(
+                raw=unique_id,
+                method="fqn",
+                method_arguments=[],
+                value=unique_id.split(".")[-1],
+                childrens_parents=False,
+                parents=False,
+                parents_depth=None,
+                children=False,
+                children_depth=None,
+                indirect_selection=indirect_selection,
+            )
+            for unique_id in selected
+        ],
+        indirect_selection=indirect_selection,
+    )
+    direct, _ = selector_with_tests.select_nodes(spec)
+    assert direct == expected
+
+
 param_specs = [
     ("a", False, None, False, None, "fqn", "a", False),
     ("+a", True, None, False, None, "fqn", "a", False),
@@ -323,3 +398,23 @@ class TestNodeSelector:
         # Ensure that --indirect-selection empty returns the same result
         spec.indirect_selection = graph_selector.IndirectSelection.Empty
         assert selector.get_selected(spec) == {"model.pkg.model_two"}
+
+    @pytest.mark.parametrize(
+        "scheduling_priority,has_results,expected",
+        [
+            ("critical_path", True, {"model.pkg.model_one": 3.0}),
+            ("critical_path", False, None),
+            ("depth", True, None),
+        ],
+    )
+    def test_get_previous_execution_times(
+        self, graph, mock_manifest_with_mock_graph, scheduling_priority, has_results, expected
+    ):
+        previous_state = MagicMock(results=None)
+        if has_results:
+            previous_state.results = MagicMock(
+                results=[MagicMock(unique_id="model.pkg.model_one", execution_time=3.0)]
+            )
+        set_from_args(Namespace(scheduling_priority=scheduling_priority), {})
+        selector = NodeSelector(graph, mock_manifest_with_mock_graph, previous_state)
+        assert selector.get_previous_execution_times() == expected
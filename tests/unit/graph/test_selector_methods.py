@@ -628,6 +628,57 @@ def test_select_unit_test(manifest: Manifest) -> None:
     }
 
 
+def test_selection_index_shared_by_methods(manifest):
+    methods = MethodManager(manifest, None)
+    tag_method = methods.get_method("tag", [])
+    config_method = methods.get_method("config", ["materialized"])
+    assert tag_method.index is methods.index
+    assert config_method.index is methods.index
+
+    search_manifest_using_method(manifest, tag_method, "uses_ephemeral")
+    assert methods.index._tags is not None
+    # indexes are only built for the methods that are used
+    assert methods.index._packages is None
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "pkg",
+        "pkg.unions",
+        "unions",
+        "union_model",
+        "versioned_model",
+        "versioned_model.v1",
+        "versioned_model_v4",
+        "pkg.t*",
+        "unions.*_model",
+        "mynamespace.union_model",
+        "missing",
+    ],
+)
+def test_select_fqn_index_matches_scan(manifest, selector):
+    method = QualifiedNameSelectorMethod(manifest, None, [])
+    included_nodes = set(manifest.nodes) | set(manifest.exposures) | set(manifest.unit_tests)
+    scanned = {
+        unique_id
+        for unique_id, node in method.non_source_nodes(included_nodes)
+        if method.node_is_match(selector, node.fqn, node.is_versioned)
+    }
+    assert method.index.fqn_candidates(selector) is not None
+    assert set(method.search(included_nodes, selector)) == scanned
+
+
+def test_select_config_index_ignores_unhashable_values(manifest, table_model):
+    change_node(
+        manifest,
+        replace(table_model, config={"materialized": "table", "meta": {"owners": [{"a": 1}]}}),
+    )
+    methods = MethodManager(manifest, None)
+    method = methods.get_method("config", ["meta", "owners"])
+    assert not search_manifest_using_method(manifest, method, "a")
+
+
 def create_previous_state(manifest):
     writable = copy.deepcopy(manifest).writable_manifest()
     state = PreviousState(
@@ -1063,3 +1114,48 @@ def test_select_state_changed_test_macros_with_upstream_change(manifest, previou
     assert "model1" and "model2" not in search_manifest_using_method(
         manifest, method, "unmodified"
     )
+
+
+def test_select_state_changed_macros_transitively(manifest, previous_state):
+    changed_macro = make_macro("dbt", "changed_macro", "blablabla")
+    add_macro(manifest, changed_macro)
+    add_macro(previous_state.manifest, replace(changed_macro, macro_sql="something different"))
+    deleted_macro = make_macro("dbt", "deleted_macro", "blablabla")
+    add_macro(previous_state.manifest, deleted_macro)
+
+    # a chain of unchanged macros ending in a changed macro, one that calls a
+    # deleted macro, and a cycle that reaches neither
+    macros = [
+        make_macro("dbt", "calls_changed", "bla", depends_on_macros=[changed_macro.unique_id]),
+        make_macro(
+            "dbt", "calls_calls_changed", "bla", depends_on_macros=["macro.dbt.calls_changed"]
+        ),
+        make_macro("dbt", "calls_deleted", "bla", depends_on_macros=[deleted_macro.unique_id]),
+        make_macro("dbt", "cycle_a", "bla", depends_on_macros=["macro.dbt.cycle_b"]),
+        make_macro("dbt", "cycle_b", "bla", depends_on_macros=["macro.dbt.cycle_a"]),
+    ]
+    for macro in macros:
+        add_macro(manifest, macro)
+        add_macro(previous_state.manifest, macro)
+
+    for name, depends_on_macro in [
+        ("model1", "macro.dbt.calls_calls_changed"),
+        ("model2", "macro.dbt.calls_deleted"),
+        ("model3", "macro.dbt.cycle_a"),
+    ]:
+        model = make_model("dbt", name, "blablabla", depends_on_macros=[depends_on_macro])
+        add_node(manifest, model)
+        add_node(previous_state.manifest, model)
+
+    method = statemethod(manifest, previous_state)
+    assert search_manifest_using_method(manifest, method, "modified.macros") == {
+        "model1",
+        "model2",
+    }
+    assert method.modified_macros == {
+        changed_macro.unique_id,
+        deleted_macro.unique_id,
+        "macro.dbt.calls_changed",
+        "macro.dbt.calls_calls_changed",
+        "macro.dbt.calls_deleted",
+    }
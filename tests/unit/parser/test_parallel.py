@@ -0,0 +1,226 @@
+from argparse import Namespace
+from copy import deepcopy
+from unittest import mock
+
+from dbt import deprecations
+from dbt.contracts.files import FileHash, FilePath, SourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.types import CustomKeyInConfigDeprecation
+from dbt.flags import set_from_args
+from dbt.parser import HookParser, ModelParser, SingularTestParser, parallel
+from dbt.parser.manifest import ManifestLoader
+from dbt.parser.parallel import (
+    ParseShard,
+    ParseShardResult,
+    ParseWorkerContext,
+    build_parse_shards,
+    merge_shard_result,
+    parse_shard,
+)
+from dbt.parser.search import FileBlock
+from dbt_common.events.event_manager_client import get_event_manager
+from tests.unit.parser.test_parser import BaseParserTest
+from tests.unit.utils import generate_name_macros
+from tests.utils import EventCatcher
+
+model_sql = """
+{{{{ config(materialized="{materialized}") }}}}
+select 1 as id
+"""
+
+
+class ParallelParseTest(BaseParserTest):
+    def setUp(self):
+        super().setUp()
+        self.model_files = [
+            self.source_file_for(
+                model_sql.format(materialized="table" if i % 2 else "view"),
+                f"model_{i}.sql",
+                "models",
+            )
+            for i in range(7)
+        ]
+        self.test_files = [
+            self.source_file_for("select 1 where false", "test_1.sql", "tests"),
+        ]
+        self.project_parser_files = {
+            "snowplow": {
+                "ModelParser": [f.file_id for f in self.model_files],
+                "SingularTestParser": [f.file_id for f in self.test_files],
+            }
+        }
+        self.files = {f.file_id: f for f in self.model_files + self.test_files}
+
+    def test_build_parse_shards_preserves_order(self):
+        shards = build_parse_shards(
+            self.all_projects,
+            self.project_parser_files,
+            self.files,
+            ["ModelParser", "SingularTestParser"],
+            worker_count=2,
+        )
+        self.assertEqual([shard.index for shard in shards], list(range(len(shards))))
+        self.assertEqual(
+            [shard.parser_name for shard in shards],
+            ["ModelParser"] * (len(shards) - 1) + ["SingularTestParser"],
+        )
+        sharded_file_ids = [f.file_id for shard in shards for f in shard.files]
+        self.assertEqual(sharded_file_ids, list(self.files))
+
+    def test_build_parse_shards_no_files(self):
+        shards = build_parse_shards(
+            self.all_projects, {"snowplow": {}}, {}, ["ModelParser"], worker_count=4
+        )
+        self.assertEqual(shards, [])
+
+    def test_merged_shards_match_serial_parse(self):
+        serial_manifest = Manifest(
+            macros={m.unique_id: m for m in generate_name_macros("root")},
+            files={file_id: deepcopy(f) for file_id, f in self.files.items()},
+        )
+        for parser_cls in (ModelParser, SingularTestParser):
+            parser = parser_cls(
+                self.snowplow_project_config, serial_manifest, self.root_project_config
+            )
+            for file_id in self.project_parser_files["snowplow"][parser_cls.__name__]:
+                parser.parse_file(FileBlock(serial_manifest.files[file_id]))
+
+        context = ParseWorkerContext(
+            root_project=self.root_project_config,
+            all_projects=self.all_projects,
+            macros=self.manifest.macros,
+            parser_types={"ModelParser": ModelParser, "SingularTestParser": SingularTestParser},
+        )
+        shards = build_parse_shards(
+            self.all_projects,
+            self.project_parser_files,
+            self.files,
+            ["ModelParser", "SingularTestParser"],
+            worker_count=2,
+        )
+        for shard in shards:
+            result = parse_shard(context, shard)
+            self.assertIsNone(result.error)
+            merge_shard_result(self.manifest, result)
+
+        self.assertEqual(list(self.manifest.nodes), list(serial_manifest.nodes))
+        for unique_id, node in serial_manifest.nodes.items():
+            self.assertEqual(self.manifest.nodes[unique_id].config, node.config)
+        for file_id, source_file in serial_manifest.files.items():
+            self.assertEqual(self.manifest.files[file_id].nodes, source_file.nodes)
+
+    def test_parse_shard_reports_errors(self):
+        bad_file = self.source_file_for("{{ config(", "bad.sql", "models")
+        context = ParseWorkerContext(
+            root_project=self.root_project_config,
+            all_projects=self.all_projects,
+            macros=self.manifest.macros,
+            parser_types={"ModelParser": ModelParser},
+        )
+        shards = build_parse_shards(
+            self.all_projects,
+            {"snowplow": {"ModelParser": [bad_file.file_id]}},
+            {bad_file.file_id: bad_file},
+            ["ModelParser"],
+            worker_count=1,
+        )
+        result = parse_shard(context, shards[0])
+        self.assertIsNotNone(result.error)
+        self.assertEqual(result.nodes, [])
+
+    def _load_manifest(self, parallel: bool) -> Manifest:
+        root_model = SourceFile(
+            path=FilePath(
+                searched_path="models",
+                relative_path="root_model.sql",
+                project_root=self.root_project_config.project_root,
+                modification_time=0.0,
+            ),
+            checksum=FileHash.from_contents("select 1"),
+            project_name="root",
+        )
+        root_model.contents = "select 1"
+        files = {f.file_id: deepcopy(f) for f in [root_model, *self.files.values()]}
+        project_parser_files = {
+            "root": {"ModelParser": [root_model.file_id]},
+            **self.project_parser_files,
+        }
+        for project in self.all_projects.values():
+            project.on_run_start = [f"select '{project.project_name}'"]
+
+        def load_source_file(path, parse_file_type, project_name, saved_files):
+            source_file = SourceFile(
+                path=path, checksum=FileHash.empty(), project_name=project_name
+            )
+            source_file.contents = ""
+            return source_file
+
+        def parse_shards_in_pool(context, shards, worker_count):
+            return (parse_shard(context, shard) for shard in shards)
+
+        with mock.patch.object(ManifestLoader, "build_manifest_state_check"), mock.patch.object(
+            ManifestLoader, "read_manifest_for_partial_parse", return_value=None
+        ):
+            loader = ManifestLoader(self.root_project_config, self.all_projects)
+        loader.manifest.macros = self.manifest.macros
+        loader.manifest.files = files
+        parser_types = [ModelParser, SingularTestParser, HookParser]
+        with mock.patch("dbt.parser.manifest.load_source_file", load_source_file), mock.patch(
+            "dbt.parser.manifest.parse_shards_in_pool", parse_shards_in_pool
+        ):
+            if parallel:
+                loader.parse_projects_in_parallel(project_parser_files, parser_types, 2)
+            else:
+                for project_name, parser_files in project_parser_files.items():
+                    loader.parse_project(
+                        self.all_projects[project_name], parser_files, parser_types
+                    )
+        return loader.manifest
+
+    def test_parallel_parse_matches_serial_node_order(self):
+        serial_nodes = list(self._load_manifest(parallel=False).nodes)
+        self.assertIn("operation.root.root-on-run-start-0", serial_nodes)
+        self.assertIn("operation.snowplow.snowplow-on-run-start-0", serial_nodes)
+        self.assertEqual(list(self._load_manifest(parallel=True).nodes), serial_nodes)
+
+
+def test_worker_events_and_deprecations_are_merged():
+    set_from_args(Namespace(warn_error=False), None)
+    deprecations.reset_deprecations()
+
+    def parse_shard_with_deprecation(context, shard):
+        deprecations.warn(
+            "custom-key-in-config-deprecation", key="foo", file=shard.project_name, key_path="x"
+        )
+        return ParseShardResult(index=shard.index, worker_id=shard.index, elapsed=0.0)
+
+    # Two shards parsed by two workers, which each warn about the deprecation
+    event_manager = get_event_manager()
+    event_manager.callbacks.append(parallel._WORKER_EVENTS.append)
+    results = []
+    try:
+        with mock.patch.object(parallel, "_WORKER_CONTEXT", mock.Mock()), mock.patch.object(
+            parallel, "parse_shard", parse_shard_with_deprecation
+        ):
+            for index in range(2):
+                shard = ParseShard(index=index, project_name="test", parser_name="", files=[])
+                results.append(parallel._parse_shard_in_worker(shard))
+                deprecations.reset_deprecations()
+    finally:
+        event_manager.callbacks.remove(parallel._WORKER_EVENTS.append)
+    assert [result.deprecations for result in results] == [
+        {"custom-key-in-config-deprecation": 1}
+    ] * 2
+    assert [len(result.events) for result in results] == [1, 1]
+
+    catcher = EventCatcher(CustomKeyInConfigDeprecation)
+    event_manager.callbacks.append(catcher.catch)
+    try:
+        manifest = Manifest()
+        for result in results:
+            merge_shard_result(manifest, result)
+        assert dict(deprecations.active_deprecations) == {"custom-key-in-config-deprecation": 2}
+    finally:
+        event_manager.callbacks.remove(catcher.catch)
+        deprecations.reset_deprecations()
+    assert len(catcher.caught_events) == 1
@@ -0,0 +1,99 @@
+import io
+from argparse import Namespace
+from unittest import mock
+
+import pytest
+
+from dbt.artifacts.resources.base import FileHash
+from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
+from dbt.flags import set_from_args
+from dbt.parser.manifest import ManifestLoader
+from dbt.parser.partial_parse_file import (
+    PartialParseFile,
+    extended_mashumaro_encoder,
+    is_sectioned_partial_parse_file,
+    read_manifest,
+    write_partial_parse_file,
+)
+from dbt.version import __version__
+
+
+@pytest.fixture
+def partial_parse_manifest(seed, source, ephemeral_model, table_model) -> Manifest:
+    file_hash = FileHash.from_contents("test contents")
+    manifest = Manifest(
+        nodes={node.unique_id: node for node in [seed, ephemeral_model, table_model]},
+        sources={source.unique_id: source},
+    )
+    manifest.state_check = ManifestStateCheck(
+        vars_hash=file_hash,
+        profile_hash=file_hash,
+        profile_env_vars_hash=file_hash,
+        project_env_vars_hash=file_hash,
+        project_hashes={"test": file_hash},
+    )
+    return manifest
+
+
+@pytest.fixture
+def partial_parse_path(tmp_path, partial_parse_manifest: Manifest) -> str:
+    path = str(tmp_path / "partial_parse.msgpack")
+    with open(path, "wb") as fp:
+        write_partial_parse_file(fp, partial_parse_manifest)
+    return path
+
+
+class TestPartialParseFile:
+    def test_round_trip(self, partial_parse_path, partial_parse_manifest: Manifest):
+        with open(partial_parse_path, "rb") as fp:
+            assert is_sectioned_partial_parse_file(fp)
+            manifest = read_manifest(fp)
+        # The sectioned file should decode to exactly what the single blob format does
+        legacy_manifest = read_manifest(
+            io.BytesIO(partial_parse_manifest.to_msgpack(extended_mashumaro_encoder))
+        )
+        assert manifest.to_dict() == legacy_manifest.to_dict()
+        assert manifest.nodes.keys() == partial_parse_manifest.nodes.keys()
+        assert manifest.state_check == partial_parse_manifest.state_check
+
+    def test_header_decoded_without_body(
+        self, partial_parse_path, partial_parse_manifest: Manifest
+    ):
+        with open(partial_parse_path, "rb") as fp, PartialParseFile(fp) as partial_parse_file:
+            header = partial_parse_file.header
+            assert header.dbt_version == partial_parse_manifest.metadata.dbt_version
+            assert header.state_check == partial_parse_manifest.state_check
+            assert "nodes" in header.sections
+            assert partial_parse_file._decoded == {}
+
+            nodes = partial_parse_file.section("nodes")
+            assert nodes.keys() == partial_parse_manifest.nodes.keys()
+            assert list(partial_parse_file._decoded) == ["nodes"]
+
+    def test_legacy_format(self, partial_parse_manifest: Manifest):
+        fp = io.BytesIO(partial_parse_manifest.to_msgpack(extended_mashumaro_encoder))
+        assert not is_sectioned_partial_parse_file(fp)
+        manifest = read_manifest(fp)
+        assert manifest.nodes.keys() == partial_parse_manifest.nodes.keys()
+
+    @pytest.mark.parametrize("dbt_version,decoded", [(__version__, True), ("0.0.1", False)])
+    def test_loader_checks_header_before_decoding(
+        self, tmp_path, partial_parse_manifest: Manifest, runtime_config, dbt_version, decoded
+    ):
+        path = str(tmp_path / "partial_parse.msgpack")
+        partial_parse_manifest.metadata.dbt_version = dbt_version
+        with open(path, "wb") as fp:
+            write_partial_parse_file(fp, partial_parse_manifest)
+        set_from_args(Namespace(partial_parse=True, partial_parse_file_path=path), {})
+
+        with mock.patch(
+            "dbt.parser.manifest.ManifestLoader.build_manifest_state_check",
+            return_value=partial_parse_manifest.state_check,
+        ), mock.patch(
+            "dbt.parser.partial_parse_file.PartialParseFile.manifest",
+            return_value=partial_parse_manifest,
+        ) as patched_manifest:
+            loader = ManifestLoader(runtime_config, {runtime_config.project_name: runtime_config})
+
+        assert patched_manifest.called == decoded
+        assert (loader.saved_manifest is not None) == decoded
@@ -0,0 +1,201 @@
+import os
+import threading
+from argparse import Namespace
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from dbt.contracts.files import FileHash, FilePath, ParseFileType, SchemaSourceFile
+from dbt.exceptions import ParsingError
+from dbt.flags import set_from_args
+from dbt.parser.read_files import (
+    ByteBudget,
+    ReadFilesFromFileSystem,
+    load_deferred_contents,
+    load_seed_source_file,
+    load_source_file,
+)
+
+
+def file_path(project_root, relative_path, searched_path="models") -> FilePath:
+    full_path = os.path.join(project_root, searched_path, relative_path)
+    return FilePath(
+        searched_path=searched_path,
+        relative_path=relative_path,
+        modification_time=os.path.getmtime(full_path),
+        project_root=str(project_root),
+    )
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    os.makedirs(tmp_path / "models")
+    os.makedirs(tmp_path / "seeds")
+    (tmp_path / "models" / "model.sql").write_text("select 1")
+    (tmp_path / "models" / "schema.yml").write_text("models:\n  - name: model\n")
+    (tmp_path / "seeds" / "seed.csv").write_text("a,b\n1,2\n")
+    return tmp_path
+
+
+@pytest.fixture(params=[False, True], ids=["stat", "verify"])
+def verify_checksums(request):
+    set_from_args(Namespace(partial_parse_verify_checksums=request.param), {})
+    return request.param
+
+
+def load_model(project_root, saved_files):
+    return load_source_file(
+        file_path(project_root, "model.sql"), ParseFileType.Model, "test", saved_files
+    )
+
+
+class TestStatCache:
+    def test_unchanged_file_not_read(self, project_root, verify_checksums):
+        saved_file = load_model(project_root, {})
+        assert saved_file.contents == "select 1"
+        assert saved_file.checksum == FileHash.from_contents("select 1")
+        assert saved_file.stat is not None
+
+        with mock.patch(
+            "dbt.parser.read_files.load_file_contents", wraps=lambda path, strip: "select 1"
+        ) as load_file_contents:
+            source_file = load_model(project_root, {saved_file.file_id: saved_file})
+
+        assert load_file_contents.called == verify_checksums
+        assert source_file.checksum == saved_file.checksum
+        assert source_file.stat == saved_file.stat
+        assert source_file.contents == ("select 1" if verify_checksums else None)
+
+    def test_changed_file_read(self, project_root, verify_checksums):
+        saved_file = load_model(project_root, {})
+        (project_root / "models" / "model.sql").write_text("select 22")
+        os.utime(project_root / "models" / "model.sql", ns=(1, 1))
+
+        source_file = load_model(project_root, {saved_file.file_id: saved_file})
+        assert source_file.contents == "select 22"
+        assert source_file.checksum == FileHash.from_contents("select 22")
+        assert source_file.stat != saved_file.stat
+
+    def test_schema_file_reuses_yaml(self, project_root, verify_checksums):
+        path = file_path(project_root, "schema.yml")
+        saved_file = load_source_file(path, ParseFileType.Schema, "test", {})
+        assert isinstance(saved_file, SchemaSourceFile)
+        assert saved_file.dfy == {"models": [{"name": "model"}]}
+        saved_file.dfy = {"models": [{"name": "saved"}]}
+
+        source_file = load_source_file(
+            path, ParseFileType.Schema, "test", {saved_file.file_id: saved_file}
+        )
+        assert source_file.dfy["models"][0]["name"] == ("model" if verify_checksums else "saved")
+
+    def test_seed(self, project_root, verify_checksums):
+        path = file_path(project_root, "seed.csv", searched_path="seeds")
+        saved_file = load_seed_source_file(path, "test")
+        saved_file.checksum = FileHash.from_contents("saved")
+
+        source_file = load_seed_source_file(path, "test", {saved_file.file_id: saved_file})
+        assert source_file.contents == ""
+        assert (source_file.checksum == saved_file.checksum) != verify_checksums
+
+    def test_load_deferred_contents(self, project_root):
+        set_from_args(Namespace(partial_parse_verify_checksums=False), {})
+        saved_model = load_model(project_root, {})
+        schema_path = file_path(project_root, "schema.yml")
+        saved_schema = load_source_file(schema_path, ParseFileType.Schema, "test", {})
+        saved_files = {saved_model.file_id: saved_model, saved_schema.file_id: saved_schema}
+
+        files = {
+            saved_model.file_id: load_model(project_root, saved_files),
+            saved_schema.file_id: load_source_file(
+                schema_path, ParseFileType.Schema, "test", saved_files
+            ),
+        }
+        assert all(source_file.contents is None for source_file in files.values())
+
+        load_deferred_contents(
+            files,
+            {
+                "test": {
+                    "ModelParser": [saved_model.file_id],
+                    "SchemaParser": [saved_schema.file_id],
+                }
+            },
+        )
+        assert files[saved_model.file_id].contents == "select 1"
+        # schema files are parsed from the saved yaml
+        assert files[saved_schema.file_id].contents is None
+
+
+def make_project(root, name):
+    for relative_path, contents in [
+        ("models/model_b.sql", "select 1"),
+        ("models/model_a.py", "def model(dbt, session): pass"),
+        ("models/nested/model_c.sql", "select 3"),
+        ("models/schema.yml", "models:\n  - name: model_b\n"),
+        ("macros/macros.sql", "{% macro m() %}1{% endmacro %}"),
+        ("tests/singular.sql", "select 1 where false"),
+        ("tests/generic/generic.sql", "{% test t(model) %}1{% endtest %}"),
+        ("seeds/seed.csv", "a\n1\n"),
+        ("snapshots/snapshot.sql", "{% snapshot s %}select 1{% endsnapshot %}"),
+    ]:
+        path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fp:
+            fp.write(contents)
+    return SimpleNamespace(
+        project_name=name,
+        project_root=str(root),
+        macro_paths=["macros"],
+        model_paths=["models"],
+        snapshot_paths=["snapshots"],
+        analysis_paths=["analyses"],
+        test_paths=["tests"],
+        generic_test_paths=["tests/generic"],
+        seed_paths=["seeds"],
+        docs_paths=["models", "macros"],
+        all_source_paths=["models", "snapshots", "seeds", "macros", "analyses", "tests"],
+        fixture_paths=["tests/fixtures"],
+    )
+
+
+class TestReadFilesConcurrently:
+    def test_matches_serial_read(self, tmp_path):
+        set_from_args(Namespace(partial_parse_verify_checksums=False), {})
+        all_projects = {name: make_project(tmp_path / name, name) for name in ["root", "package"]}
+        serial = ReadFilesFromFileSystem(all_projects=all_projects)
+        serial.read_files()
+        concurrent = ReadFilesFromFileSystem(all_projects=all_projects, threads=4)
+        concurrent.read_files()
+
+        assert "root://tests/singular.sql" in serial.files
+        assert list(concurrent.files) == list(serial.files)
+        assert concurrent.project_parser_files == serial.project_parser_files
+        for file_id, source_file in serial.files.items():
+            assert concurrent.files[file_id] == source_file
+
+    def test_errors_are_raised(self, tmp_path):
+        set_from_args(Namespace(partial_parse_verify_checksums=False), {})
+        project = make_project(tmp_path, "root")
+        (tmp_path / "models" / "bad.yml").write_text("models: not a list")
+        with pytest.raises(ParsingError, match="is not a list"):
+            ReadFilesFromFileSystem(all_projects={"root": project}, threads=4).read_files()
+
+
+def test_byte_budget():
+    budget = ByteBudget(10)
+    with budget.reserve(6):
+        started = threading.Event()
+
+        def reserve():
+            with budget.reserve(100):
+                started.set()
+
+        thread = threading.Thread(target=reserve)
+        thread.start()
+        # a file larger than the budget waits for the rest to be released
+        assert not started.wait(0.05)
+        assert budget.in_flight == 6
+    thread.join(timeout=5)
+    assert started.is_set()
+    assert budget.in_flight == 0
@@ -1,7 +1,8 @@
 from unittest import mock
 
 from dbt.artifacts.resources import DependsOn, UnitTestConfig, UnitTestFormat
-from dbt.contracts.graph.nodes import NodeType, UnitTestDefinition
+from dbt.contracts.files import FileHash, FilePath, FixtureSourceFile
+from dbt.contracts.graph.nodes import NodeType, UnitTestDefinition, UnitTestFileFixture
 from dbt.contracts.graph.unparsed import UnitTestOutputFixture
 from dbt.parser import SchemaParser
 from dbt.parser.unit_tests import UnitTestParser
@@ -82,6 +83,22 @@ unit_tests:
           - {a: 1}
 """
 
+UNIT_TEST_CSV_FIXTURE_SOURCE = """
+unit_tests:
+    - name: test_my_model
+      model: my_model
+      given: []
+      expect:
+        format: csv
+        fixture: my_fixture
+    - name: test_my_model2
+      model: my_model
+      given: []
+      expect:
+        format: csv
+        fixture: my_fixture
+"""
+
 UNIT_TEST_NONE_ROWS_SORT = """
 unit_tests:
   - name: test_my_model_null_handling
@@ -322,3 +339,43 @@ class UnitTestParserTest(SchemaParserTest):
         UnitTestParser(self.parser, block).parse()
 
         assert len(catcher.caught_events) == 1
+
+    def test_csv_fixture_rows_converted_once(self):
+        fixture_file = FixtureSourceFile(
+            path=FilePath(
+                searched_path="tests/fixtures",
+                relative_path="my_fixture.csv",
+                modification_time=0.0,
+                project_root="/usr/src/app",
+            ),
+            checksum=FileHash.from_contents("id,col1\n1,\n"),
+            project_name="snowplow",
+        )
+        fixture = UnitTestFileFixture(
+            name="my_fixture",
+            path="my_fixture.csv",
+            original_file_path="tests/fixtures/my_fixture.csv",
+            package_name="snowplow",
+            unique_id="fixture.snowplow.my_fixture",
+            resource_type=NodeType.Fixture,
+            rows=[{"id": "1", "col1": ""}],
+        )
+        self.manifest.files[fixture_file.file_id] = fixture_file
+        self.manifest.fixtures[fixture.unique_id] = fixture
+        block = self.yaml_block_for(UNIT_TEST_CSV_FIXTURE_SOURCE, "test_my_model.yml")
+
+        with mock.patch.object(
+            UnitTestParser,
+            "_convert_empty_values_to_null",
+            autospec=True,
+            side_effect=UnitTestParser._convert_empty_values_to_null,
+        ) as convert:
+            UnitTestParser(self.parser, block).parse()
+
+        self.assertEqual(convert.call_count, 1)
+        unit_tests = list(self.parser.manifest.unit_tests.values())
+        self.assertEqual(len(unit_tests), 2)
+        self.assertEqual(unit_tests[0].expect.rows, [{"id": "1", "col1": None}])
+        self.assertEqual(unit_tests[1].expect.rows, unit_tests[0].expect.rows)
+        self.assertIsNot(unit_tests[1].expect.rows[0], unit_tests[0].expect.rows[0])
+        self.assertEqual(len(fixture_file.unit_tests), 2)
@@ -0,0 +1,41 @@
+from unittest import mock
+
+from dbt.task.batch_query import BatchQuery
+from dbt_common.events.base_types import EventLevel
+from dbt_common.exceptions import DbtRuntimeError
+
+
+class TestBatchQuery:
+    def test_runs_query_once(self):
+        batch_query = BatchQuery("the tests of model.pkg.model_a")
+        get_nodes = mock.Mock(return_value=["test_1", "test_2"])
+        execute = mock.Mock(side_effect=lambda nodes: {node: f"{node} passed" for node in nodes})
+
+        assert batch_query.get_result("test_1", get_nodes, execute) == "test_1 passed"
+        assert batch_query.get_result("test_2", get_nodes, execute) == "test_2 passed"
+        # a test that isn't in the query runs on its own
+        assert batch_query.get_result("test_3", get_nodes, execute) is None
+        get_nodes.assert_called_once_with()
+        execute.assert_called_once_with(["test_1", "test_2"])
+
+    def test_single_node_runs_on_its_own(self):
+        batch_query = BatchQuery("the tests of model.pkg.model_a")
+        execute = mock.Mock()
+
+        assert batch_query.get_result("test_1", lambda: ["test_1"], execute) is None
+        execute.assert_not_called()
+
+    def test_failed_query_runs_each_test_on_its_own(self):
+        batch_query = BatchQuery("the tests of model.pkg.model_a")
+        execute = mock.Mock(side_effect=DbtRuntimeError("syntax error"))
+
+        with mock.patch("dbt.task.batch_query.fire_event") as fire_event:
+            assert batch_query.get_result("test_1", lambda: ["test_1", "test_2"], execute) is None
+            assert batch_query.get_result("test_2", lambda: ["test_1", "test_2"], execute) is None
+        execute.assert_called_once()
+        fire_event.assert_called_once()
+        assert fire_event.call_args.args[0].msg == (
+            "Running the tests of model.pkg.model_a one at a time, "
+            "the batch query failed: Runtime Error\n  syntax error"
+        )
+        assert fire_event.call_args.kwargs["level"] == EventLevel.DEBUG
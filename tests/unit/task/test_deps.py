@@ -0,0 +1,94 @@
+import os
+from argparse import Namespace
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from dbt.config import Project
+from dbt.constants import PACKAGE_LOCK_FILE_NAME
+from dbt.deps.local import LocalPinnedPackage
+from dbt.flags import set_from_args
+from dbt.task.deps import DepsTask
+from dbt_common.clients import system
+from tests.unit.utils import project_from_dict
+
+
+def write(path, contents: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fp:
+        fp.write(contents)
+
+
+class TestDepsTaskInstalled:
+    @pytest.fixture
+    def project(self, tmp_path) -> Project:
+        set_from_args(Namespace(WARN_ERROR=False), None)
+        package_root = str(tmp_path / "local_package")
+        write(os.path.join(package_root, "dbt_project.yml"), "name: local_package\n")
+        project_root = str(tmp_path / "project")
+        write(os.path.join(project_root, "dbt_project.yml"), "name: test\n")
+        return project_from_dict(
+            {"name": "test", "profile": "test", "project-root": project_root},
+            {},
+            packages={"packages": [{"local": package_root}]},
+        )
+
+    def run_deps(self, project: Project) -> SimpleNamespace:
+        args = Namespace(
+            project_dir=project.project_root,
+            add_package=None,
+            upgrade=False,
+            lock=False,
+            vars={},
+        )
+        cwd = os.getcwd()
+        try:
+            with mock.patch(
+                "dbt.task.deps.system.rmtree", wraps=system.rmtree
+            ) as rmtree, mock.patch.object(
+                LocalPinnedPackage,
+                "install",
+                autospec=True,
+                side_effect=LocalPinnedPackage.install,
+            ) as install, mock.patch.object(
+                DepsTask, "track_package_install"
+            ):
+                DepsTask(args, project).run()
+        finally:
+            os.chdir(cwd)
+        return SimpleNamespace(rmtree=rmtree, install=install)
+
+    def test_unchanged_lock_file_is_a_no_op(self, project):
+        calls = self.run_deps(project)
+        assert calls.install.call_count == 1
+        assert os.path.isdir(
+            os.path.join(project.project_root, project.packages_install_path, "local_package")
+        )
+
+        calls = self.run_deps(project)
+        calls.rmtree.assert_not_called()
+        calls.install.assert_not_called()
+
+    def test_changed_lock_file_reinstalls(self, project):
+        self.run_deps(project)
+        lock_file_path = os.path.join(project.project_root, PACKAGE_LOCK_FILE_NAME)
+        with open(lock_file_path, "a") as fp:
+            fp.write("# edited\n")
+
+        calls = self.run_deps(project)
+        assert mock.call(project.packages_install_path) in calls.rmtree.call_args_list
+        assert calls.install.call_count == 1
+
+    def test_missing_package_directory_reinstalls(self, project):
+        self.run_deps(project)
+        os.remove(
+            os.path.join(project.project_root, project.packages_install_path, "local_package")
+        )
+
+        calls = self.run_deps(project)
+        assert mock.call(project.packages_install_path) in calls.rmtree.call_args_list
+        assert calls.install.call_count == 1
+        assert os.path.isdir(
+            os.path.join(project.project_root, project.packages_install_path, "local_package")
+        )
@@ -1,7 +1,15 @@
+import os
+import tempfile
 import unittest
 from decimal import Decimal
 from unittest import mock
 
+from dbt.artifacts.schemas.run import (
+    RunResultOutput,
+    RunResultsArtifact,
+    RunResultsMetadata,
+)
+from dbt.constants import RUN_RESULTS_FILE_NAME
 from dbt.task.docs import generate
 
 
@@ -329,3 +337,218 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+    def test__streaming_catalog_matches_catalog(self):
+        def column(table_name, column_name, index):
+            return {
+                "column_comment": None,
+                "column_index": Decimal(index),
+                "column_name": column_name,
+                "column_type": "integer",
+                "table_comment": None,
+                "table_name": table_name,
+                "table_schema": "test_schema",
+                "table_type": "BASE TABLE",
+                "table_database": "test_database",
+            }
+
+        columns = [
+            column("test_table", "id", 1),
+            column("unmapped_table", "id", 1),
+            column("source_table", "id", 1),
+            column("test_table", "name", 2),
+            column("unselected_table", "id", 1),
+            column("source_table", "name", 2),
+        ]
+        node_map = {
+            generate.CatalogKey("test_database", "test_schema", "test_table"): "model.test.a",
+            generate.CatalogKey("test_database", "test_schema", "source_table"): "model.test.b",
+            generate.CatalogKey(
+                "test_database", "test_schema", "unselected_table"
+            ): "model.test.c",
+        }
+        source_map = {
+            generate.CatalogKey("test_database", "test_schema", "source_table"): {
+                "source.test.s.t"
+            },
+        }
+        self.mock_get_unique_id_mapping.return_value = node_map, source_map
+        selected = {"model.test.a", "model.test.b", "source.test.s.t"}
+
+        expected_nodes, expected_sources = generate.Catalog(columns).make_unique_id_map(
+            self.manifest, selected
+        )
+        catalog = generate.StreamingCatalog(self.manifest, selected)
+        column_names = list(columns[0])
+        catalog.add_rows(column_names, [[col[name] for name in column_names] for col in columns])
+
+        self.assertEqual(catalog.num_rows, 6)
+        self.assertEqual(list(catalog.nodes), ["model.test.a", "model.test.b"])
+        self.assertEqual(catalog.nodes, expected_nodes)
+        self.assertEqual(catalog.sources, expected_sources)
+        self.assertEqual(list(catalog.sources["source.test.s.t"].columns), ["id", "name"])
+
+    def test__streaming_catalog_ambiguous_source(self):
+        self.mock_get_unique_id_mapping.return_value = {}, {
+            generate.CatalogKey("test_database", "test_schema", "test_table"): {"source.test.s.t"}
+        }
+        catalog = generate.StreamingCatalog(self.manifest)
+        row = {
+            "column_index": Decimal("1"),
+            "column_name": "id",
+            "column_type": "integer",
+            "table_name": "test_table",
+            "table_schema": "test_schema",
+            "table_type": "BASE TABLE",
+            "table_database": "test_database",
+        }
+        catalog.add_column(row)
+        with self.assertRaises(generate.AmbiguousCatalogMatchError):
+            catalog.add_column({**row, "table_name": "TEST_TABLE"})
+
+
+def make_catalog_table(unique_id):
+    return generate.CatalogTable(
+        metadata=generate.TableMetadata(
+            type="BASE TABLE", schema="test_schema", name=unique_id.split(".")[-1]
+        ),
+        columns={},
+        stats={},
+        unique_id=unique_id,
+    )
+
+
+class IncrementalCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.task = generate.GenerateTask.__new__(generate.GenerateTask)
+        self.task.previous_state = None
+        self.task.manifest = mock.MagicMock()
+        self.task.manifest.nodes = {
+            "model.test.a": mock.Mock(is_relational=True, is_ephemeral_model=False),
+            "model.test.b": mock.Mock(is_relational=True, is_ephemeral_model=False),
+            "model.test.c": mock.Mock(is_relational=True, is_ephemeral_model=False),
+            "model.test.ephemeral": mock.Mock(is_relational=True, is_ephemeral_model=True),
+            "test.test.not_null": mock.Mock(is_relational=False, is_ephemeral_model=False),
+        }
+        self.task.manifest.sources = {"source.test.s.t": mock.Mock()}
+        self.previous_catalog = generate.CatalogArtifact.from_results(
+            generated_at=generate.datetime(2024, 1, 1),
+            nodes={
+                unique_id: make_catalog_table(unique_id)
+                for unique_id in ["model.test.a", "model.test.b", "model.test.dropped"]
+            },
+            sources={"source.test.s.t": make_catalog_table("source.test.s.t")},
+            compile_results=None,
+            errors=None,
+        )
+
+    def test_candidate_ids(self):
+        self.assertEqual(
+            self.task.get_catalog_candidate_ids(None),
+            {"model.test.a", "model.test.b", "model.test.c", "source.test.s.t"},
+        )
+        self.assertEqual(
+            self.task.get_catalog_candidate_ids({"model.test.a", "model.test.ephemeral"}),
+            {"model.test.a"},
+        )
+
+    def test_refresh_new_and_materialized(self):
+        candidate_ids = self.task.get_catalog_candidate_ids(None)
+        refresh_node_ids = self.task.get_refresh_node_ids(
+            self.previous_catalog, candidate_ids, {"model.test.b", "seed.test.unselected"}
+        )
+        self.assertEqual(refresh_node_ids, {"model.test.b", "model.test.c"})
+
+    def test_refresh_state_modified(self):
+        self.task.previous_state = mock.Mock()
+        candidate_ids = self.task.get_catalog_candidate_ids(None)
+        with mock.patch.object(generate, "StateSelectorMethod") as state_method:
+            state_method.return_value.search.return_value = iter(
+                ["source.test.s.t", "model.test.ephemeral"]
+            )
+            refresh_node_ids = self.task.get_refresh_node_ids(
+                self.previous_catalog, candidate_ids, set()
+            )
+        state_method.return_value.search.assert_called_once_with(candidate_ids, "modified")
+        self.assertEqual(refresh_node_ids, {"model.test.c", "source.test.s.t"})
+
+    def test_merge_previous_catalog(self):
+        nodes, sources = generate.merge_previous_catalog(
+            self.previous_catalog,
+            {"model.test.a", "source.test.s.t"},
+            # model.test.b was refreshed, but its relation no longer exists
+            {"model.test.c": make_catalog_table("model.test.c")},
+            {},
+        )
+        self.assertEqual(list(nodes), ["model.test.a", "model.test.c"])
+        self.assertIs(nodes["model.test.a"], self.previous_catalog.nodes["model.test.a"])
+        self.assertEqual(sources, self.previous_catalog.sources)
+
+    def test_materialized_node_ids(self):
+        self.task.config = mock.Mock(project_target_path="target")
+        run_results = mock.Mock(
+            args={"which": "build"},
+            metadata=mock.Mock(generated_at=generate.datetime(2024, 1, 2)),
+            results=[
+                mock.Mock(unique_id="model.test.a", status=generate.NodeStatus.Success),
+                mock.Mock(unique_id="model.test.b", status=generate.NodeStatus.Error),
+                mock.Mock(unique_id="model.test.c", status=generate.NodeStatus.Skipped),
+            ],
+        )
+        with mock.patch.object(generate, "load_result_state", return_value=run_results):
+            self.assertEqual(
+                self.task._get_materialized_node_ids(self.previous_catalog), {"model.test.a"}
+            )
+            # the previous catalog already has the relations of an older run
+            run_results.metadata.generated_at = generate.datetime(2023, 12, 31)
+            self.assertEqual(self.task._get_materialized_node_ids(self.previous_catalog), set())
+            run_results.args = {"which": "test"}
+            self.assertEqual(self.task._get_materialized_node_ids(self.previous_catalog), set())
+        with mock.patch.object(generate, "load_result_state", return_value=None):
+            self.assertEqual(self.task._get_materialized_node_ids(self.previous_catalog), set())
+        with mock.patch.object(
+            generate, "load_result_state", side_effect=generate.DbtRuntimeError("bad")
+        ):
+            self.assertIsNone(self.task._get_materialized_node_ids(self.previous_catalog))
+
+    def write_run_results(self, target_path, which, generated_at):
+        run_results = RunResultsArtifact(
+            metadata=RunResultsMetadata(
+                dbt_schema_version=str(RunResultsArtifact.dbt_schema_version),
+                generated_at=generated_at,
+            ),
+            results=[
+                RunResultOutput(
+                    unique_id="model.test.a",
+                    status=generate.NodeStatus.Success,
+                    timing=[],
+                    thread_id="Thread-1",
+                    execution_time=0.0,
+                    adapter_response={},
+                    message=None,
+                    failures=None,
+                    compiled=True,
+                    compiled_code="select 1",
+                    relation_name='"test"."test_schema"."a"',
+                )
+            ],
+            elapsed_time=0.0,
+            args={"which": which},
+        )
+        run_results.write(os.path.join(target_path, RUN_RESULTS_FILE_NAME))
+
+    def test_materialized_node_ids_after_run_then_test(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            self.task.config = mock.Mock(project_target_path=target_path)
+            catalog_path = os.path.join(target_path, generate.CATALOG_FILENAME)
+            self.previous_catalog.write(catalog_path)
+            previous_catalog = generate.CatalogArtifact.read_and_check_versions(catalog_path)
+
+            self.write_run_results(target_path, "run", generate.datetime(2024, 1, 2))
+            self.assertEqual(
+                self.task._get_materialized_node_ids(previous_catalog), {"model.test.a"}
+            )
+            # "dbt test" overwrites the run results of "dbt run", which are then
+            # unknown, so the full catalog is generated
+            self.write_run_results(target_path, "test", generate.datetime(2024, 1, 3))
+            self.assertIsNone(self.task._get_materialized_node_ids(previous_catalog))
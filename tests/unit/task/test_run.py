@@ -1,5 +1,8 @@
+import threading
+import time
 from argparse import Namespace
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from importlib import import_module
 from typing import Optional, Type, Union
 from unittest import mock
@@ -14,19 +17,29 @@ from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.artifacts.resources.base import FileHash
 from dbt.artifacts.resources.types import NodeType, RunHookType
-from dbt.artifacts.resources.v1.components import DependsOn
+from dbt.artifacts.resources.v1.components import ColumnInfo, DependsOn
 from dbt.artifacts.resources.v1.config import NodeConfig
 from dbt.artifacts.resources.v1.model import ModelConfig
-from dbt.artifacts.schemas.results import RunStatus
-from dbt.artifacts.schemas.run import RunResult
+from dbt.artifacts.schemas.batch_results import BatchResults
+from dbt.artifacts.schemas.results import RunStatus, TimingInfo
+from dbt.artifacts.schemas.run import RunResult, process_run_result
 from dbt.config.runtime import RuntimeConfig
+from dbt.context.providers import RuntimeRefResolver
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import HookNode, ModelNode
 from dbt.events.types import LogModelResult
 from dbt.exceptions import DbtRuntimeError
 from dbt.flags import get_flags, set_from_args
-from dbt.task.run import MicrobatchModelRunner, ModelRunner, RunTask, _get_adapter_info
+from dbt.task.run import (
+    MicrobatchBatchResults,
+    MicrobatchModelRunner,
+    ModelRunner,
+    RunTask,
+    _batch_node,
+    _get_adapter_info,
+)
 from dbt.tests.util import safe_set_invocation_context
+from dbt_common.contracts.constraints import ColumnLevelConstraint, ConstraintType
 from dbt_common.events.base_types import EventLevel
 from dbt_common.events.event_manager_client import add_callback_to_manager
 from tests.utils import EventCatcher
@@ -194,6 +207,38 @@ class TestMicrobatchModelRunner:
             incremental_batch=False,
         )
 
+    def test_model_result_has_queued_timing(
+        self, model_runner: MicrobatchModelRunner, table_model: ModelNode
+    ) -> None:
+        result = RunResult.from_node(table_model, RunStatus.Success, None)
+        batch_results = []
+        for batch_idx, (queued_at, waited) in enumerate([(10, 2), (11, 5), (12, 0)]):
+            batch_result = RunResult.from_node(table_model, RunStatus.Success, None)
+            batch_result.batch_results = BatchResults(
+                successful=[(datetime(2025, 1, batch_idx + 1), datetime(2025, 1, batch_idx + 2))]
+            )
+            started_at = datetime(2025, 1, 1, 0, 0, queued_at)
+            batch_result.timing = [
+                TimingInfo("queued", started_at, started_at + timedelta(seconds=waited)),
+                TimingInfo("execute", started_at, started_at),
+            ]
+            batch_results.append(batch_result)
+
+        model_runner.merge_batch_results(result, batch_results)
+        # it starts when the first batch was queued, and lasts for the total wait
+        assert model_runner.queued_timing == TimingInfo(
+            "queued", datetime(2025, 1, 1, 0, 0, 10), datetime(2025, 1, 1, 0, 0, 17)
+        )
+
+        result.timing = [TimingInfo("compile"), TimingInfo("execute")]
+        with patch.object(ModelRunner, "run_with_hooks", return_value=result):
+            result = model_runner.run_with_hooks(manifest=None)
+        assert process_run_result(result).to_dict()["timing"][-1] == {
+            "name": "queued",
+            "started_at": "2025-01-01T00:00:10Z",
+            "completed_at": "2025-01-01T00:00:17Z",
+        }
+
     @pytest.mark.parametrize(
         "has_relation,relation_type,materialized,full_refresh_config,full_refresh_flag,expectation",
         [
@@ -385,3 +430,97 @@ class TestRunTask:
             assert not isinstance(expected_result, RunStatus)
             assert issubclass(expected_result, BaseException)
             assert type(e) == expected_result
+
+
+class TestMicrobatchBatchResults:
+    def test_wait_for_wakes_on_append(self) -> None:
+        batch_results = MicrobatchBatchResults()
+        result = MagicMock()
+        assert not batch_results.wait_for(1, timeout=0)
+
+        timer = threading.Timer(0.01, batch_results.append, args=(result,))
+        started = time.perf_counter()
+        timer.start()
+        # returns as soon as the result arrives, long before the timeout
+        assert batch_results.wait_for(1, timeout=30)
+        assert time.perf_counter() - started < 10
+        timer.join()
+
+        assert len(batch_results) == 1
+        assert batch_results[0] is result
+        assert batch_results.snapshot() == [result]
+
+    def test_batch_node_shares_immutable_fields(self, table_model: ModelNode) -> None:
+        table_model.columns = {
+            "id": ColumnInfo(name="id"),
+            "fk": ColumnInfo(
+                name="fk",
+                constraints=[
+                    ColumnLevelConstraint(type=ConstraintType.foreign_key, to="ref('other')")
+                ],
+            ),
+        }
+        batch_node = _batch_node(table_model)
+
+        assert batch_node.raw_code is table_model.raw_code
+        assert batch_node.depends_on is table_model.depends_on
+        assert batch_node.columns["id"] is table_model.columns["id"]
+
+        batch_node.config["__dbt_internal_microbatch_event_time_start"] = "2025-01-01"
+        batch_node.config.pre_hook = []
+        batch_node.columns["fk"].constraints[0].to = '"db"."schema"."other"'
+        batch_node.update_event_status(node_status="executing")
+        assert "__dbt_internal_microbatch_event_time_start" not in table_model.config._extra
+        assert table_model.columns["fk"].constraints[0].to == "ref('other')"
+        assert table_model._event_status == {}
+        assert batch_node.to_dict()["raw_code"] == table_model.to_dict()["raw_code"]
+
+    def test_batch_node_refs_ephemeral_model(
+        self,
+        runtime_config: RuntimeConfig,
+        manifest: Manifest,
+        table_model: ModelNode,
+        ephemeral_model: ModelNode,
+    ) -> None:
+        table_model.config.materialized = "incremental"
+        table_model.config.incremental_strategy = "microbatch"
+        extra_ctes = list(table_model.extra_ctes)
+
+        batch_nodes = [_batch_node(table_model) for _ in range(2)]
+        for batch_node in batch_nodes:
+            resolver = RuntimeRefResolver(MagicMock(), batch_node, runtime_config, manifest)
+            resolver.create_relation(ephemeral_model)
+
+        assert table_model.extra_ctes == extra_ctes
+        for batch_node in batch_nodes:
+            assert [cte.id for cte in batch_node.extra_ctes] == [ephemeral_model.unique_id]
+
+    def test_batch_runner_records_queued_timing(self, batch_runner) -> None:
+        batch_runner.mark_queued()
+        with patch.object(
+            ModelRunner, "run_with_hooks", return_value=MagicMock(timing=[TimingInfo("execute")])
+        ):
+            result = batch_runner.run_with_hooks(manifest=None)
+
+        assert [timing.name for timing in result.timing] == ["queued", "execute"]
+        assert result.timing[0].started_at <= result.timing[0].completed_at
+
+    @pytest.fixture
+    def batch_runner(
+        self,
+        postgres_adapter: PostgresAdapter,
+        table_model: ModelNode,
+        runtime_config: RuntimeConfig,
+    ):
+        batch_runner_cls = import_module("dbt.task.run").MicrobatchBatchRunner
+        return batch_runner_cls(
+            config=runtime_config,
+            adapter=postgres_adapter,
+            node=table_model,
+            node_index=1,
+            num_nodes=1,
+            batch_idx=0,
+            batches=[],
+            relation_exists=False,
+            incremental_batch=False,
+        )
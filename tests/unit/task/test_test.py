@@ -1,7 +1,35 @@
+from argparse import Namespace
+from unittest import mock
+
 import agate
 import pytest
 
-from dbt.task.test import list_rows_from_table
+from dbt.artifacts.resources import (
+    UnitTestFormat,
+    UnitTestInputFixture,
+    UnitTestOverrides,
+)
+from dbt.compilation import Compiler
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import UnitTestNode
+from dbt.flags import set_from_args
+from dbt.node_types import NodeType
+from dbt.task import data_test_batches, unit_test_batches
+from dbt.task.test import (
+    TestResultData,
+    TestRunner,
+    list_rows_from_table,
+    split_data_test_batch_rows,
+    split_unit_test_batch_table,
+)
+from dbt_common.exceptions import DbtRuntimeError
+from tests.unit.utils.manifest import (
+    make_generic_test,
+    make_model,
+    make_not_null_test,
+    make_unique_test,
+    make_unit_test,
+)
 
 
 class TestListRowsFromTable:
@@ -69,3 +97,310 @@ class TestListRowsFromTable:
 
         list_rows = list_rows_from_table(table, sort=True)
         assert list_rows == expected_list_rows
+
+
+def test_split_unit_test_batch_table():
+    table = agate.Table(
+        rows=[
+            [1, "actual", 0],
+            [1, "expected", 0],
+            [2, "actual", 1],
+            [3, "expected", 1],
+        ],
+        column_names=["id", "actual_or_expected", "dbt_internal_unit_test_case"],
+    )
+    tables = split_unit_test_batch_table(table, "dbt_internal_unit_test_case", [0, 1, 2])
+    assert list_rows_from_table(tables[0]) == [
+        ["id", "actual_or_expected"],
+        [1, "actual"],
+        [1, "expected"],
+    ]
+    assert list_rows_from_table(tables[1]) == [
+        ["id", "actual_or_expected"],
+        [2, "actual"],
+        [3, "expected"],
+    ]
+    assert list_rows_from_table(tables[2]) == [["id", "actual_or_expected"]]
+
+
+class TestUnitTestBatches:
+    @pytest.fixture(autouse=True)
+    def clear_batches(self):
+        yield
+        unit_test_batches.init(None, set())
+
+    @pytest.fixture
+    def manifest(self):
+        models = [make_model("pkg", name, "select 1") for name in ["model_a", "model_b"]]
+        unit_tests = []
+        for model, test_name in [
+            (models[0], "test_1"),
+            (models[0], "test_2"),
+            (models[0], "test_3"),
+            (models[1], "test_1"),
+        ]:
+            unit_test = make_unit_test("pkg", test_name, model)
+            unit_test.depends_on.nodes = [model.unique_id]
+            unit_tests.append(unit_test)
+        unit_tests[2].overrides = UnitTestOverrides(vars={"x": 1})
+        return Manifest(
+            nodes={model.unique_id: model for model in models},
+            unit_tests={unit_test.unique_id: unit_test for unit_test in unit_tests},
+        )
+
+    @pytest.fixture
+    def loader(self):
+        def parse_unit_test_case(test_case):
+            if test_case.name == "test_2":
+                raise DbtRuntimeError("bad fixture")
+            loader.unit_test_manifest.nodes[test_case.unique_id] = mock.Mock(
+                spec=UnitTestNode, unique_id=test_case.unique_id, resource_type=NodeType.Unit
+            )
+
+        loader = mock.Mock(unit_test_manifest=Manifest())
+        loader.parse_unit_test_case.side_effect = parse_unit_test_case
+        with mock.patch.object(
+            unit_test_batches, "UnitTestManifestLoader", return_value=loader
+        ) as loader_cls:
+            yield loader_cls
+
+    def init(self, manifest, batching):
+        set_from_args(Namespace(unit_test_batching=batching), {})
+        unit_test_batches.init(manifest, set(manifest.unit_tests))
+
+    def test_disabled_by_default(self, manifest):
+        self.init(manifest, "none")
+        assert all(unit_test_batches.get(unique_id) is None for unique_id in manifest.unit_tests)
+
+    def test_batches_by_model(self, manifest, loader):
+        self.init(manifest, "model")
+        batch = unit_test_batches.get("unit.pkg.model_a__test_1")
+        assert batch is not None
+        assert batch.unit_test_ids == [
+            "unit.pkg.model_a__test_1",
+            "unit.pkg.model_a__test_2",
+            "unit.pkg.model_a__test_3",
+        ]
+        assert unit_test_batches.get("unit.pkg.model_b__test_1") is not batch
+
+        compiler = mock.Mock()
+        compiler.compile_node.side_effect = lambda node, manifest, extra_context: node
+        node, unit_test_manifest = batch.get_node(
+            manifest, mock.Mock(), compiler, "unit.pkg.model_a__test_1"
+        )
+        assert node.unique_id == "unit.pkg.model_a__test_1"
+        # an error in one case only fails that case
+        with pytest.raises(DbtRuntimeError, match="bad fixture"):
+            batch.get_node(manifest, mock.Mock(), compiler, "unit.pkg.model_a__test_2")
+        _, same_manifest = batch.get_node(
+            manifest, mock.Mock(), compiler, "unit.pkg.model_a__test_3"
+        )
+        assert same_manifest is unit_test_manifest
+        assert loader.call_count == 1
+        assert compiler.compile_node.call_count == 2
+        # not batching queries
+        assert batch.get_table("unit.pkg.model_a__test_1", mock.Mock()) is None
+
+    def test_cases_with_different_inputs(self, runtime_config, postgres_adapter):
+        model_a = make_model("test_project", "model_a", "select 1 as id")
+        model_b = make_model("test_project", "model_b", "select 2 as id")
+        model = make_model(
+            "test_project",
+            "model_c",
+            "select * from {{ ref('model_a') }}"
+            "{% if is_incremental() %} union all select * from {{ ref('model_b') }}{% endif %}",
+            refs=[model_a, model_b],
+        )
+        unit_tests = []
+        for test_name, is_incremental in [("test_full", False), ("test_incremental", True)]:
+            unit_test = make_unit_test("test_project", test_name, model)
+            unit_test.depends_on.nodes = [model.unique_id]
+            unit_test.given = [
+                UnitTestInputFixture(input="ref('model_a')", rows="select 1 as id", format="sql")
+            ]
+            unit_test.overrides = UnitTestOverrides(macros={"is_incremental": is_incremental})
+            unit_tests.append(unit_test)
+        # only the second case gives model_b, after the first has been compiled
+        unit_tests[1].given.append(
+            UnitTestInputFixture(input="ref('model_b')", rows="select 2 as id", format="sql")
+        )
+        manifest = Manifest(
+            nodes={node.unique_id: node for node in [model_a, model_b, model]},
+            unit_tests={unit_test.unique_id: unit_test for unit_test in unit_tests},
+            macros=postgres_adapter._macro_resolver.macros,
+        )
+        self.init(manifest, "model")
+        batch = unit_test_batches.get(unit_tests[0].unique_id)
+        compiler = Compiler(runtime_config)
+
+        full, _ = batch.get_node(manifest, runtime_config, compiler, unit_tests[0].unique_id)
+        incremental, _ = batch.get_node(
+            manifest, runtime_config, compiler, unit_tests[1].unique_id
+        )
+        assert "__dbt__cte__model_b" not in full.compiled_code
+        assert "select * from __dbt__cte__model_b" in incremental.compiled_code
+        assert "select 2 as id" in incremental.compiled_code
+
+    def test_batch_query(self, manifest, loader):
+        self.init(manifest, "query")
+        manifest.unit_tests["unit.pkg.model_a__test_3"].overrides = None
+        batch = unit_test_batches.get("unit.pkg.model_a__test_1")
+        compiler = mock.Mock()
+        compiler.compile_node.side_effect = lambda node, manifest, extra_context: node
+        node, unit_test_manifest = batch.get_node(
+            manifest, mock.Mock(), compiler, "unit.pkg.model_a__test_1"
+        )
+
+        execute = mock.Mock(
+            side_effect=lambda nodes, manifest: {node.unique_id: ({}, node) for node in nodes}
+        )
+        assert batch.get_table("unit.pkg.model_a__test_1", execute) == ({}, node)
+        assert batch.get_table("unit.pkg.model_a__test_3", execute) is not None
+        # the case that failed to compile is not in the query
+        assert batch.get_table("unit.pkg.model_a__test_2", execute) is None
+        assert execute.call_count == 1
+        assert execute.call_args.args[1] is unit_test_manifest
+
+    def test_can_batch_query(self, manifest):
+        unit_test = manifest.unit_tests["unit.pkg.model_a__test_1"]
+        assert unit_test_batches.can_batch_query(unit_test)
+        # overriding vars or macros may change the columns of the model
+        assert not unit_test_batches.can_batch_query(
+            manifest.unit_tests["unit.pkg.model_a__test_3"]
+        )
+        unit_test.given[0].format = UnitTestFormat.SQL
+        assert not unit_test_batches.can_batch_query(unit_test)
+
+
+def test_split_data_test_batch_rows():
+    table = agate.Table(
+        rows=[[0, False, False, 1], [3, True, True, 0]],
+        column_names=["failures", "should_warn", "should_error", "dbt_internal_data_test_case"],
+    )
+    column_names, rows = split_data_test_batch_rows(table, "dbt_internal_data_test_case")
+    assert column_names == ["failures", "should_warn", "should_error"]
+    assert rows == {0: [[3, True, True]], 1: [[0, False, False]]}
+
+
+class TestDataTestBatches:
+    @pytest.fixture(autouse=True)
+    def clear_batches(self):
+        yield
+        data_test_batches.init(None, set())
+
+    @pytest.fixture
+    def manifest(self):
+        models = [make_model("pkg", name, "select 1") for name in ["model_a", "model_b"]]
+        model_a, model_b = models
+        data_tests = [
+            make_not_null_test("pkg", model_a, "id"),
+            make_unique_test("pkg", model_a, "id"),
+            make_generic_test("pkg", "accepted_values", model_a, {}, column_name="status"),
+            make_not_null_test("pkg", model_a, "status"),
+            make_generic_test("pkg", "relationships", model_a, {}, column_name="b_id"),
+            make_not_null_test("pkg", model_b, "id"),
+        ]
+        for data_test, model in zip(data_tests, [model_a] * 5 + [model_b]):
+            data_test.attached_node = model.unique_id
+            data_test.depends_on.nodes = [model.unique_id]
+        data_tests[2].config.store_failures = True
+        data_tests[3].config._extra["snowflake_warehouse"] = "big"
+        data_tests[4].depends_on.nodes.append(model_b.unique_id)
+        return Manifest(nodes={node.unique_id: node for node in models + data_tests})
+
+    def init(self, manifest, batching):
+        set_from_args(Namespace(data_test_batching=batching), {})
+        data_test_batches.init(manifest, {n for n in manifest.nodes if n.startswith("test.")})
+
+    def test_disabled_by_default(self, manifest):
+        self.init(manifest, False)
+        assert all(data_test_batches.get(unique_id) is None for unique_id in manifest.nodes)
+
+    def test_batches_by_model(self, manifest):
+        self.init(manifest, True)
+        batch = data_test_batches.get("test.pkg.not_null_model_a_id")
+        assert batch is not None
+        assert batch.attached_node == "model.pkg.model_a"
+        # storing failures, a different warehouse, depending on another model,
+        # and being the only test of a model each keep a test out of the batch
+        assert batch.data_test_ids == [
+            "test.pkg.not_null_model_a_id",
+            "test.pkg.unique_model_a_id",
+        ]
+        assert data_test_batches.get("test.pkg.accepted_values_model_a_status") is None
+        assert data_test_batches.get("test.pkg.not_null_model_a_status") is None
+        assert data_test_batches.get("test.pkg.relationships_model_a_b_id") is None
+        assert data_test_batches.get("test.pkg.not_null_model_b_id") is None
+
+    def test_batch_result(self, manifest):
+        self.init(manifest, True)
+        batch = data_test_batches.get("test.pkg.not_null_model_a_id")
+        not_null = manifest.nodes["test.pkg.not_null_model_a_id"]
+        compiler = mock.Mock()
+        compiler.compile_node.side_effect = lambda node, manifest, extra_context, write: node
+        result = TestResultData(
+            failures=0, should_warn=False, should_error=False, adapter_response={}
+        )
+        execute = mock.Mock(
+            side_effect=lambda nodes, manifest: {node.unique_id: result for node in nodes}
+        )
+
+        assert batch.get_result(not_null, manifest, compiler, execute) is result
+        unique = manifest.nodes["test.pkg.unique_model_a_id"]
+        assert batch.get_result(unique, manifest, compiler, execute) is result
+        assert execute.call_count == 1
+        nodes = execute.call_args.args[0]
+        assert nodes[0] is not_null
+        # the other tests are compiled as copies
+        assert nodes[1] is not unique and nodes[1].unique_id == unique.unique_id
+
+        # a test that fails to compile is left out of the query, to fail on its own
+        self.init(manifest, True)
+        batch = data_test_batches.get("test.pkg.not_null_model_a_id")
+        compiler.compile_node.side_effect = DbtRuntimeError("bad sql")
+        assert batch.get_result(not_null, manifest, compiler, execute) is None
+        assert execute.call_count == 1
+
+    def test_execute_data_test_batch(self, manifest):
+        data_tests = [
+            manifest.nodes["test.pkg.not_null_model_a_id"],
+            manifest.nodes["test.pkg.unique_model_a_id"],
+        ]
+        for data_test in data_tests:
+            data_test.compiled_code = f"select * from {data_test.name}"
+        data_tests[1].config.error_if = "> 10"
+        adapter = mock.Mock()
+        adapter.quote.side_effect = lambda name: f'"{name}"'
+        adapter.execute.return_value = (
+            mock.Mock(**{"to_dict.return_value": {"rows_affected": 2}}),
+            agate.Table(
+                rows=[[5, True, False, 1], [0, False, False, 0]],
+                column_names=[
+                    "failures",
+                    "should_warn",
+                    "should_error",
+                    "dbt_internal_data_test_case",
+                ],
+            ),
+        )
+        context = {
+            "config": {},
+            "get_limit_subquery_sql": lambda sql, limit: sql,
+            "get_test_sql": lambda sql, fail_calc, warn_if, error_if, limit: (
+                f"select {fail_calc} as failures from ({sql}) where {error_if}"
+            ),
+        }
+        runner = TestRunner(mock.Mock(), adapter, data_tests[0], 1, 2)
+        with mock.patch("dbt.task.test.generate_runtime_model_context", return_value=context):
+            results = runner.execute_data_test_batch(data_tests, manifest)
+
+        sql = adapter.execute.call_args.args[0]
+        assert sql.count("union all") == 1
+        assert "from not_null_model_a_id) where != 0" in sql
+        assert "from unique_model_a_id) where > 10" in sql
+        assert '1 as "dbt_internal_data_test_case"' in sql
+        adapter.post_model_hook.assert_called_once()
+        assert results["test.pkg.not_null_model_a_id"].failures == 0
+        assert results["test.pkg.unique_model_a_id"] == TestResultData(
+            failures=5, should_warn=True, should_error=False, adapter_response={"rows_affected": 2}
+        )
@@ -1,14 +1,19 @@
+import io
+import json
 import os
 import tempfile
 from queue import Empty
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
 
-from dbt.compilation import Graph, Linker
+from dbt.compilation import Graph, Linker, read_graph_cache, write_graph_cache
+from dbt.exceptions import GraphDependencyNotFoundError
 from dbt.graph.cli import parse_difference
 from dbt.graph.queue import GraphQueue
 from dbt.graph.selector import NodeSelector
+from dbt.node_types import NodeType
 
 
 def _mock_manifest(nodes):
@@ -31,6 +36,21 @@ def _mock_manifest(nodes):
     return manifest
 
 
+def _linkable_manifest(depends_on, sources=()):
+    return SimpleNamespace(
+        nodes={
+            n: SimpleNamespace(unique_id=n, depends_on_nodes=deps)
+            for n, deps in depends_on.items()
+        },
+        sources={s: SimpleNamespace(unique_id=s) for s in sources},
+        semantic_models={},
+        exposures={},
+        metrics={},
+        unit_tests={},
+        saved_queries={},
+    )
+
+
 class TestLinker:
     @pytest.fixture
     def linker(self) -> Linker:
@@ -193,3 +213,88 @@ class TestLinker:
             linker.dependency(l, r)
 
         assert linker.find_cycles() is None
+
+    def test_link_graph_from_unchanged_edge_list(self, linker: Linker) -> None:
+        manifest = _linkable_manifest(
+            {"A": ["S"], "B": ["A"], "C": ["A", "B"], "test.A": ["A"]}, sources=["S"]
+        )
+        linker.link_graph(manifest)
+        linker.graph.add_edge("test.A", "B", edge_type="parent_test")
+        edge_list = linker.to_edge_list(with_test_edges=True)
+
+        cached = Linker()
+        assert cached.link_graph_from_edge_list(manifest, edge_list) is False
+        cached.add_test_edges_from_edge_list(edge_list)
+        assert list(cached.graph.nodes) == list(linker.graph.nodes)
+        assert set(cached.graph.edges(data="edge_type")) == set(
+            linker.graph.edges(data="edge_type")
+        )
+
+    def test_link_graph_from_edge_list_relinks_changes(self, linker: Linker) -> None:
+        linker.link_graph(
+            _linkable_manifest({"A": ["S"], "B": ["A"], "C": ["B"], "D": ["C"]}, sources=["S"])
+        )
+        edge_list = linker.to_edge_list(with_test_edges=False)
+        assert edge_list["test_edges"] is None
+
+        manifest = _linkable_manifest(
+            {"A": ["S", "T"], "B": ["A"], "C": ["A"], "E": ["C"]}, sources=["S", "T"]
+        )
+        cached = Linker()
+        assert cached.link_graph_from_edge_list(manifest, edge_list) is True
+        expected = Linker()
+        expected.link_graph(manifest)
+        assert set(cached.graph.nodes) == set(expected.graph.nodes)
+        assert set(cached.graph.edges) == set(expected.graph.edges)
+
+    def test_link_graph_from_edge_list_errors(self, linker: Linker) -> None:
+        linker.link_graph(_linkable_manifest({"A": [], "B": ["A"], "C": ["B"]}))
+        edge_list = linker.to_edge_list(with_test_edges=False)
+
+        with pytest.raises(RuntimeError, match="Found a cycle"):
+            Linker().link_graph_from_edge_list(
+                _linkable_manifest({"A": ["C"], "B": ["A"], "C": ["B"]}), edge_list
+            )
+        # C still depends on the deleted B
+        with pytest.raises(GraphDependencyNotFoundError):
+            Linker().link_graph_from_edge_list(
+                _linkable_manifest({"A": [], "C": ["B"]}), edge_list
+            )
+
+    def test_graph_cache(self, tmp_path) -> None:
+        path = str(tmp_path / "target" / "graph_cache.msgpack")
+        assert read_graph_cache(path) is None
+
+        edge_list = {"nodes": ["A", "B"], "edges": [0, 1], "test_edges": None}
+        write_graph_cache(path, edge_list)
+        assert read_graph_cache(path) == {**edge_list, "dbt_version": mock.ANY}
+
+        with mock.patch("dbt.compilation.__version__", "0.0.0"):
+            assert read_graph_cache(path) is None
+        with open(path, "wb") as fp:
+            fp.write(b"not msgpack")
+        assert read_graph_cache(path) is None
+
+    def test_write_graph_summary(self, linker: Linker) -> None:
+        for l, r in [("model.B", "source.A"), ("model.C", "model.B"), ("test.B", "model.B")]:
+            linker.dependency(l, r)
+        linker.graph.add_edge("test.B", "model.C", edge_type="parent_test")
+        manifest = mock.MagicMock()
+        manifest.expect.side_effect = lambda n: SimpleNamespace(resource_type=NodeType(n[:-2]))
+
+        out_stream = io.StringIO()
+        with mock.patch("dbt.compilation.get_invocation_id", return_value="abc"):
+            linker.write_graph_summary(out_stream, manifest, with_test_edges=True)
+        summary = json.loads(out_stream.getvalue())
+
+        assert summary["_invocation_id"] == "abc"
+        assert summary["linked"] == {
+            "0": {"name": "model.B", "type": "model", "succ": [2, 3]},
+            "1": {"name": "source.A", "type": "source", "succ": [0]},
+            "2": {"name": "model.C", "type": "model"},
+            "3": {"name": "test.B", "type": "test"},
+        }
+        assert summary["with_test_edges"]["3"] == {"name": "test.B", "type": "test", "succ": [2]}
+        assert summary["with_test_edges"] == {
+            str(i): node for i, node in linker.get_graph_summary(manifest).items()
+        }
@@ -0,0 +1,69 @@
+import json
+import threading
+
+import dbt.tracing
+from dbt.tracing import phase, start_phase, tracing
+
+
+class TestTracing:
+    def test_disabled(self, tmp_path):
+        with tracing(None):
+            assert dbt.tracing._tracer is None
+            with phase("parse"):
+                pass
+            start_phase("compile").end(node="model.test.a")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_phases_are_written(self, tmp_path):
+        trace_file = tmp_path / "trace.json"
+        with tracing(str(trace_file)):
+            with phase("load manifest", partial=True):
+                traced = start_phase("read files")
+                traced.end(path_count=3)
+
+            thread = threading.Thread(
+                target=lambda: start_phase("execute", node="model.test.a").end(),
+                name="Thread-1 (worker)",
+            )
+            thread.start()
+            thread.join()
+        assert dbt.tracing._tracer is None
+
+        trace = json.loads(trace_file.read_text())
+        phases = {event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"}
+        assert list(phases) == ["read files", "load manifest", "execute", "invocation"]
+
+        read_files = phases["read files"]
+        assert read_files["args"]["path_count"] == 3
+        assert read_files["args"]["cpu_ms"] >= 0
+        assert read_files["args"]["process_cpu_ms"] >= 0
+        assert phases["load manifest"]["args"]["partial"] is True
+        # nested phases lie within their parent
+        load_manifest = phases["load manifest"]
+        assert load_manifest["ts"] <= read_files["ts"]
+        assert read_files["ts"] + read_files["dur"] <= load_manifest["ts"] + load_manifest["dur"]
+
+        execute = phases["execute"]
+        assert execute["args"]["node"] == "model.test.a"
+        assert execute["tid"] != read_files["tid"]
+        thread_names = {
+            event["tid"]: event["args"]["name"]
+            for event in trace["traceEvents"]
+            if event["ph"] == "M"
+        }
+        assert thread_names[execute["tid"]] == "Thread-1 (worker)"
+
+    def test_written_on_error(self, tmp_path):
+        trace_file = tmp_path / "trace.json"
+        try:
+            with tracing(str(trace_file)):
+                with phase("parse"):
+                    raise RuntimeError("parsing failed")
+        except RuntimeError:
+            pass
+
+        trace = json.loads(trace_file.read_text())
+        assert [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"] == [
+            "parse",
+            "invocation",
+        ]